@@ -21,7 +21,13 @@ from datetime import datetime, timedelta, timezone
 
 from loguru import logger
 
+try:
+    import uvloop  # 可选加速依赖：更快的事件循环（定时器/Socket 调度）
+except ImportError:  # pragma: no cover - 未安装或 Windows 下使用标准 asyncio
+    uvloop = None
+
 from platforms.manager import PlatformManager
+from utils.browser import BrowserManager
 from utils.config import AppConfig
 
 # 北京时间时区 (UTC+8)
@@ -156,11 +162,13 @@ async def run_checkin(args: argparse.Namespace) -> int:
     # 运行签到
     logger.info(f"开始签到 - {get_beijing_time().strftime('%Y-%m-%d %H:%M:%S')}")
 
-    if args.platform:
-        logger.info(f"仅运行平台: {args.platform}")
-        await manager.run_platform(args.platform)
-    else:
-        await manager.run_all()
+    # 各适配器复用共享浏览器，全部签到结束后统一关闭
+    async with BrowserManager.shared_session():
+        if args.platform:
+            logger.info(f"仅运行平台: {args.platform}")
+            await manager.run_platform(args.platform)
+        else:
+            await manager.run_all()
 
     newapi_export_path: str | None = None
     failed_sites_export_path: str | None = None
@@ -203,7 +211,8 @@ def main() -> None:
     setup_logging(debug=args.debug)
 
     try:
-        exit_code = asyncio.run(run_checkin(args))
+        run = uvloop.run if uvloop is not None else asyncio.run
+        exit_code = run(run_checkin(args))
         sys.exit(exit_code)
     except KeyboardInterrupt:
         logger.warning("用户中断")
@@ -11,10 +11,13 @@ from platforms.elysiver import ElysiverAdapter
 from platforms.kfcapi import KFCAPIAdapter
 from platforms.linuxdo import LinuxDOAdapter
 from platforms.neb import NEBAdapter
-from platforms.runanytime import RunAnytimeAdapter
-from platforms.wong import WongAdapter
+from platforms.newapi_base import NewAPIAdapter
 from platforms.manager import PlatformManager
 
+# 仅需站点配置的 NewAPI 站点，由 NEWAPI_SITES 生成适配器类
+RunAnytimeAdapter = NewAPIAdapter.site_class("runanytime")
+WongAdapter = NewAPIAdapter.site_class("wong")
+
 __all__ = [
     "BasePlatformAdapter",
     "CheckinResult",
@@ -25,6 +28,7 @@ __all__ = [
     "KFCAPIAdapter",
     "LinuxDOAdapter",
     "NEBAdapter",
+    "NewAPIAdapter",
     "RunAnytimeAdapter",
     "WongAdapter",
     "PlatformManager",
@@ -635,34 +635,36 @@ class LinuxDOAdapter(BasePlatformAdapter):
         return True
 
     async def _login_drissionpage(self) -> bool:
-        """使用 DrissionPage 登录"""
-        import time
+        """使用 DrissionPage 登录
+
+        DrissionPage 是同步 API，页面操作放到工作线程执行，避免阻塞事件循环。
+        """
         page = self._browser_manager.page
 
         logger.info(f"[{self.account_name}] 访问 LinuxDO 登录页面...")
-        page.get(f"{self.BASE_URL}/login")
-        time.sleep(2)
+        await asyncio.to_thread(page.get, f"{self.BASE_URL}/login")
+        await asyncio.sleep(2)
 
         await self._browser_manager.wait_for_cloudflare(timeout=30)
 
         # 填写登录表单
-        username_input = page.ele('#login-account-name', timeout=10)
+        username_input = await asyncio.to_thread(page.ele, '#login-account-name', timeout=10)
         if username_input:
-            username_input.input(self.username)
-            time.sleep(0.5)
+            await asyncio.to_thread(username_input.input, self.username)
+            await asyncio.sleep(0.5)
 
-        password_input = page.ele('#login-account-password', timeout=5)
+        password_input = await asyncio.to_thread(page.ele, '#login-account-password', timeout=5)
         if password_input:
-            password_input.input(self.password)
-            time.sleep(0.5)
+            await asyncio.to_thread(password_input.input, self.password)
+            await asyncio.sleep(0.5)
 
-        login_btn = page.ele('#login-button', timeout=5)
+        login_btn = await asyncio.to_thread(page.ele, '#login-button', timeout=5)
         if login_btn:
-            login_btn.click()
-            time.sleep(5)
+            await asyncio.to_thread(login_btn.click)
+            await asyncio.sleep(5)
 
         # 获取 cookies
-        for cookie in page.cookies():
+        for cookie in await asyncio.to_thread(page.cookies):
             self._cookies[cookie['name']] = cookie['value']
 
         self._init_http_client()
@@ -13,6 +13,7 @@
 import asyncio
 import json
 import os
+import re
 import ssl
 import tempfile
 import time
@@ -28,6 +29,9 @@ from utils.config import DEFAULT_PROVIDERS, AnyRouterAccount, AppConfig, Provide
 from utils.cookie_cache import CookieCache
 from utils.notify import NotificationManager
 
+# 签到接口返回"今日已签到/已经签到过了"等消息时视为成功
+_ALREADY_CHECKED_IN_RE = re.compile(r"已经?签到")
+
 
 def _create_ssl_context() -> ssl.SSLContext:
     """创建兼容旧服务器的 SSL 上下文"""
@@ -822,7 +826,8 @@ class PlatformManager:
                         });
                     }
                 })()
-                """
+                """,
+                await_promise=True,
             )
             payload_text = self._unwrap_eval_value(raw_payload)
             if not isinstance(payload_text, str):
@@ -2023,6 +2028,7 @@ class PlatformManager:
                     api_user,
                     extra_cookies=runtime_cookies,
                 )
+                checker._remember_api_user(success, api_user or details.get("resolved_api_user"))
 
                 details["login_method"] = "shared_oauth"
                 details["_cached_session"] = session_cookie
@@ -2071,7 +2077,7 @@ class PlatformManager:
         results: list[CheckinResult], stats: dict[str, int | str] | None = None,
     ) -> None:
         """回退模式：共享会话失败时，逐站独立启动浏览器"""
-        from platforms.newapi_browser import browser_checkin_newapi
+        from platforms.newapi_browser import browser_checkin_newapi, get_browser_concurrency
 
         debug_mode = self._is_debug_mode()
         site_timeout = self._env_int(
@@ -2083,8 +2089,12 @@ class PlatformManager:
         backoff_base = self._env_float("OAUTH_NETWORK_RETRY_BACKOFF", 2.0, min_value=0.5)
         attempt_total = retry_count + 1
         logger.warning(f"回退模式：逐站独立浏览器，{len(need_oauth)} 个站点")
+        # 名额只在浏览器运行期间占用（重试退避时已释放），单站超时从拿到名额后开始计时
+        browser_slots = asyncio.BoundedSemaphore(get_browser_concurrency())
+        # 所有站点共用同一 LinuxDO 账号：密码登录只做一次，其余站点复用缓存的 LinuxDO Cookie
+        linuxdo_login_lock = asyncio.Lock()
 
-        for idx, item in enumerate(need_oauth):
+        async def oauth_one(idx: int, item: dict) -> CheckinResult:
             provider_name = item["provider_name"]
             account_name = item["account_name"]
 
@@ -2093,15 +2103,15 @@ class PlatformManager:
             final_result: CheckinResult | None = None
             for attempt in range(attempt_total):
                 try:
-                    result = await asyncio.wait_for(
-                        browser_checkin_newapi(
-                            provider_name=provider_name,
-                            linuxdo_username=linuxdo_username,
-                            linuxdo_password=linuxdo_password,
-                            cookies=None, api_user=None,
-                            account_name=account_name,
-                        ),
-                        timeout=site_timeout,
+                    result = await browser_checkin_newapi(
+                        provider_name=provider_name,
+                        linuxdo_username=linuxdo_username,
+                        linuxdo_password=linuxdo_password,
+                        cookies=None, api_user=None,
+                        account_name=account_name,
+                        browser_slots=browser_slots,
+                        browser_timeout=site_timeout,
+                        linuxdo_login_lock=linuxdo_login_lock,
                     )
 
                     if (
@@ -2182,6 +2192,13 @@ class PlatformManager:
                     status=CheckinStatus.FAILED,
                     message="OAuth 未知失败",
                 )
+            return final_result
+
+        # 各站点独立浏览器并发执行，同时运行的浏览器数不超过 NEWAPI_BROWSER_CONCURRENCY
+        site_results = await asyncio.gather(
+            *(oauth_one(idx, item) for idx, item in enumerate(need_oauth))
+        )
+        for final_result in site_results:
             results.append(final_result)
             if stats is not None:
                 if final_result.status == CheckinStatus.SUCCESS:
@@ -2374,17 +2391,20 @@ class PlatformManager:
 
     async def _browser_fallback_checkin(self, failed_accounts: list[dict]) -> list[CheckinResult]:
         """使用浏览器 OAuth 登录进行回退签到"""
-        from platforms.newapi_browser import browser_checkin_newapi
+        from platforms.newapi_browser import browser_checkin_newapi, get_browser_concurrency
 
-        results = []
         # 使用第一个 LinuxDO 账户进行登录
         linuxdo_account = self._linuxdo_accounts[0]
         linuxdo_username = linuxdo_account["username"]
         linuxdo_password = linuxdo_account["password"]
 
         logger.info(f"使用 LinuxDO 账户 [{linuxdo_account.get('name', linuxdo_username)}] 进行浏览器回退登录")
+        # 信号量按本次运行创建（绑定当前事件循环），限制同时运行的浏览器数量
+        browser_slots = asyncio.BoundedSemaphore(get_browser_concurrency())
+        # 各账户共用同一 LinuxDO 账号：密码登录只做一次，其余账户复用缓存的 LinuxDO Cookie
+        linuxdo_login_lock = asyncio.Lock()
 
-        for item in failed_accounts:
+        async def fallback_one(item: dict) -> CheckinResult:
             account = item["account"]
             provider = item["provider"]
             account_name = item["account_name"]
@@ -2400,6 +2420,8 @@ class PlatformManager:
                     cookies=account.cookies if hasattr(account, 'cookies') else None,
                     api_user=account.api_user if hasattr(account, 'api_user') else None,
                     account_name=account_name,
+                    browser_slots=browser_slots,
+                    linuxdo_login_lock=linuxdo_login_lock,
                 )
 
                 if result.status == CheckinStatus.SUCCESS:
@@ -2442,7 +2464,7 @@ class PlatformManager:
                 else:
                     logger.error(f"[{account_name}] 浏览器回退签到失败: {result.message}")
 
-                results.append(result)
+                return result
 
             except Exception as e:
                 logger.error(f"[{account_name}] 浏览器回退签到异常: {e}")
@@ -2450,16 +2472,16 @@ class PlatformManager:
                 original_result = item.get("original_result")
                 if original_result:
                     original_result.message = f"{original_result.message} (浏览器回退也失败: {e})"
-                    results.append(original_result)
-                else:
-                    results.append(CheckinResult(
-                        platform=f"NewAPI ({provider.name})",
-                        account=account_name,
-                        status=CheckinStatus.FAILED,
-                        message=f"浏览器 OAuth 登录失败: {e}",
-                    ))
+                    return original_result
+                return CheckinResult(
+                    platform=f"NewAPI ({provider.name})",
+                    account=account_name,
+                    status=CheckinStatus.FAILED,
+                    message=f"浏览器 OAuth 登录失败: {e}",
+                )
 
-        return results
+        # 各账户并发回退，同时运行的浏览器数由 browser_slots 限制
+        return list(await asyncio.gather(*(fallback_one(item) for item in failed_accounts)))
 
     async def _checkin_newapi(self, account, provider, account_name: str) -> CheckinResult:
         """执行单个 NewAPI 站点签到"""
@@ -2509,28 +2531,30 @@ class PlatformManager:
         if provider.needs_waf_cookies():
             return await self._checkin_newapi_browser(provider, account_name, headers, cookies, details)
 
-        async with httpx.AsyncClient(timeout=30.0, verify=ssl_ctx) as client:
-            # 1. 获取用户信息
-            user_info_url = f"{provider.domain}{provider.user_info_path}"
-            try:
-                resp = await client.get(user_info_url, headers=headers, cookies=cookies)
-                if resp.status_code == 200:
-                    data = resp.json()
-                    if data.get("success"):
-                        user_data = data.get("data", {})
-                        quota = round(user_data.get("quota", 0) / 500000, 2)
-                        used_quota = round(user_data.get("used_quota", 0) / 500000, 2)
-                        details["balance"] = f"${quota}"
-                        details["used"] = f"${used_quota}"
-                        logger.info(f"[{account_name}] 余额: ${quota}, 已用: ${used_quota}")
-            except Exception as e:
-                logger.warning(f"[{account_name}] 获取用户信息失败: {e}")
+        # 请求头和 Cookie 在客户端上设置一次，由 httpx 合并到每个请求
+        async with httpx.AsyncClient(timeout=30.0, verify=ssl_ctx, headers=headers, cookies=cookies) as client:
+            async def fetch_user_info() -> None:
+                """获取用户信息，余额写入 details（仅用于展示）"""
+                user_info_url = f"{provider.domain}{provider.user_info_path}"
+                try:
+                    resp = await client.get(user_info_url)
+                    if resp.status_code == 200:
+                        data = resp.json()
+                        if data.get("success"):
+                            user_data = data.get("data", {})
+                            quota = round(user_data.get("quota", 0) / 500000, 2)
+                            used_quota = round(user_data.get("used_quota", 0) / 500000, 2)
+                            details["balance"] = f"${quota}"
+                            details["used"] = f"${used_quota}"
+                            logger.info(f"[{account_name}] 余额: ${quota}, 已用: ${used_quota}")
+                except Exception as e:
+                    logger.warning(f"[{account_name}] 获取用户信息失败: {e}")
 
-            # 2. 执行签到（如果需要）
-            if provider.needs_manual_check_in():
+            async def post_checkin() -> tuple[CheckinStatus, str]:
+                """发送签到请求，返回 (状态, 消息)"""
                 checkin_url = f"{provider.domain}{provider.sign_in_path}"
                 try:
-                    resp = await client.post(checkin_url, headers=headers, cookies=cookies)
+                    resp = await client.post(checkin_url)
                     logger.debug(f"[{account_name}] 签到响应: {resp.status_code}")
 
                     if resp.status_code == 200:
@@ -2541,6 +2565,156 @@ class PlatformManager:
                             # 检查各种成功标志
                             if result.get("success") or result.get("ret") == 1 or result.get("code") == 0:
                                 msg = msg or "签到成功"
+                                logger.success(f"[{account_name}] {msg}")
+                                return CheckinStatus.SUCCESS, msg
+                            # "今日已签到" 也视为成功（只是今天已经签过了）
+                            elif _ALREADY_CHECKED_IN_RE.search(msg):
+                                logger.success(f"[{account_name}] {msg}")
+                                return CheckinStatus.SUCCESS, msg
+                            else:
+                                error_msg = msg or "签到失败"
+                                logger.warning(f"[{account_name}] {error_msg}")
+                                return CheckinStatus.FAILED, error_msg
+                        except Exception:
+                            # 非 JSON 响应
+                            if "success" in resp.text.lower():
+                                logger.success(f"[{account_name}] 签到成功")
+                                return CheckinStatus.SUCCESS, "签到成功"
+
+                    logger.error(f"[{account_name}] 签到失败: HTTP {resp.status_code}")
+                    return CheckinStatus.FAILED, f"HTTP {resp.status_code}"
+
+                except Exception as e:
+                    logger.error(f"[{account_name}] 签到请求异常: {e}")
+                    return CheckinStatus.FAILED, f"请求异常: {str(e)}"
+
+            if provider.needs_manual_check_in():
+                # 余额查询只用于展示，与签到请求互不依赖，并发发出
+                _, (status, message) = await asyncio.gather(fetch_user_info(), post_checkin())
+            else:
+                # 不需要手动签到（访问用户信息即自动签到）
+                await fetch_user_info()
+                logger.success(f"[{account_name}] 签到成功（自动触发）")
+                status, message = CheckinStatus.SUCCESS, "签到成功（自动触发）"
+
+            return CheckinResult(
+                platform=f"NewAPI ({provider.name})",
+                account=account_name,
+                status=status,
+                message=message,
+                details=details if details else None,
+            )
+
+    async def _checkin_newapi_browser(
+        self, provider, account_name: str, headers: dict, cookies: dict, details: dict,
+    ) -> CheckinResult:
+        """使用 Patchright 浏览器执行签到（绕过 CDN TLS 指纹检测）"""
+        from utils.browser import BrowserManager
+
+        # 复用本次运行共享的 Patchright 浏览器进程，每个账号只新建一个隔离的上下文
+        manager = await BrowserManager.get_shared("patchright", headless=True)
+        context = await manager.browser.new_context()
+        try:
+            # 注入 session cookie 和 WAF cookies
+            browser_cookies = []
+            domain = provider.domain.replace("https://", "").replace("http://", "")
+            for name, value in cookies.items():
+                browser_cookies.append({
+                    "name": name, "value": value,
+                    "domain": domain, "path": "/",
+                })
+            await context.add_cookies(browser_cookies)
+
+            page = await context.new_page()
+            # 先访问站点让 WAF cookies 生效
+            await page.goto(f"{provider.domain}/login", wait_until="networkidle")
+
+            # 构建 fetch headers（排除浏览器自动管理的头）
+            fetch_headers = {
+                "Accept": "application/json, text/plain, */*",
+                provider.api_user_key: headers.get(provider.api_user_key, ""),
+            }
+
+            # ---- 辅助：浏览器内 GET 用户信息 ----
+            async def _fetch_user_info_in_browser():
+                """在浏览器内获取用户信息，返回 (quota, used_quota) 或 None"""
+                try:
+                    r = await page.evaluate(f"""
+                        async () => {{
+                            const r = await fetch('{provider.user_info_path}', {{
+                                headers: {json.dumps(fetch_headers)}
+                            }});
+                            return {{ status: r.status, text: await r.text() }};
+                        }}
+                    """)
+                    if r["status"] == 200:
+                        d = json.loads(r["text"])
+                        if d.get("success"):
+                            ud = d.get("data", {})
+                            return (
+                                round(ud.get("quota", 0) / 500000, 2),
+                                round(ud.get("used_quota", 0) / 500000, 2),
+                            )
+                    else:
+                        logger.warning(f"[{account_name}] 获取用户信息失败: HTTP {r['status']}")
+                except Exception as e:
+                    logger.warning(f"[{account_name}] 获取用户信息失败: {e}")
+                return None
+
+            # 1. 获取签到前余额
+            pre_info = await _fetch_user_info_in_browser()
+            pre_quota: float | None = None
+            if pre_info:
+                pre_quota, used_quota = pre_info
+                details["balance"] = f"${pre_quota}"
+                details["used"] = f"${used_quota}"
+                logger.info(f"[{account_name}] 签到前余额: ${pre_quota}, 已用: ${used_quota}")
+
+            # 2. 执行签到（如果需要）
+            if provider.needs_manual_check_in():
+                sign_in_path = provider.sign_in_path
+                # 签到 POST 请求需要额外的 Content-Type 和 X-Requested-With 头
+                checkin_fetch_headers = {**fetch_headers, "Content-Type": "application/json", "X-Requested-With": "XMLHttpRequest"}
+                try:
+                    resp = await page.evaluate(f"""
+                        async () => {{
+                            const r = await fetch('{sign_in_path}', {{
+                                method: 'POST',
+                                headers: {json.dumps(checkin_fetch_headers)}
+                            }});
+                            return {{ status: r.status, text: await r.text() }};
+                        }}
+                    """)
+                    logger.debug(f"[{account_name}] 签到响应: status={resp['status']}, body={resp['text'][:200]}")
+
+                    if resp["status"] == 200:
+                        try:
+                            result = json.loads(resp["text"])
+                            msg = result.get("message") or result.get("msg") or ""
+                            if result.get("success") or result.get("ret") == 1 or result.get("code") == 0:
+                                msg = msg or "签到成功"
+
+                                # 3. 签到后验证：二次查询余额确认签到真实性
+                                post_info = await _fetch_user_info_in_browser()
+                                if post_info and pre_quota is not None:
+                                    post_quota, post_used = post_info
+                                    delta = round(post_quota - pre_quota, 2)
+                                    details["balance"] = f"${post_quota}"
+                                    details["used"] = f"${post_used}"
+                                    if delta > 0:
+                                        details["checkin_reward"] = f"+${delta}"
+                                        logger.success(f"[{account_name}] ✅ 签到验证通过: 余额 ${pre_quota} → ${post_quota} (奖励 +${delta})")
+                                    elif delta == 0:
+                                        logger.warning(f"[{account_name}] ⚠️ 签到API返回成功但余额未变: ${pre_quota} → ${post_quota}")
+                                        details["checkin_verify"] = "余额未变(可能已签到过)"
+                                    else:
+                                        logger.warning(f"[{account_name}] ⚠️ 签到后余额反而减少: ${pre_quota} → ${post_quota}")
+                                elif post_info:
+                                    post_quota, post_used = post_info
+                                    details["balance"] = f"${post_quota}"
+                                    details["used"] = f"${post_used}"
+                                    logger.info(f"[{account_name}] 签到后余额: ${post_quota}")
+
                                 logger.success(f"[{account_name}] {msg}")
                                 return CheckinResult(
                                     platform=f"NewAPI ({provider.name})",
@@ -2549,8 +2723,7 @@ class PlatformManager:
                                     message=msg,
                                     details=details if details else None,
                                 )
-                            # "今日已签到" 也视为成功（只是今天已经签过了）
-                            elif "已签到" in msg or "已经签到" in msg:
+                            elif _ALREADY_CHECKED_IN_RE.search(msg):
                                 logger.success(f"[{account_name}] {msg}")
                                 return CheckinResult(
                                     platform=f"NewAPI ({provider.name})",
@@ -2569,10 +2742,8 @@ class PlatformManager:
                                     message=error_msg,
                                     details=details if details else None,
                                 )
-                        except Exception:
-                            # 非 JSON 响应
-                            if "success" in resp.text.lower():
-                                logger.success(f"[{account_name}] 签到成功")
+                        except json.JSONDecodeError:
+                            if "success" in resp["text"].lower():
                                 return CheckinResult(
                                     platform=f"NewAPI ({provider.name})",
                                     account=account_name,
@@ -2581,15 +2752,14 @@ class PlatformManager:
                                     details=details if details else None,
                                 )
 
-                    logger.error(f"[{account_name}] 签到失败: HTTP {resp.status_code}")
+                    logger.error(f"[{account_name}] 签到失败: HTTP {resp['status']}, body={resp['text'][:200]}")
                     return CheckinResult(
                         platform=f"NewAPI ({provider.name})",
                         account=account_name,
                         status=CheckinStatus.FAILED,
-                        message=f"HTTP {resp.status_code}",
+                        message=f"HTTP {resp['status']}",
                         details=details if details else None,
                     )
-
                 except Exception as e:
                     logger.error(f"[{account_name}] 签到请求异常: {e}")
                     return CheckinResult(
@@ -2600,205 +2770,26 @@ class PlatformManager:
                         details=details if details else None,
                     )
             else:
-                # 不需要手动签到（访问用户信息即自动签到）
-                logger.success(f"[{account_name}] 签到成功（自动触发）")
-                return CheckinResult(
-                    platform=f"NewAPI ({provider.name})",
-                    account=account_name,
-                    status=CheckinStatus.SUCCESS,
-                    message="签到成功（自动触发）",
-                    details=details if details else None,
-                )
-
-    async def _checkin_newapi_browser(
-        self, provider, account_name: str, headers: dict, cookies: dict, details: dict,
-    ) -> CheckinResult:
-        """使用 Patchright 浏览器执行签到（绕过 CDN TLS 指纹检测）"""
-        try:
-            from patchright.async_api import async_playwright
-        except ImportError:
-            from playwright.async_api import async_playwright
-
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            try:
-                context = await browser.new_context()
-
-                # 注入 session cookie 和 WAF cookies
-                browser_cookies = []
-                domain = provider.domain.replace("https://", "").replace("http://", "")
-                for name, value in cookies.items():
-                    browser_cookies.append({
-                        "name": name, "value": value,
-                        "domain": domain, "path": "/",
-                    })
-                await context.add_cookies(browser_cookies)
-
-                page = await context.new_page()
-                # 先访问站点让 WAF cookies 生效
-                await page.goto(f"{provider.domain}/login", wait_until="networkidle")
-
-                # 构建 fetch headers（排除浏览器自动管理的头）
-                fetch_headers = {
-                    "Accept": "application/json, text/plain, */*",
-                    provider.api_user_key: headers.get(provider.api_user_key, ""),
-                }
-
-                # ---- 辅助：浏览器内 GET 用户信息 ----
-                async def _fetch_user_info_in_browser():
-                    """在浏览器内获取用户信息，返回 (quota, used_quota) 或 None"""
-                    try:
-                        r = await page.evaluate(f"""
-                            async () => {{
-                                const r = await fetch('{provider.user_info_path}', {{
-                                    headers: {json.dumps(fetch_headers)}
-                                }});
-                                return {{ status: r.status, text: await r.text() }};
-                            }}
-                        """)
-                        if r["status"] == 200:
-                            d = json.loads(r["text"])
-                            if d.get("success"):
-                                ud = d.get("data", {})
-                                return (
-                                    round(ud.get("quota", 0) / 500000, 2),
-                                    round(ud.get("used_quota", 0) / 500000, 2),
-                                )
-                        else:
-                            logger.warning(f"[{account_name}] 获取用户信息失败: HTTP {r['status']}")
-                    except Exception as e:
-                        logger.warning(f"[{account_name}] 获取用户信息失败: {e}")
-                    return None
-
-                # 1. 获取签到前余额
-                pre_info = await _fetch_user_info_in_browser()
-                pre_quota: float | None = None
-                if pre_info:
-                    pre_quota, used_quota = pre_info
-                    details["balance"] = f"${pre_quota}"
-                    details["used"] = f"${used_quota}"
-                    logger.info(f"[{account_name}] 签到前余额: ${pre_quota}, 已用: ${used_quota}")
-
-                # 2. 执行签到（如果需要）
-                if provider.needs_manual_check_in():
-                    sign_in_path = provider.sign_in_path
-                    # 签到 POST 请求需要额外的 Content-Type 和 X-Requested-With 头
-                    checkin_fetch_headers = {**fetch_headers, "Content-Type": "application/json", "X-Requested-With": "XMLHttpRequest"}
-                    try:
-                        resp = await page.evaluate(f"""
-                            async () => {{
-                                const r = await fetch('{sign_in_path}', {{
-                                    method: 'POST',
-                                    headers: {json.dumps(checkin_fetch_headers)}
-                                }});
-                                return {{ status: r.status, text: await r.text() }};
-                            }}
-                        """)
-                        logger.debug(f"[{account_name}] 签到响应: status={resp['status']}, body={resp['text'][:200]}")
-
-                        if resp["status"] == 200:
-                            try:
-                                result = json.loads(resp["text"])
-                                msg = result.get("message") or result.get("msg") or ""
-                                if result.get("success") or result.get("ret") == 1 or result.get("code") == 0:
-                                    msg = msg or "签到成功"
-
-                                    # 3. 签到后验证：二次查询余额确认签到真实性
-                                    post_info = await _fetch_user_info_in_browser()
-                                    if post_info and pre_quota is not None:
-                                        post_quota, post_used = post_info
-                                        delta = round(post_quota - pre_quota, 2)
-                                        details["balance"] = f"${post_quota}"
-                                        details["used"] = f"${post_used}"
-                                        if delta > 0:
-                                            details["checkin_reward"] = f"+${delta}"
-                                            logger.success(f"[{account_name}] ✅ 签到验证通过: 余额 ${pre_quota} → ${post_quota} (奖励 +${delta})")
-                                        elif delta == 0:
-                                            logger.warning(f"[{account_name}] ⚠️ 签到API返回成功但余额未变: ${pre_quota} → ${post_quota}")
-                                            details["checkin_verify"] = "余额未变(可能已签到过)"
-                                        else:
-                                            logger.warning(f"[{account_name}] ⚠️ 签到后余额反而减少: ${pre_quota} → ${post_quota}")
-                                    elif post_info:
-                                        post_quota, post_used = post_info
-                                        details["balance"] = f"${post_quota}"
-                                        details["used"] = f"${post_used}"
-                                        logger.info(f"[{account_name}] 签到后余额: ${post_quota}")
-
-                                    logger.success(f"[{account_name}] {msg}")
-                                    return CheckinResult(
-                                        platform=f"NewAPI ({provider.name})",
-                                        account=account_name,
-                                        status=CheckinStatus.SUCCESS,
-                                        message=msg,
-                                        details=details if details else None,
-                                    )
-                                elif "已签到" in msg or "已经签到" in msg:
-                                    logger.success(f"[{account_name}] {msg}")
-                                    return CheckinResult(
-                                        platform=f"NewAPI ({provider.name})",
-                                        account=account_name,
-                                        status=CheckinStatus.SUCCESS,
-                                        message=msg,
-                                        details=details if details else None,
-                                    )
-                                else:
-                                    error_msg = msg or "签到失败"
-                                    logger.warning(f"[{account_name}] {error_msg}")
-                                    return CheckinResult(
-                                        platform=f"NewAPI ({provider.name})",
-                                        account=account_name,
-                                        status=CheckinStatus.FAILED,
-                                        message=error_msg,
-                                        details=details if details else None,
-                                    )
-                            except json.JSONDecodeError:
-                                if "success" in resp["text"].lower():
-                                    return CheckinResult(
-                                        platform=f"NewAPI ({provider.name})",
-                                        account=account_name,
-                                        status=CheckinStatus.SUCCESS,
-                                        message="签到成功",
-                                        details=details if details else None,
-                                    )
-
-                        logger.error(f"[{account_name}] 签到失败: HTTP {resp['status']}, body={resp['text'][:200]}")
-                        return CheckinResult(
-                            platform=f"NewAPI ({provider.name})",
-                            account=account_name,
-                            status=CheckinStatus.FAILED,
-                            message=f"HTTP {resp['status']}",
-                            details=details if details else None,
-                        )
-                    except Exception as e:
-                        logger.error(f"[{account_name}] 签到请求异常: {e}")
-                        return CheckinResult(
-                            platform=f"NewAPI ({provider.name})",
-                            account=account_name,
-                            status=CheckinStatus.FAILED,
-                            message=f"请求异常: {str(e)}",
-                            details=details if details else None,
-                        )
+                # 自动签到 — 用户信息获取成功即视为签到完成
+                if details:
+                    logger.success(f"[{account_name}] 签到成功（自动触发）")
+                    return CheckinResult(
+                        platform=f"NewAPI ({provider.name})",
+                        account=account_name,
+                        status=CheckinStatus.SUCCESS,
+                        message="签到成功（自动触发）",
+                        details=details,
+                    )
                 else:
-                    # 自动签到 — 用户信息获取成功即视为签到完成
-                    if details:
-                        logger.success(f"[{account_name}] 签到成功（自动触发）")
-                        return CheckinResult(
-                            platform=f"NewAPI ({provider.name})",
-                            account=account_name,
-                            status=CheckinStatus.SUCCESS,
-                            message="签到成功（自动触发）",
-                            details=details,
-                        )
-                    else:
-                        logger.warning(f"[{account_name}] 无法确认签到状态（用户信息获取失败）")
-                        return CheckinResult(
-                            platform=f"NewAPI ({provider.name})",
-                            account=account_name,
-                            status=CheckinStatus.FAILED,
-                            message="无法确认签到状态",
-                        )
-            finally:
-                await browser.close()
+                    logger.warning(f"[{account_name}] 无法确认签到状态（用户信息获取失败）")
+                    return CheckinResult(
+                        platform=f"NewAPI ({provider.name})",
+                        account=account_name,
+                        status=CheckinStatus.FAILED,
+                        message="无法确认签到状态",
+                    )
+        finally:
+            await context.close()
 
     def _extract_session_cookie(self, cookies) -> str:
         """从 cookies 中提取 session 值"""
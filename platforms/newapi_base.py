@@ -8,8 +8,8 @@ NewAPI 通用签到适配器基类
 - KFC API (kfc-api.sxxe.net)
 
 支持两种登录方式：
-1. 优先使用 LinuxDO OAuth 自动登录（使用反检测浏览器）
-2. 失败时回退到用户提供的 Cookie
+1. 优先使用用户提供的 Cookie（无需启动浏览器）
+2. 未提供或已失效时使用 LinuxDO OAuth 自动登录（使用反检测浏览器）
 
 浏览器引擎：
 - nodriver: 不基于 WebDriver/Selenium，直接使用 CDP，最难被检测（推荐）
@@ -18,15 +18,65 @@ NewAPI 通用签到适配器基类
 """
 
 import asyncio
-import contextlib
+import os
+import re
 import time
 
 import httpx
 from loguru import logger
 
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - orjson 为可选加速依赖
+    import json as _json
+
 from platforms.base import BasePlatformAdapter, CheckinResult, CheckinStatus
-from utils.browser import BrowserManager, CookieRetriever, TabManager, URLMonitor, get_browser_engine
+from utils.browser import (
+    BrowserManager,
+    CookieRetriever,
+    TabManager,
+    URLMonitor,
+    first_found,
+    get_browser_engine,
+    wait_for_document_ready,
+    wait_until,
+)
+from utils.config import NEWAPI_SITES
+from utils.cookie_cache import CookieCache
 from utils.oauth_helpers import OAuthURLType, classify_oauth_url, retry_async_operation
+from utils.page_driver import DrissionPageDriver, PageDriver, PlaywrightPageDriver
+
+# API 请求使用的 User-Agent
+_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36"
+)
+
+# 从 Cookie 字符串中提取 session 值
+_SESSION_COOKIE_RE = re.compile(r"(?:^|;)\s*session\s*=([^;]*)")
+
+# new-api 前端的 LinuxDO 按钮只是拼接授权 URL：client_id 来自 /api/status，
+# state 来自 /api/oauth/state（同时写入站点 session）。在站点页面内直接请求这两个接口，
+# 站点未开启 LinuxDO OAuth 或接口不可用时返回 null
+_LINUXDO_AUTHORIZE_URL_JS = """
+(async () => {
+    try {
+        const [status, state] = await Promise.all([
+            fetch('/api/status', {credentials: 'include'}).then(r => r.json()),
+            fetch('/api/oauth/state', {credentials: 'include'}).then(r => r.json()),
+        ]);
+        const data = (status && status.data) || {};
+        if (!data.linuxdo_oauth || !data.linuxdo_client_id || !state || !state.success || !state.data) {
+            return null;
+        }
+        return 'https://connect.linux.do/oauth2/authorize?response_type=code'
+            + '&client_id=' + encodeURIComponent(data.linuxdo_client_id)
+            + '&state=' + encodeURIComponent(state.data);
+    } catch (e) {
+        return null;
+    }
+})()
+"""
 
 
 class NewAPIAdapter(BasePlatformAdapter):
@@ -52,8 +102,29 @@ class NewAPIAdapter(BasePlatformAdapter):
     # 货币单位（可重写）
     CURRENCY_UNIT: str = "$"
 
+    # 签到接口返回失败但表示"今天已签到"的消息模式（子类可按站点文案重写）
+    ALREADY_CHECKED_IN_PATTERN: re.Pattern = re.compile(r"已|already|今天", re.IGNORECASE)
+
+    # site_class() 生成的站点适配器类缓存
+    _site_classes: dict[str, type["NewAPIAdapter"]] = {}
+
+    # 登录验证时获取的用户信息缓存有效期（秒），期间签到不再重复请求 /api/user/self
+    USER_INFO_CACHE_TTL: float = 30.0
+
+    # LinuxDO OAuth 登录的总耗时上限（秒），超时后视为登录失败
+    LOGIN_TIMEOUT_SEC: float = 60.0
+
+    # 等待 URL 跳转等条件时的轮询参数：首次间隔、增长倍数与间隔上限（秒）
+    POLL_INTERVAL: float = 0.1
+    POLL_BACKOFF: float = 1.5
+    POLL_MAX_INTERVAL: float = 1.0
+
     # LinuxDO URLs
     LINUXDO_LOGIN_URL = "https://linux.do/login"
+    LINUXDO_DOMAIN = "linux.do"
+
+    # 通过 new-api 接口直接拼出 LinuxDO 授权 URL，跳过登录页按钮（前端非标准的站点可关闭）
+    DIRECT_OAUTH: bool = True
 
     def __init__(
         self,
@@ -69,12 +140,22 @@ class NewAPIAdapter(BasePlatformAdapter):
         self.api_user = api_user
         self._account_name = account_name
 
-        # 浏览器管理器
+        # 浏览器管理器（进程级共享）和本次登录使用的标签页
         self._browser_manager: BrowserManager | None = None
-        self.client: httpx.Client | None = None
+        self._tab = None
+        self.client: httpx.AsyncClient | None = None
         self.session_cookie: str | None = None
         self._user_info: dict | None = None
         self._login_method: str = "unknown"
+        self._cached_user_json: dict | None = None
+        self._cached_user_ts: float = 0.0
+
+        # 请求头缓存（session/api_user 变化时重建）
+        self._headers: dict | None = None
+        self._headers_key: tuple | None = None
+
+        # fallback_cookies 解析结果缓存：(原始 Cookie, session 值)
+        self._parsed_session: tuple | None = None
 
     @property
     def platform_name(self) -> str:
@@ -105,43 +186,125 @@ class NewAPIAdapter(BasePlatformAdapter):
         return f"{self.BASE_URL}{self.USER_INFO_API_PATH}"
 
     async def _init_browser(self) -> None:
-        """初始化浏览器"""
+        """初始化浏览器
+
+        复用进程级共享浏览器，仅为本次登录新开一个隔离的标签页/上下文。
+        """
         engine = get_browser_engine()
         logger.info(f"[{self.account_name}] 使用浏览器引擎: {engine}")
 
         # 支持通过环境变量控制 headless 模式（用于调试）
-        import os
         headless = os.environ.get("BROWSER_HEADLESS", "true").lower() != "false"
-        self._browser_manager = BrowserManager(engine=engine, headless=headless)
-        await self._browser_manager.start()
+        self._browser_manager = await BrowserManager.get_shared(engine, headless=headless)
+        self._tab = await self._browser_manager.new_tab()
+
+    async def _release_browser(self) -> None:
+        """关闭本次登录的标签页（共享浏览器由调用方在运行结束时统一关闭）"""
+        if self._browser_manager:
+            await self._browser_manager.close_tab(self._tab)
+        self._tab = None
+        self._browser_manager = None
 
     @property
     def page(self):
         """获取当前页面"""
-        return self._browser_manager.page if self._browser_manager else None
+        return self._tab
+
+    @classmethod
+    def site_class(cls, site: str) -> type["NewAPIAdapter"]:
+        """按 NEWAPI_SITES 中的站点配置生成（并缓存）对应的适配器类
+
+        只需要站点名称、域名和货币单位的站点不必再单独写子类。
+        类名取站点配置的 class_name，未配置时按站点名生成（如 "wong" -> WongAdapter）。
+
+        Raises:
+            ValueError: 站点未在 NEWAPI_SITES 中登记
+        """
+        adapter_cls = cls._site_classes.get(site)
+        if adapter_cls is not None:
+            return adapter_cls
+
+        config = NEWAPI_SITES.get(site)
+        if config is None:
+            raise ValueError(f"未知的 NewAPI 站点: {site}")
+
+        adapter_cls = type(
+            config.get("class_name") or f"{site.title()}Adapter",
+            (cls,),
+            {
+                "__module__": cls.__module__,
+                "__doc__": f"{config['name']} 签到适配器（由 NEWAPI_SITES 生成）",
+                "PLATFORM_NAME": config["name"],
+                "BASE_URL": config["domain"],
+                "COOKIE_DOMAIN": config["cookie_domain"],
+                "CURRENCY_UNIT": config["currency"],
+            },
+        )
+        cls._site_classes[site] = adapter_cls
+        return adapter_cls
+
+    @classmethod
+    def for_site(cls, site: str, **kwargs) -> "NewAPIAdapter":
+        """创建指定站点的适配器实例，kwargs 原样传给构造函数"""
+        return cls.site_class(site)(**kwargs)
+
+    @classmethod
+    async def run_batch(
+        cls, adapters: list["NewAPIAdapter"], concurrency: int = 8
+    ) -> list[CheckinResult]:
+        """并发执行多个账号的签到流程（login -> checkin -> cleanup）
+
+        Args:
+            adapters: 待签到的适配器列表
+            concurrency: 同时进行的签到数上限
+
+        Returns:
+            list[CheckinResult]: 与 adapters 顺序一致的签到结果
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_one(adapter: "NewAPIAdapter") -> CheckinResult:
+            async with semaphore:
+                return await adapter.run()
+
+        return await asyncio.gather(*(run_one(adapter) for adapter in adapters))
 
     async def login(self) -> bool:
-        """执行登录操作"""
-        # 尝试 LinuxDO OAuth 登录
+        """执行登录操作
+
+        Cookie 有效时无需启动浏览器，因此先尝试用户提供的 Cookie，
+        再尝试上次 OAuth 成功后缓存的 session，都失败后才走 LinuxDO OAuth。
+        """
+        # 优先使用 Cookie 登录
+        if self.fallback_cookies:
+            logger.info(f"[{self.account_name}] 尝试使用 Cookie 登录...")
+            if await self._login_via_cookie():
+                self._login_method = "Cookie"
+                logger.success(f"[{self.account_name}] Cookie 登录成功")
+                return True
+
+        # 其次使用缓存的 session（上次 OAuth 登录获得）
+        if self.linuxdo_username and await self._login_via_cached_cookie():
+            self._login_method = "缓存 Cookie"
+            logger.success(f"[{self.account_name}] 缓存 Cookie 登录成功")
+            return True
+
+        # 回退到 LinuxDO OAuth 登录
         if self.linuxdo_username and self.linuxdo_password:
             logger.info(f"[{self.account_name}] 尝试使用 LinuxDO OAuth 登录...")
             try:
-                if await self._login_via_linuxdo():
+                if await asyncio.wait_for(self._login_via_linuxdo(), timeout=self.LOGIN_TIMEOUT_SEC):
                     self._login_method = "LinuxDO OAuth"
                     logger.success(f"[{self.account_name}] LinuxDO OAuth 登录成功")
+                    self._save_cached_cookie()
                     return True
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"[{self.account_name}] LinuxDO OAuth 登录超过 {self.LOGIN_TIMEOUT_SEC:.0f} 秒，放弃浏览器登录"
+                )
+                await self._release_browser()
             except Exception as e:
-                logger.warning(f"[{self.account_name}] LinuxDO OAuth 登录失败: {e}")
-                import traceback
-                traceback.print_exc()
-
-        # 回退到 Cookie 登录
-        if self.fallback_cookies:
-            logger.info(f"[{self.account_name}] 回退到 Cookie 登录...")
-            if await self._login_via_cookie():
-                self._login_method = "Cookie"
-                logger.success(f"[{self.account_name}] Cookie 登录成功")
-                return True
+                logger.opt(exception=True).warning(f"[{self.account_name}] LinuxDO OAuth 登录失败: {e}")
 
         logger.error(f"[{self.account_name}] 所有登录方式均失败")
         return False
@@ -154,13 +317,10 @@ class NewAPIAdapter(BasePlatformAdapter):
         try:
             logger.info(f"[{self.account_name}] 访问 {self.PLATFORM_NAME} 登录页面...")
 
-            # 根据引擎选择登录方法
+            # nodriver 需要处理新标签页和 CDP 细节，使用专用流程；其余引擎共用通用流程
             if engine == "nodriver":
                 return await self._login_via_linuxdo_nodriver()
-            elif engine == "drissionpage":
-                return await self._login_via_linuxdo_drissionpage()
-            else:
-                return await self._login_via_linuxdo_playwright()
+            return await self._run_linuxdo_flow(self._make_driver(engine))
 
         except Exception as e:
             logger.error(f"[{self.account_name}] LinuxDO OAuth 登录异常: {e}")
@@ -191,9 +351,7 @@ class NewAPIAdapter(BasePlatformAdapter):
 
         except Exception as e:
             # 记录异常信息（Requirements 7.5）
-            logger.error(f"[{self.account_name}] OAuth 流程发生异常: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.opt(exception=True).error(f"[{self.account_name}] OAuth 流程发生异常: {e}")
             return False
 
         finally:
@@ -203,8 +361,7 @@ class NewAPIAdapter(BasePlatformAdapter):
                 logger.info(f"[{self.account_name}] OAuth 流程失败，正在清理浏览器资源...")
                 try:
                     if self._browser_manager:
-                        await self._browser_manager.close()
-                        self._browser_manager = None
+                        await self._release_browser()
                         logger.info(f"[{self.account_name}] 浏览器资源清理完成")
                 except Exception as cleanup_error:
                     logger.warning(f"[{self.account_name}] 浏览器资源清理时发生错误: {cleanup_error}")
@@ -225,8 +382,8 @@ class NewAPIAdapter(BasePlatformAdapter):
             # 访问 LinuxDO 登录页面
             logger.info(f"[{self.account_name}] 访问 LinuxDO 登录页面...")
             await tab.get(self.LINUXDO_LOGIN_URL)
-            await self._browser_manager.wait_for_cloudflare(timeout=30)
-            await asyncio.sleep(3)
+            await self._wait_for_cloudflare(tab, self.LINUXDO_DOMAIN)
+            await wait_for_document_ready(tab)
 
             # 检查是否已经登录（查找用户头像或登出按钮）
             try:
@@ -248,7 +405,6 @@ class NewAPIAdapter(BasePlatformAdapter):
                     logger.info(f"[{self.account_name}] 通过 CSS 选择器找到登录按钮...")
                     await login_btn.click()
                     login_clicked = True
-                    await asyncio.sleep(2)
             except Exception:
                 pass
 
@@ -260,7 +416,6 @@ class NewAPIAdapter(BasePlatformAdapter):
                         logger.info(f"[{self.account_name}] 通过文本找到登录链接...")
                         await login_link.click()
                         login_clicked = True
-                        await asyncio.sleep(2)
                 except Exception:
                     pass
 
@@ -274,16 +429,13 @@ class NewAPIAdapter(BasePlatformAdapter):
                             logger.info(f"[{self.account_name}] 通过 header 找到登录按钮...")
                             await btn.click()
                             login_clicked = True
-                            await asyncio.sleep(2)
                             break
                 except Exception:
                     pass
 
             # 等待登录模态框加载（Discourse 使用模态框显示登录表单）
+            # 尝试多种选择器查找用户名输入框（select 自带等待）
             logger.info(f"[{self.account_name}] 等待登录模态框加载...")
-            await asyncio.sleep(3)
-
-            # 尝试多种选择器查找用户名输入框
             username_input = None
             selectors = [
                 '#login-account-name',
@@ -318,9 +470,7 @@ class NewAPIAdapter(BasePlatformAdapter):
             # 清空并填写用户名
             logger.info(f"[{self.account_name}] 填写 LinuxDO 用户名...")
             await username_input.clear_input()
-            await asyncio.sleep(0.2)
             await username_input.send_keys(self.linuxdo_username)
-            await asyncio.sleep(0.5)
 
             # 填写密码
             password_input = await tab.select('#login-account-password', timeout=5)
@@ -330,9 +480,7 @@ class NewAPIAdapter(BasePlatformAdapter):
             if password_input:
                 logger.info(f"[{self.account_name}] 填写 LinuxDO 密码...")
                 await password_input.clear_input()
-                await asyncio.sleep(0.2)
                 await password_input.send_keys(self.linuxdo_password)
-                await asyncio.sleep(0.5)
 
             # 点击登录按钮
             login_btn = await tab.select('#login-button', timeout=5)
@@ -345,14 +493,11 @@ class NewAPIAdapter(BasePlatformAdapter):
                 await asyncio.sleep(0.3)
                 await login_btn.mouse_click()
 
-                # 等待登录完成（增加等待时间）
+                # 检查登录是否成功（选择器等待代替固定延时）
                 logger.info(f"[{self.account_name}] 等待 LinuxDO 登录完成...")
-                await asyncio.sleep(8)
-
-                # 检查登录是否成功
                 # 方式1: 查找用户菜单
                 try:
-                    user_menu = await tab.select('.current-user', timeout=5)
+                    user_menu = await tab.select('.current-user', timeout=10)
                     if user_menu:
                         logger.success(f"[{self.account_name}] LinuxDO 登录成功（找到用户菜单）")
                         return True
@@ -360,7 +505,7 @@ class NewAPIAdapter(BasePlatformAdapter):
                     pass
 
                 # 方式2: 检查 URL 是否离开了登录页面
-                url_monitor = URLMonitor(tab, poll_interval=0.5)
+                url_monitor = self._url_monitor(tab)
                 current_url = await url_monitor.get_current_url()
                 if "login" not in current_url.lower():
                     logger.success(f"[{self.account_name}] LinuxDO 登录成功（URL: {current_url}）")
@@ -379,9 +524,7 @@ class NewAPIAdapter(BasePlatformAdapter):
             return False
 
         except Exception as e:
-            logger.warning(f"[{self.account_name}] LinuxDO 登录异常: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.opt(exception=True).warning(f"[{self.account_name}] LinuxDO 登录异常: {e}")
             return False
 
     async def _handle_authorization_page(self, tab, _url_monitor) -> bool:
@@ -401,7 +544,7 @@ class NewAPIAdapter(BasePlatformAdapter):
             logger.info(f"[{self.account_name}] 处理授权页面，等待页面加载...")
 
             # 等待页面完全加载
-            await asyncio.sleep(3)
+            await wait_for_document_ready(tab)
 
             # 首先检查是否需要登录（授权页面可能显示登录表单）
             login_form = await tab.select('#login-account-name', timeout=3)
@@ -410,33 +553,27 @@ class NewAPIAdapter(BasePlatformAdapter):
 
                 # 填写用户名
                 await login_form.clear_input()
-                await asyncio.sleep(0.2)
                 await login_form.send_keys(self.linuxdo_username)
-                await asyncio.sleep(0.5)
 
                 # 填写密码
                 password_input = await tab.select('#login-account-password', timeout=5)
                 if password_input:
                     await password_input.clear_input()
-                    await asyncio.sleep(0.2)
                     await password_input.send_keys(self.linuxdo_password)
-                    await asyncio.sleep(0.5)
 
                 # 点击登录按钮
                 login_btn = await tab.select('#login-button', timeout=5)
                 if login_btn:
                     logger.info(f"[{self.account_name}] 点击登录按钮...")
                     await login_btn.click()
-                    await asyncio.sleep(5)
                 else:
                     # 尝试通过文本查找
                     login_btn = await tab.find("登录", timeout=3)
                     if login_btn:
                         await login_btn.click()
-                        await asyncio.sleep(5)
 
                 # 登录后等待授权页面刷新
-                await asyncio.sleep(2)
+                await wait_for_document_ready(tab)
 
             logger.info(f"[{self.account_name}] 查找允许按钮...")
 
@@ -500,47 +637,29 @@ class NewAPIAdapter(BasePlatformAdapter):
                     await asyncio.sleep(0.3)
                     await authorize_btn.mouse_click()
                 logger.info(f"[{self.account_name}] 已点击授权按钮，等待重定向...")
-                # 增加等待时间，确保重定向完成并设置 cookie
-                await asyncio.sleep(5)
                 return True
             else:
                 logger.warning(f"[{self.account_name}] 未找到授权按钮")
                 return False
 
         except Exception as e:
-            logger.warning(f"[{self.account_name}] 授权页面处理失败: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.opt(exception=True).warning(f"[{self.account_name}] 授权页面处理失败: {e}")
             return False
 
-    async def _execute_nodriver_oauth_flow(self, tab) -> bool:
-        """执行 nodriver OAuth 流程的核心逻辑
-
-        此方法包含实际的 OAuth 登录流程，被 _login_via_linuxdo_nodriver 调用。
-        将核心逻辑分离出来，使得 try/finally 资源清理更加清晰。
-
-        流程：
-        1. 先访问 linux.do 登录（保持会话）
-        2. 然后访问中转站，点击 LinuxDO 按钮
-        3. 此时会直接显示授权页面，点击"允许"
+    async def _fetch_linuxdo_authorize_url(self, tab) -> str | None:
+        """在站点页面内通过 new-api 接口生成 LinuxDO 授权 URL，失败返回 None"""
+        try:
+            url = await tab.evaluate(_LINUXDO_AUTHORIZE_URL_JS, await_promise=True)
+        except Exception as e:
+            logger.debug(f"[{self.account_name}] 生成 LinuxDO 授权 URL 失败: {e}")
+            return None
+        return url if isinstance(url, str) and url.startswith("https://") else None
 
-        Args:
-            tab: nodriver 标签页对象
+    async def _open_oauth_via_linuxdo_button(self, tab, tab_manager: TabManager):
+        """在站点登录页查找并点击 LinuxDO 按钮，返回继续 OAuth 流程的标签页
 
-        Returns:
-            bool: OAuth 流程是否成功
+        OAuth 可能在新标签页打开，返回值可能不是传入的 tab；未找到按钮时返回 None。
         """
-        # 步骤 1: 先登录 LinuxDO（这样后续 OAuth 时就不需要再输入密码）
-        logger.info(f"[{self.account_name}] 步骤1: 先登录 LinuxDO...")
-        if not await self._login_to_linuxdo_first(tab):
-            logger.warning(f"[{self.account_name}] LinuxDO 登录失败，继续尝试...")
-
-        # 步骤 2: 访问中转站登录页面
-        logger.info(f"[{self.account_name}] 步骤2: 访问 {self.PLATFORM_NAME} 登录页面...")
-        await tab.get(self.login_url)
-        await self._browser_manager.wait_for_cloudflare(timeout=30)
-        await asyncio.sleep(3)
-
         logger.info(f"[{self.account_name}] 查找 LinuxDO 登录按钮...")
 
         # 特殊流程：某些 NewAPI 站点需要先访问注册页再访问登录页才能看到 LinuxDO 按钮
@@ -550,12 +669,12 @@ class NewAPIAdapter(BasePlatformAdapter):
             register_url = self.login_url.replace("/login", "/register")
             logger.info(f"[{self.account_name}] 导航到注册页...")
             await tab.get(register_url)
-            await asyncio.sleep(2)
+            await wait_for_document_ready(tab)
 
             # 步骤2: 导航回登录页
             logger.info(f"[{self.account_name}] 导航回登录页...")
             await tab.get(self.login_url)
-            await asyncio.sleep(2)
+            await wait_for_document_ready(tab)
         except Exception as e:
             logger.debug(f"[{self.account_name}] 特殊流程失败: {e}")
 
@@ -564,14 +683,12 @@ class NewAPIAdapter(BasePlatformAdapter):
             agreement_area = await tab.find("我已阅读并同意", timeout=3)
             if agreement_area:
                 await agreement_area.click()
-                await asyncio.sleep(0.5)
                 logger.info(f"[{self.account_name}] 已勾选同意协议")
         except Exception:
             try:
                 checkbox = await tab.select('input[type="checkbox"]', timeout=2)
                 if checkbox:
                     await checkbox.click()
-                    await asyncio.sleep(0.5)
             except Exception:
                 pass
 
@@ -608,23 +725,15 @@ class NewAPIAdapter(BasePlatformAdapter):
         except Exception as e:
             logger.debug(f"[{self.account_name}] 通过 CSS 选择器查找按钮失败: {e}")
 
-        # 方式2: 通过按钮文本查找
+        # 方式2: 通过按钮完整文本 / 部分文本并发查找
         if not linuxdo_btn:
-            try:
-                linuxdo_btn = await tab.find("使用 LinuxDO 继续", timeout=3)
-                if linuxdo_btn:
-                    logger.info(f"[{self.account_name}] 通过文本找到 LinuxDO 按钮")
-            except Exception:
-                pass
-
-        # 方式3: 通过部分文本查找
-        if not linuxdo_btn:
-            try:
-                linuxdo_btn = await tab.find("LinuxDO", timeout=3)
-                if linuxdo_btn:
-                    logger.info(f"[{self.account_name}] 通过 'LinuxDO' 文本找到按钮")
-            except Exception:
-                pass
+            linuxdo_btn = await first_found(
+                tab.find("使用 LinuxDO 继续", timeout=3),
+                tab.find("LinuxDO", timeout=3),
+                timeout=3,
+            )
+            if linuxdo_btn:
+                logger.info(f"[{self.account_name}] 通过文本找到 LinuxDO 按钮")
 
         if not linuxdo_btn:
             # 打印页面内容用于调试
@@ -638,20 +747,15 @@ class NewAPIAdapter(BasePlatformAdapter):
             except Exception:
                 pass
             logger.error(f"[{self.account_name}] 未找到 LinuxDO 登录按钮")
-            return False
+            return None
 
         # 记录点击前的标签页数量
-        tab_manager = TabManager(self._browser_manager.browser)
         initial_tab_count = tab_manager.record_tab_count()
         logger.info(f"[{self.account_name}] 点击前标签页数量: {initial_tab_count}")
 
         # 点击 LinuxDO 按钮
         logger.info(f"[{self.account_name}] 点击 LinuxDO 登录按钮...")
         await linuxdo_btn.click()
-        await asyncio.sleep(3)
-
-        # 保存原始标签页引用，以便后续返回
-        original_tab = tab
 
         # 检测是否打开了新标签页（OAuth 通常会打开新标签页）
         # 增加等待时间，因为新标签页可能需要一点时间才能被检测到
@@ -663,7 +767,7 @@ class NewAPIAdapter(BasePlatformAdapter):
             await tab_manager.switch_to_tab(new_tab)
             tab = new_tab
             # 等待新标签页加载
-            await asyncio.sleep(2)
+            await wait_for_document_ready(tab)
         else:
             # 没有新标签页，尝试查找 OAuth 相关标签页
             logger.info(f"[{self.account_name}] 未检测到新标签页，尝试查找 OAuth 相关标签页...")
@@ -675,17 +779,60 @@ class NewAPIAdapter(BasePlatformAdapter):
             else:
                 # 没有新标签页也没有 OAuth 标签页，等待当前标签页 URL 变化到 LinuxDO
                 logger.info(f"[{self.account_name}] 未找到新标签页，等待 URL 跳转到 LinuxDO...")
-                temp_monitor = URLMonitor(tab, poll_interval=0.5)
+                temp_monitor = self._url_monitor(tab)
                 try:
                     await temp_monitor.wait_for_url_contains("linux.do", timeout=15)
                 except TimeoutError:
                     logger.warning(f"[{self.account_name}] 等待跳转到 LinuxDO 超时，继续尝试...")
 
+        return tab
+
+    async def _execute_nodriver_oauth_flow(self, tab) -> bool:
+        """执行 nodriver OAuth 流程的核心逻辑
+
+        此方法包含实际的 OAuth 登录流程，被 _login_via_linuxdo_nodriver 调用。
+        将核心逻辑分离出来，使得 try/finally 资源清理更加清晰。
+
+        流程：
+        1. 先访问 linux.do 登录（保持会话）
+        2. 然后访问中转站，直接打开 LinuxDO 授权 URL（无法生成时点击 LinuxDO 按钮）
+        3. 此时会直接显示授权页面，点击"允许"
+
+        Args:
+            tab: nodriver 标签页对象
+
+        Returns:
+            bool: OAuth 流程是否成功
+        """
+        # 步骤 1: 先登录 LinuxDO（这样后续 OAuth 时就不需要再输入密码）
+        logger.info(f"[{self.account_name}] 步骤1: 先登录 LinuxDO...")
+        if not await self._login_to_linuxdo_first(tab):
+            logger.warning(f"[{self.account_name}] LinuxDO 登录失败，继续尝试...")
+
+        # 步骤 2: 访问中转站登录页面
+        logger.info(f"[{self.account_name}] 步骤2: 访问 {self.PLATFORM_NAME} 登录页面...")
+        await tab.get(self.login_url)
+        await self._wait_for_cloudflare(tab, self.COOKIE_DOMAIN)
+        await wait_for_document_ready(tab)
+
+        original_tab = tab
+        # 浏览器由 run_batch() 中并发的适配器共享，只识别本适配器标签页打开的 OAuth 标签页
+        tab_manager = TabManager(self._browser_manager.browser, opener=tab)
+
+        authorize_url = await self._fetch_linuxdo_authorize_url(tab) if self.DIRECT_OAUTH else None
+        if authorize_url:
+            logger.info(f"[{self.account_name}] 直接打开 LinuxDO 授权页，跳过登录按钮查找")
+            await tab.get(authorize_url)
+        else:
+            tab = await self._open_oauth_via_linuxdo_button(tab, tab_manager)
+            if tab is None:
+                return False
+
         # 等待 Cloudflare 验证（传入当前标签页）
-        await self._browser_manager.wait_for_cloudflare(timeout=60, tab=tab)
+        await self._wait_for_cloudflare(tab, self.LINUXDO_DOMAIN, timeout=60)
 
         # 创建 URLMonitor 用于准确的 URL 跟踪（Requirements 1.4, 1.5, 2.1, 2.2）
-        url_monitor = URLMonitor(tab, poll_interval=0.5)
+        url_monitor = self._url_monitor(tab)
 
         # 使用 CDP get_frame_tree() 获取准确的当前 URL（Requirements 1.5, 2.2）
         current_url = await url_monitor.get_current_url()
@@ -730,29 +877,17 @@ class NewAPIAdapter(BasePlatformAdapter):
                 # 等待用户名输入框可交互（Requirements 4.1）
                 username_input = await tab.select('#login-account-name', timeout=10)
                 if username_input:
-                    # 短暂等待确保元素完全可交互
-                    await asyncio.sleep(0.3)
-
                     # 使用 send_keys() 填写用户名（Requirements 4.2）
                     logger.info(f"[{self.account_name}] 填写用户名...")
                     await username_input.send_keys(self.linuxdo_username)
 
-                    # 等待输入完成，确保浏览器处理完 JS 事件
-                    await asyncio.sleep(0.5)
-
                     # 等待密码输入框可交互（Requirements 4.1）
                     password_input = await tab.select('#login-account-password', timeout=5)
                     if password_input:
-                        # 短暂等待确保元素完全可交互
-                        await asyncio.sleep(0.3)
-
                         # 使用 send_keys() 填写密码（Requirements 4.3）
                         logger.info(f"[{self.account_name}] 填写密码...")
                         await password_input.send_keys(self.linuxdo_password)
 
-                        # 等待输入完成
-                        await asyncio.sleep(0.5)
-
                     # 等待登录按钮可交互并使用 mouse_click() 提交（Requirements 4.4, 4.5）
                     async def submit_login_form():
                         """提交登录表单，使用 mouse_click() 模拟真实用户点击"""
@@ -788,7 +923,12 @@ class NewAPIAdapter(BasePlatformAdapter):
                     except Exception as e:
                         logger.warning(f"[{self.account_name}] 登录表单提交失败: {e}")
 
-                    await asyncio.sleep(5)
+                    # 等待离开 LinuxDO 登录页（跳转到授权页面或目标站点）
+                    async def left_login_page() -> bool:
+                        url = await url_monitor.get_current_url()
+                        return classify_oauth_url(url, self.COOKIE_DOMAIN) != OAuthURLType.LINUXDO_LOGIN
+
+                    await self._poll(left_login_page, timeout=15)
 
                     # 使用 URLMonitor 获取准确的 URL 检查授权页面（Requirements 2.2）
                     current_url = await url_monitor.get_current_url()
@@ -799,7 +939,7 @@ class NewAPIAdapter(BasePlatformAdapter):
                         logger.info(f"[{self.account_name}] 检测到授权页面，点击授权...")
 
                         # 等待页面加载
-                        await asyncio.sleep(3)
+                        await wait_for_document_ready(tab)
 
                         # 先尝试查找"允许"按钮（connect.linux.do 使用这个）
                         authorize_btn = None
@@ -834,7 +974,6 @@ class NewAPIAdapter(BasePlatformAdapter):
                             await asyncio.sleep(0.3)
                             await authorize_btn.mouse_click()
                             logger.info(f"[{self.account_name}] 已点击授权按钮")
-                            await asyncio.sleep(3)
                         else:
                             # 授权按钮未找到，记录警告并继续等待重定向（Requirements 5.4）
                             logger.warning(f"[{self.account_name}] 授权按钮未找到，继续等待重定向...")
@@ -858,7 +997,7 @@ class NewAPIAdapter(BasePlatformAdapter):
 
             # 等待页面完全加载，确保 cookie 已设置
             logger.info(f"[{self.account_name}] 等待页面完全加载...")
-            await asyncio.sleep(3)
+            await wait_for_document_ready(tab)
 
         except TimeoutError as e:
             # URL 在超时时间内没有变化，返回超时错误（Requirements 2.5）
@@ -871,14 +1010,13 @@ class NewAPIAdapter(BasePlatformAdapter):
         # 使用 CookieRetriever 获取 session cookie（Requirements 6.1, 6.2, 6.3, 6.4）
         # CookieRetriever 使用 CDP 的 network.get_cookies() 进行准确的 cookie 获取
         # 并按 cookie 名称（"session"）和域名进行匹配，支持重试逻辑
-        cookie_retriever = CookieRetriever(self._browser_manager, self.COOKIE_DOMAIN)
+        cookie_retriever = CookieRetriever(self._browser_manager, self.COOKIE_DOMAIN, tab=original_tab)
         self.session_cookie = await cookie_retriever.get_session_cookie(max_retries=3)
 
         # 如果当前标签页没有获取到 cookie，且我们切换过标签页，尝试从原始标签页获取
         if not self.session_cookie and tab != original_tab:
             logger.info(f"[{self.account_name}] 当前标签页未获取到 cookie，尝试返回原始标签页...")
             await tab_manager.switch_to_tab(original_tab)
-            await asyncio.sleep(1)
             # 再次使用 CookieRetriever 获取 cookie（Requirements 6.4）
             self.session_cookie = await cookie_retriever.get_session_cookie(max_retries=3)
 
@@ -891,19 +1029,18 @@ class NewAPIAdapter(BasePlatformAdapter):
         # 尝试从浏览器获取用户 ID（用于 New-Api-User header）
         # new-api 需要这个 header 才能正常调用 API
         try:
-            import json as json_module
-            # 等待页面 JavaScript 完全加载
-            await asyncio.sleep(2)
+            # 等待前端写入 localStorage 中的用户信息
+            await self._poll(lambda: tab.evaluate("localStorage.getItem('user') !== null"), timeout=5)
 
             # 方式1: 从 localStorage 获取用户信息（new-api 使用 'user' key 存储完整用户对象）
             user_json = await tab.evaluate("localStorage.getItem('user')")
             if user_json:
                 try:
-                    user_data = json_module.loads(user_json)
+                    user_data = _json.loads(user_json)
                     if isinstance(user_data, dict) and 'id' in user_data:
                         self.api_user = str(user_data['id'])
                         logger.info(f"[{self.account_name}] 从 localStorage['user'] 获取到用户 ID: {self.api_user}")
-                except (json_module.JSONDecodeError, TypeError):
+                except (_json.JSONDecodeError, TypeError):
                     pass
 
             # 方式2: 尝试其他常见的 key
@@ -914,12 +1051,12 @@ class NewAPIAdapter(BasePlatformAdapter):
                         # 确保是纯数字或简单字符串
                         try:
                             # 尝试解析为 JSON（可能是 JSON 字符串）
-                            parsed = json_module.loads(user_id)
+                            parsed = _json.loads(user_id)
                             if isinstance(parsed, dict) and 'id' in parsed:
                                 self.api_user = str(parsed['id'])
                             elif isinstance(parsed, (int, str)):
                                 self.api_user = str(parsed)
-                        except (json_module.JSONDecodeError, TypeError):
+                        except (_json.JSONDecodeError, TypeError):
                             # 不是 JSON，直接使用
                             self.api_user = str(user_id)
                         if self.api_user:
@@ -949,194 +1086,134 @@ class NewAPIAdapter(BasePlatformAdapter):
         except Exception as e:
             logger.debug(f"[{self.account_name}] 获取用户 ID 失败: {e}")
 
-        self._init_http_client()
+        await self._init_http_client()
         return await self._verify_login()
 
-    async def _login_via_linuxdo_drissionpage(self) -> bool:
-        """使用 DrissionPage 进行 LinuxDO OAuth 登录"""
-        page = self.page
-
-        # 访问登录页面
-        page.get(self.login_url)
-        await self._browser_manager.wait_for_cloudflare(timeout=30)
-        time.sleep(2)
+    def _url_monitor(self, tab) -> URLMonitor:
+        """创建按 POLL_* 参数退避轮询的 URLMonitor"""
+        return URLMonitor(
+            tab,
+            poll_interval=self.POLL_INTERVAL,
+            backoff=self.POLL_BACKOFF,
+            max_interval=self.POLL_MAX_INTERVAL,
+        )
+
+    async def _poll(self, condition, timeout: float = 15) -> bool:
+        """按 POLL_* 参数退避轮询条件，返回是否在超时前满足"""
+        return await wait_until(
+            condition,
+            timeout=timeout,
+            poll_interval=self.POLL_INTERVAL,
+            backoff=self.POLL_BACKOFF,
+            max_interval=self.POLL_MAX_INTERVAL,
+        )
+
+    async def _wait_for_cloudflare(self, tab, domain: str, timeout: int = 30) -> bool:
+        """等待 Cloudflare 验证，当前上下文已持有 cf_clearance 时直接跳过
+
+        每次登录都在独立的浏览器上下文中进行，放行状态只能按标签页所在上下文判断。
+        """
+        if await self._browser_manager.has_cf_clearance(f"https://{domain}/", tab=tab):
+            logger.debug(f"[{self.account_name}] {domain} 已持有 cf_clearance，跳过 Cloudflare 等待")
+            return True
+        return await self._browser_manager.wait_for_cloudflare(timeout=timeout, tab=tab)
+
+    def _make_driver(self, engine: str) -> PageDriver:
+        """根据浏览器引擎创建页面驱动"""
+        if engine == "drissionpage":
+            return DrissionPageDriver(self.page)
+        return PlaywrightPageDriver(self.page)
+
+    async def _find_linuxdo_button(self, driver: PageDriver):
+        """查找 LinuxDO 登录按钮（完整文本和部分文本并发探测）"""
+        return await first_found(
+            driver.find_text("使用 LinuxDO 继续", timeout=2),
+            driver.find_text("LinuxDO", timeout=2),
+            timeout=2,
+        )
+
+    async def _run_linuxdo_flow(self, driver: PageDriver) -> bool:
+        """使用通用页面驱动执行 LinuxDO OAuth 登录（DrissionPage / Playwright）"""
+        await driver.goto(self.login_url)
+        await self._wait_for_cloudflare(driver.page, self.COOKIE_DOMAIN)
+        await driver.wait_loaded()
 
         logger.info(f"[{self.account_name}] 查找 LinuxDO 登录按钮...")
 
         # 先勾选同意协议（如果有）
-        checkbox = page.ele('tag:input@type=checkbox', timeout=2)
-        if checkbox and not checkbox.states.is_checked:
-            checkbox.click()
-            time.sleep(0.5)
+        checkbox = await driver.query('input[type="checkbox"]', timeout=2)
+        if checkbox and not await driver.is_checked(checkbox):
+            await driver.click(checkbox)
 
-        # 尝试直接找 LinuxDO 按钮
-        linuxdo_btn = page.ele('tag:button@@text():使用 LinuxDO 继续', timeout=2)
-        if not linuxdo_btn:
-            linuxdo_btn = page.ele('tag:button@@text():LinuxDO', timeout=2)
+        linuxdo_btn = await self._find_linuxdo_button(driver)
 
         # 如果没找到，尝试点击"注册"按钮
         if not linuxdo_btn:
             logger.info(f"[{self.account_name}] 登录页未找到 LinuxDO 按钮，尝试切换到注册页...")
-            register_btn = page.ele('tag:button@@text():注册', timeout=2)
+            register_btn = await driver.find_text("注册", timeout=2)
             if register_btn:
-                register_btn.click()
-                time.sleep(2)
-
-                linuxdo_btn = page.ele('tag:button@@text():使用 LinuxDO 继续', timeout=2)
-                if not linuxdo_btn:
-                    linuxdo_btn = page.ele('tag:button@@text():LinuxDO', timeout=2)
+                await driver.click(register_btn)
+                linuxdo_btn = await self._find_linuxdo_button(driver)
 
         if not linuxdo_btn:
             logger.error(f"[{self.account_name}] 未找到 LinuxDO 登录按钮")
             return False
 
         logger.info(f"[{self.account_name}] 点击 LinuxDO 登录按钮...")
-        linuxdo_btn.click()
-        time.sleep(3)
+        login_page_url = await driver.url()
+        await driver.click(linuxdo_btn)
+        await driver.wait_for_url(lambda u: u != login_page_url, timeout=10)
 
         # 等待 Cloudflare 验证
-        await self._browser_manager.wait_for_cloudflare(timeout=30)
+        await self._wait_for_cloudflare(driver.page, self.LINUXDO_DOMAIN)
 
-        current_url = page.url
+        current_url = await driver.url()
         logger.info(f"[{self.account_name}] 当前页面: {current_url}")
 
         if "linux.do" in current_url:
             logger.info(f"[{self.account_name}] 需要登录 LinuxDO...")
 
             # 等待登录表单
-            username_input = page.ele('#login-account-name', timeout=10)
-            if username_input:
-                username_input.input(self.linuxdo_username)
-                time.sleep(0.5)
+            if await driver.query("#login-account-name", timeout=10):
+                await driver.fill("#login-account-name", self.linuxdo_username)
+                await driver.fill("#login-account-password", self.linuxdo_password)
 
-                password_input = page.ele('#login-account-password')
-                if password_input:
-                    password_input.input(self.linuxdo_password)
-                    time.sleep(0.5)
-
-                login_btn = page.ele('#login-button', timeout=2)
+                login_btn = await driver.query("#login-button", timeout=2)
+                if not login_btn:
+                    login_btn = await driver.find_text("登录")
                 if login_btn:
-                    login_btn.click()
-                else:
-                    page.ele('tag:button@@text():登录').click()
+                    await driver.click(login_btn)
 
-                time.sleep(5)
+                # 等待跳转到授权页面或直接回到目标站点
+                await driver.wait_for_url(
+                    lambda u: "authorize" in u.lower() or self.COOKIE_DOMAIN in u, timeout=15
+                )
 
                 # 检查授权页面
-                current_url = page.url
+                current_url = await driver.url()
                 if "authorize" in current_url.lower():
                     logger.info(f"[{self.account_name}] 检测到授权页面，点击授权...")
-                    authorize_btn = page.ele('tag:button@@text():授权', timeout=5)
+                    authorize_btn = await driver.find_text("授权", timeout=5)
                     if authorize_btn:
-                        authorize_btn.click()
-                        time.sleep(3)
+                        await driver.click(authorize_btn)
 
         # 等待跳转回目标站点
-        for _ in range(10):
-            current_url = page.url
-            if self.COOKIE_DOMAIN in current_url and "login" not in current_url:
-                logger.info(f"[{self.account_name}] 已跳转回 {self.PLATFORM_NAME}: {current_url}")
-                break
-            time.sleep(1)
+        if await driver.wait_for_url(
+            lambda u: self.COOKIE_DOMAIN in u and "login" not in u, timeout=15
+        ):
+            logger.info(f"[{self.account_name}] 已跳转回 {self.PLATFORM_NAME}: {await driver.url()}")
 
         # 获取 session cookie
-        self.session_cookie = await self._browser_manager.get_cookie("session", self.COOKIE_DOMAIN)
-
-        if not self.session_cookie:
-            logger.error(f"[{self.account_name}] 未获取到 session cookie")
-            return False
-
-        logger.info(f"[{self.account_name}] 获取到 session cookie")
-        self._init_http_client()
-        return await self._verify_login()
-
-    async def _login_via_linuxdo_playwright(self) -> bool:
-        """使用 Playwright/Patchright 进行 LinuxDO OAuth 登录"""
-        page = self.page
-
-        await page.goto(self.login_url, wait_until="networkidle", timeout=30000)
-        await self._browser_manager.wait_for_cloudflare(timeout=15)
-        await asyncio.sleep(2)
-
-        logger.info(f"[{self.account_name}] 查找 LinuxDO 登录按钮...")
-
-        # 先勾选同意协议
-        checkbox = await page.query_selector('input[type="checkbox"]')
-        if checkbox:
-            is_checked = await checkbox.is_checked()
-            if not is_checked:
-                await checkbox.click()
-                await asyncio.sleep(0.5)
-
-        # 查找 LinuxDO 按钮
-        linuxdo_btn = await page.query_selector('button:has-text("使用 LinuxDO 继续")')
-        if not linuxdo_btn:
-            linuxdo_btn = await page.query_selector('button:has-text("LinuxDO")')
-
-        if not linuxdo_btn:
-            logger.info(f"[{self.account_name}] 登录页未找到 LinuxDO 按钮，尝试切换到注册页...")
-            register_btn = await page.query_selector('button:has-text("注册")')
-            if register_btn:
-                await register_btn.click()
-                await asyncio.sleep(2)
-                linuxdo_btn = await page.query_selector('button:has-text("使用 LinuxDO 继续")')
-                if not linuxdo_btn:
-                    linuxdo_btn = await page.query_selector('button:has-text("LinuxDO")')
-
-        if not linuxdo_btn:
-            logger.error(f"[{self.account_name}] 未找到 LinuxDO 登录按钮")
-            return False
-
-        logger.info(f"[{self.account_name}] 点击 LinuxDO 登录按钮...")
-        await linuxdo_btn.click()
-        await asyncio.sleep(3)
-
-        await self._browser_manager.wait_for_cloudflare(timeout=15)
-
-        current_url = page.url
-        logger.info(f"[{self.account_name}] 当前页面: {current_url}")
-
-        if "linux.do" in current_url:
-            logger.info(f"[{self.account_name}] 需要登录 LinuxDO...")
-
-            await page.wait_for_selector('#login-account-name', timeout=10000)
-            await page.fill('#login-account-name', self.linuxdo_username)
-            await asyncio.sleep(0.5)
-            await page.fill('#login-account-password', self.linuxdo_password)
-            await asyncio.sleep(0.5)
-
-            login_btn = await page.query_selector('#login-button')
-            if login_btn:
-                await login_btn.click()
-            else:
-                await page.click('button:has-text("登录")')
-
-            await asyncio.sleep(5)
-
-            current_url = page.url
-            if "authorize" in current_url.lower():
-                logger.info(f"[{self.account_name}] 检测到授权页面，点击授权...")
-                authorize_btn = await page.query_selector('button:has-text("授权")')
-                if authorize_btn:
-                    await authorize_btn.click()
-                    await asyncio.sleep(3)
-
-        # 等待跳转回目标站点
-        for _ in range(10):
-            current_url = page.url
-            if self.COOKIE_DOMAIN in current_url and "login" not in current_url:
-                logger.info(f"[{self.account_name}] 已跳转回 {self.PLATFORM_NAME}: {current_url}")
-                break
-            await asyncio.sleep(1)
-
-        self.session_cookie = await self._browser_manager.get_cookie("session", self.COOKIE_DOMAIN)
+        self.session_cookie = await self._browser_manager.get_cookie(
+            "session", self.COOKIE_DOMAIN, tab=driver.page, url=self.BASE_URL
+        )
 
         if not self.session_cookie:
             logger.error(f"[{self.account_name}] 未获取到 session cookie")
             return False
 
         logger.info(f"[{self.account_name}] 获取到 session cookie")
-        self._init_http_client()
+        await self._init_http_client()
         return await self._verify_login()
 
     async def _login_via_cookie(self) -> bool:
@@ -1144,70 +1221,117 @@ class NewAPIAdapter(BasePlatformAdapter):
         if not self.fallback_cookies:
             return False
 
-        self.session_cookie = self._parse_session_cookie(self.fallback_cookies)
+        if self._parsed_session is None or self._parsed_session[0] is not self.fallback_cookies:
+            self._parsed_session = (self.fallback_cookies, self._parse_session_cookie(self.fallback_cookies))
+        self.session_cookie = self._parsed_session[1]
         if not self.session_cookie:
             logger.error(f"[{self.account_name}] 无法解析 session cookie")
             return False
 
-        self._init_http_client()
+        await self._init_http_client()
         return await self._verify_login()
 
+    async def _login_via_cached_cookie(self) -> bool:
+        """使用 CookieCache 中缓存的 session 登录，失效时清除缓存"""
+        cache = CookieCache()
+        cached = cache.get(self.COOKIE_DOMAIN, self.linuxdo_username)
+        if not cached:
+            return False
+
+        logger.info(f"[{self.account_name}] 尝试使用缓存的 Cookie 登录...")
+        api_user = self.api_user
+        self.session_cookie = cached["session"]
+        self.api_user = api_user or cached["api_user"]
+        await self._init_http_client()
+        if await self._verify_login():
+            return True
+
+        logger.info(f"[{self.account_name}] 缓存的 Cookie 已失效，清除缓存")
+        cache.invalidate(self.COOKIE_DOMAIN, self.linuxdo_username)
+        self.api_user = api_user
+        return False
+
+    def _save_cached_cookie(self) -> None:
+        """OAuth 登录成功后缓存 session，下次运行无需启动浏览器（缺少 api_user 时不缓存）"""
+        if self.session_cookie and self.api_user:
+            CookieCache().save(self.COOKIE_DOMAIN, self.linuxdo_username, self.session_cookie, self.api_user)
+
     def _parse_session_cookie(self, cookies_data) -> str | None:
         """解析 session cookie"""
         if isinstance(cookies_data, dict):
             return cookies_data.get("session")
 
         if isinstance(cookies_data, str):
-            if cookies_data.startswith("session="):
-                return cookies_data.split("=", 1)[1].split(";")[0]
-
-            if "=" not in cookies_data or cookies_data.count("=") == 0:
+            # 纯 session 值（不含 "="）直接使用
+            if "=" not in cookies_data:
                 return cookies_data
 
-            for cookie in cookies_data.split(";"):
-                if "=" in cookie:
-                    key, value = cookie.strip().split("=", 1)
-                    if key.strip() == "session":
-                        return value.strip()
+            match = _SESSION_COOKIE_RE.search(cookies_data)
+            if match:
+                return match.group(1).strip()
 
             return cookies_data
 
         return None
 
-    def _init_http_client(self) -> None:
-        """初始化 HTTP 客户端"""
-        self.client = httpx.Client(timeout=30.0)
-        # 设置 cookie - 使用多种方式确保 cookie 被正确发送
-        # 方式1: 使用完整域名（带点前缀，适用于子域名）
-        self.client.cookies.set("session", self.session_cookie, domain=f".{self.COOKIE_DOMAIN}")
-        # 方式2: 使用精确域名
-        self.client.cookies.set("session", self.session_cookie, domain=self.COOKIE_DOMAIN)
-        logger.debug(f"[{self.account_name}] HTTP 客户端初始化完成，cookie domain: {self.COOKIE_DOMAIN}")
+    async def _init_http_client(self) -> None:
+        """初始化 HTTP 客户端
+
+        base_url、默认请求头和 session cookie 只在这里配置一次，
+        之后的请求只需传入 API 路径。启用 HTTP/2 多路复用，
+        连接建立失败（DNS/TLS 抖动）时由传输层自动重试，避免回退到重新登录。
+
+        Cookie 登录失败后改走 OAuth 时会再次调用，此时只更新 session cookie
+        和请求头，继续复用已建立的连接，不再重新握手。
+        """
+        if self.client is not None and not self.client.is_closed:
+            headers = self._build_headers()
+            for name in ("Cookie", "new-api-user"):
+                if name not in headers:
+                    self.client.headers.pop(name, None)
+            self.client.headers.update(headers)
+            self.client.cookies.set("session", self.session_cookie)
+            logger.debug(f"[{self.account_name}] 复用 HTTP 客户端，已更新 session cookie")
+            return
+
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+        self.client = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            timeout=30.0,
+            headers=self._build_headers(),
+            cookies={"session": self.session_cookie},
+            transport=transport,
+        )
+        logger.debug(f"[{self.account_name}] HTTP 客户端初始化完成，base_url: {self.BASE_URL}")
 
     async def _verify_login(self) -> bool:
         """验证登录状态"""
         try:
-            headers = self._build_headers()
-
             logger.debug(f"[{self.account_name}] 验证登录，session cookie: {self.session_cookie[:20]}...")
             logger.debug(f"[{self.account_name}] API URL: {self.user_info_api}")
 
-            response = self.client.get(self.user_info_api, headers=headers)
+            response = await self.client.get(self.USER_INFO_API_PATH)
             logger.debug(f"[{self.account_name}] 响应状态: {response.status_code}")
             logger.debug(f"[{self.account_name}] 响应内容: {response.text[:200] if response.text else 'empty'}")
 
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("success"):
-                    user_data = data.get("data", {})
-                    username = user_data.get("username", "Unknown")
-                    logger.info(f"[{self.account_name}] 登录验证成功，用户: {username}")
-                    return True
+            data = self._loads_response(response)
+
+            if response.status_code == 200 and data.get("success"):
+                self._cached_user_json = data
+                self._cached_user_ts = time.monotonic()
+                user_data = data.get("data", {})
+                username = user_data.get("username", "Unknown")
+                logger.info(f"[{self.account_name}] 登录验证成功，用户: {username}")
+                return True
 
             # 如果返回 401 但有 session cookie，可能是 API 需要特殊 header
             # 尝试直接返回 True，让签到流程继续
             if response.status_code == 401 and self.session_cookie:
-                error_msg = response.json().get("message", "") if response.text else ""
+                error_msg = data.get("message", "")
                 if "New-Api-User" in error_msg or "access token" in error_msg:
                     logger.warning(f"[{self.account_name}] API 需要特殊认证，尝试继续签到流程...")
                     return True
@@ -1215,18 +1339,20 @@ class NewAPIAdapter(BasePlatformAdapter):
             logger.error(f"[{self.account_name}] 登录验证失败: HTTP {response.status_code}")
             return False
         except Exception as e:
-            logger.error(f"[{self.account_name}] 登录验证异常: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.opt(exception=True).error(f"[{self.account_name}] 登录验证异常: {e}")
             return False
 
     def _build_headers(self) -> dict:
-        """构建请求头"""
+        """构建请求头
+
+        结果按 (session_cookie, api_user) 缓存，调用方不应修改返回的字典。
+        """
+        key = (self.session_cookie, self.api_user)
+        if self._headers is not None and self._headers_key == key:
+            return self._headers
+
         headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36"
-            ),
+            "User-Agent": _USER_AGENT,
             "Accept": "application/json, text/plain, */*",
             "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
             "Referer": self.console_url,
@@ -1237,13 +1363,17 @@ class NewAPIAdapter(BasePlatformAdapter):
             headers["Cookie"] = f"session={self.session_cookie}"
         if self.api_user:
             headers["new-api-user"] = self.api_user
+
+        self._headers = headers
+        self._headers_key = key
         return headers
 
     async def checkin(self) -> CheckinResult:
         """执行签到操作"""
-        headers = self._build_headers()
-
-        self._user_info = self._get_user_info(headers)
+        # 用户信息与签到请求互不依赖，在同一 HTTP/2 连接上并发发出
+        self._user_info, (success, message) = await asyncio.gather(
+            self._get_user_info(), self._execute_checkin()
+        )
 
         details = {"login_method": self._login_method}
         if self._user_info and self._user_info.get("success"):
@@ -1251,8 +1381,6 @@ class NewAPIAdapter(BasePlatformAdapter):
             details["used"] = f"{self.CURRENCY_UNIT}{self._user_info['used_quota']}"
             logger.info(f"[{self.account_name}] {self._user_info['display']}")
 
-        success, message = self._execute_checkin(headers)
-
         if success:
             return CheckinResult(
                 platform=self.platform_name,
@@ -1270,49 +1398,64 @@ class NewAPIAdapter(BasePlatformAdapter):
                 details=details,
             )
 
-    def _get_user_info(self, headers: dict) -> dict:
-        """获取用户信息"""
+    @staticmethod
+    def _loads_response(response: httpx.Response) -> dict:
+        """解析 JSON 响应体（orjson 优先），非 JSON 或非对象时返回空字典"""
+        try:
+            data = _json.loads(response.content)
+        except ValueError:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _format_user_info(self, data: dict) -> dict:
+        """将 /api/user/self 响应转换为余额信息"""
+        user_data = data.get("data", {})
+        quota = round(user_data.get("quota", 0) / 500000, 2)
+        used_quota = round(user_data.get("used_quota", 0) / 500000, 2)
+        return {
+            "success": True,
+            "quota": quota,
+            "used_quota": used_quota,
+            "display": f"💰 当前余额: {self.CURRENCY_UNIT}{quota}, 已使用: {self.CURRENCY_UNIT}{used_quota}",
+        }
+
+    async def _get_user_info(self) -> dict:
+        """获取用户信息（优先复用登录验证时的响应）"""
+        if self._cached_user_json and time.monotonic() - self._cached_user_ts < self.USER_INFO_CACHE_TTL:
+            return self._format_user_info(self._cached_user_json)
+
         try:
-            response = self.client.get(self.user_info_api, headers=headers)
+            response = await self.client.get(self.USER_INFO_API_PATH)
 
             if response.status_code == 200:
-                data = response.json()
+                data = self._loads_response(response)
                 if data.get("success"):
-                    user_data = data.get("data", {})
-                    quota = round(user_data.get("quota", 0) / 500000, 2)
-                    used_quota = round(user_data.get("used_quota", 0) / 500000, 2)
-                    return {
-                        "success": True,
-                        "quota": quota,
-                        "used_quota": used_quota,
-                        "display": f"💰 当前余额: {self.CURRENCY_UNIT}{quota}, 已使用: {self.CURRENCY_UNIT}{used_quota}",
-                    }
+                    return self._format_user_info(data)
             return {"success": False, "error": f"HTTP {response.status_code}"}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def _execute_checkin(self, headers: dict) -> tuple[bool, str]:
+    async def _execute_checkin(self) -> tuple[bool, str]:
         """执行签到请求"""
         logger.info(f"[{self.account_name}] 执行签到请求...")
 
-        checkin_headers = headers.copy()
-        checkin_headers["Content-Type"] = "application/json"
-
         try:
-            response = self.client.post(self.checkin_api, headers=checkin_headers)
+            response = await self.client.post(
+                self.CHECKIN_API_PATH, headers={"Content-Type": "application/json"}
+            )
 
             logger.info(f"[{self.account_name}] 签到响应: {response.status_code}")
 
             if response.status_code == 200:
                 try:
-                    result = response.json()
+                    result = _json.loads(response.content)
                     if result.get("success"):
                         message = result.get("message", "签到成功")
                         logger.success(f"[{self.account_name}] {message}")
                         return True, message
                     else:
                         error_msg = result.get("message", "签到失败")
-                        if "已" in error_msg or "already" in error_msg.lower() or "今天" in error_msg:
+                        if self.ALREADY_CHECKED_IN_PATTERN.search(error_msg):
                             logger.info(f"[{self.account_name}] {error_msg}")
                             return True, error_msg
                         logger.error(f"[{self.account_name}] {error_msg}")
@@ -1333,17 +1476,17 @@ class NewAPIAdapter(BasePlatformAdapter):
         if not self.client:
             return {"success": False, "error": "未登录"}
 
-        headers = self._build_headers()
-        self._user_info = self._get_user_info(headers)
+        self._user_info = await self._get_user_info()
         return self._user_info
 
-    async def cleanup(self) -> None:
-        """清理资源"""
-        if self._browser_manager:
-            with contextlib.suppress(Exception):
-                await self._browser_manager.close()
-            self._browser_manager = None
-
+    async def _close_client(self) -> None:
+        """关闭 HTTP 客户端"""
         if self.client:
-            self.client.close()
+            await self.client.aclose()
             self.client = None
+
+    async def cleanup(self) -> None:
+        """清理资源（标签页和 HTTP 客户端互不依赖，并发关闭）"""
+        await asyncio.gather(self._release_browser(), self._close_client(), return_exceptions=True)
+        self._tab = None
+        self._browser_manager = None
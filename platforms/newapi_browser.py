@@ -19,6 +19,8 @@ Debug 模式：
 """
 
 import asyncio
+import contextlib
+import hashlib
 import json
 import os
 from datetime import datetime
@@ -27,9 +29,417 @@ from pathlib import Path
 import httpx
 from loguru import logger
 
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - orjson 为可选加速依赖
+    import json as _json
+
+try:
+    import nodriver.cdp.input_ as cdp_input
+    import nodriver.cdp.network as cdp_network
+    import nodriver.cdp.page as cdp_page
+    import nodriver.cdp.target as cdp_target
+except ImportError:  # pragma: no cover - 仅 nodriver 引擎需要，调用处会捕获并降级
+    cdp_input = cdp_network = cdp_page = cdp_target = None
+
 from platforms.base import CheckinResult, CheckinStatus
-from utils.browser import BrowserManager, get_browser_engine
+from utils.browser import BrowserManager, get_browser_engine, wait_until
 from utils.config import DEFAULT_PROVIDERS, ProviderConfig
+from utils.cookie_cache import ApiUserCache, LinuxDOSessionCache, user_cache_dir
+
+
+# Cloudflare 轮询间隔（秒）：挑战通常在前几秒完成，前密后疏，之后保持最后一个间隔
+_CF_POLL_SCHEDULE = (0.2, 0.4, 0.7, 1.2, 2.0)
+
+# 仅残留 cf DOM 时，标题/URL 需连续保持非挑战态的时长（秒）才按通过处理
+_CF_RESIDUAL_STABLE_SEC = 6.0
+
+# Cloudflare 挑战页标题特征
+_CF_TITLE_INDICATORS = (
+    "just a moment", "checking your browser", "please wait",
+    "verifying", "checking", "challenge", "attention required",
+    "请稍候", "验证", "确认",
+)
+
+# 主文档仍在加载时，等待加载完成事件的最长时间（秒）
+_CF_LOADING_WAIT_SEC = 2.0
+
+# 一次取回 Cloudflare 检测所需的标题、URL 和可见挑战元素（返回 JSON 字符串）；
+# 主文档仍在解析（readyState === 'loading'）时只返回 {loading: true}，不做 DOM 查询
+_CF_STATE_JS = r"""
+    (function() {
+        if (document.readyState === 'loading') {
+            return JSON.stringify({ loading: true });
+        }
+        function hasChallengeElement() {
+            // 方法1: 查找 cloudflare challenge iframe
+            const iframes = document.querySelectorAll('iframe');
+            for (const iframe of iframes) {
+                const src = (iframe.src || '').toLowerCase();
+                if (!(src.includes('cloudflare') || src.includes('challenges.cloudflare.com'))) {
+                    continue;
+                }
+                const rect = iframe.getBoundingClientRect();
+                const visible = rect.width > 0 && rect.height > 0;
+                if (visible) return true;
+            }
+            // 方法2: 查找可见的 Cloudflare 挑战容器
+            const selectors = [
+                '.cf-turnstile',
+                '#cf-turnstile',
+                '#challenge-running',
+                '#challenge-stage',
+                '#cf-wrapper'
+            ];
+            for (const sel of selectors) {
+                const el = document.querySelector(sel);
+                if (!el) continue;
+                const rect = el.getBoundingClientRect();
+                const style = window.getComputedStyle(el);
+                const visible = (
+                    rect.width > 0 &&
+                    rect.height > 0 &&
+                    style.display !== 'none' &&
+                    style.visibility !== 'hidden' &&
+                    Number(style.opacity || '1') > 0
+                );
+                if (visible) return true;
+            }
+            return false;
+        }
+        return JSON.stringify({
+            title: document.title || '',
+            url: window.location.href || '',
+            hasElement: hasChallengeElement()
+        });
+    })()
+"""
+
+
+# 定位 Turnstile 复选框所在 iframe/容器，返回 [x, y, w, h, 策略]
+_TURNSTILE_RECT_JS = r"""
+    (function() {
+        const iframes = document.querySelectorAll('iframe');
+
+        // 策略1: 查找 src 包含 cloudflare 的 iframe（最可靠）
+        for (const iframe of iframes) {
+            const src = (iframe.src || '').toLowerCase();
+            if (src.includes('cloudflare')) {
+                const rect = iframe.getBoundingClientRect();
+                if (rect.width > 0 && rect.height > 0) {
+                    return [rect.x, rect.y, rect.width, rect.height, 'cf-iframe'];
+                }
+            }
+        }
+
+        // 策略2: .cf-turnstile / div[data-sitekey] 容器
+        const container = document.querySelector('.cf-turnstile') ||
+                          document.querySelector('div[data-sitekey]') ||
+                          document.querySelector('#cf-turnstile') ||
+                          document.querySelector('#challenge-stage');
+        if (container) {
+            const rect = container.getBoundingClientRect();
+            if (rect.width > 0 && rect.height > 0) {
+                return [rect.x, rect.y, rect.width, rect.height, 'cf-container'];
+            }
+        }
+
+        // 策略3: 查找 Turnstile 尺寸的 iframe（宽 280-350, 高 50-80）
+        for (const iframe of iframes) {
+            const rect = iframe.getBoundingClientRect();
+            if (rect.width >= 280 && rect.width <= 350 &&
+                rect.height >= 50 && rect.height <= 80) {
+                return [rect.x, rect.y, rect.width, rect.height, 'size-match-iframe'];
+            }
+        }
+
+        // 策略4: 放宽尺寸匹配 — 任何可见的小 iframe
+        for (const iframe of iframes) {
+            const rect = iframe.getBoundingClientRect();
+            if (rect.width >= 200 && rect.width <= 500 &&
+                rect.height >= 40 && rect.height <= 120 &&
+                rect.y > 0) {
+                return [rect.x, rect.y, rect.width, rect.height, 'any-small-iframe'];
+            }
+        }
+
+        // 策略5: 在托管挑战页面上，查找 checkbox 容器
+        // 托管页面整页都是 CF 挑战，checkbox 在页面中部偏上
+        const bodyText = document.body?.innerText || '';
+        if (bodyText.includes('确认您是真人') || bodyText.includes('verify you are human')) {
+            // 查找包含复选框的 label 或 span
+            const labels = document.querySelectorAll('label, span, div');
+            for (const el of labels) {
+                const text = (el.innerText || '').trim();
+                if (text === '确认您是真人' || text === 'Verify you are human') {
+                    const rect = el.getBoundingClientRect();
+                    if (rect.width > 0 && rect.height > 0) {
+                        return [rect.x, rect.y, rect.width, rect.height, 'checkbox-label'];
+                    }
+                }
+            }
+            // 最后兜底：返回页面上 checkbox 区域的大致位置
+            // 托管挑战页面的 checkbox 通常在 (215, 175) 附近，宽 170, 高 25
+            return [215, 170, 170, 30, 'managed-page-guess'];
+        }
+
+        return null;
+    })()
+"""
+
+
+# LinuxDO 是否已登录（存在用户菜单）
+_LINUXDO_LOGGED_IN_JS = """
+    (function() {
+        const userMenu = document.querySelector('.current-user');
+        return !!userMenu;
+    })()
+"""
+
+
+# LinuxDO 登录模态框是否已弹出
+_LINUXDO_LOGIN_FORM_JS = """
+    (function() {
+        return !!document.querySelector('#login-account-name');
+    })()
+"""
+
+
+# 点击 LinuxDO 页头的登录按钮以弹出登录模态框
+_LINUXDO_OPEN_LOGIN_MODAL_JS = """
+    (function() {
+        // 查找登录按钮（多种可能的选择器）
+        const selectors = [
+            '.login-button',
+            'button.login-button',
+            '.header-buttons .login-button',
+            'a.login-button',
+            '[class*="login"]',
+            'button:contains("登录")',
+            'a:contains("登录")'
+        ];
+        for (const sel of selectors) {
+            try {
+                const btn = document.querySelector(sel);
+                if (btn && btn.offsetParent !== null) {
+                    btn.click();
+                    return 'clicked: ' + sel;
+                }
+            } catch (e) {}
+        }
+
+        // 备用：查找包含"登录"文字的按钮
+        const allButtons = document.querySelectorAll('button, a');
+        for (const btn of allButtons) {
+            const text = (btn.innerText || '').trim();
+            if (text === '登录' || text === 'Log In' || text === 'Login') {
+                btn.click();
+                return 'clicked text: ' + text;
+            }
+        }
+        return null;
+    })()
+"""
+
+
+# 读取 LinuxDO 登录表单的错误提示
+_LINUXDO_LOGIN_ERROR_JS = """
+    (function() {
+        const el = document.querySelector('.alert-error, .login-error');
+        return el ? el.innerText.trim() : '';
+    })()
+"""
+
+
+# 查找 provider 登录页上的 LinuxDO OAuth 按钮，返回 [x, y, w, h, 描述]
+# 页面内用 MutationObserver 标记 DOM 变化：上次未找到且 DOM 未变时直接返回 null，
+# 避免重试时反复对所有可点击元素读取 innerText（触发布局）；超过 2 秒仍强制重扫一次，
+# 兜底 CSS 加载完成等不产生 DOM 变更的可见性变化。
+_FIND_OAUTH_BUTTON_JS = r"""
+    (function() {
+        const scan = window.__linuxdoOauthScan || (window.__linuxdoOauthScan = { dirty: true, lastScan: 0 });
+        if (!scan.observer && document.documentElement) {
+            scan.observer = new MutationObserver(() => { scan.dirty = true; });
+            scan.observer.observe(document.documentElement, { childList: true, subtree: true, attributes: true });
+        }
+        if (!scan.dirty && Date.now() - scan.lastScan < 2000) return null;
+        scan.dirty = false;
+        scan.lastScan = Date.now();
+
+        function getRect(el, desc) {
+            const rect = el.getBoundingClientRect();
+            if (rect.width > 0 && rect.height > 0) {
+                return [rect.x, rect.y, rect.width, rect.height, desc];
+            }
+            return null;
+        }
+
+        // 策略1: 查找 href 包含 linuxdo 或 oauth 的链接
+        const links = document.querySelectorAll('a[href*="linuxdo"], a[href*="oauth/linuxdo"]');
+        for (const link of links) {
+            const r = getRect(link, 'link: ' + (link.href||'').substring(0,50));
+            if (r) return r;
+        }
+
+        // 策略2: 文本匹配 LINUX DO（多个模式合并为一个正则，每个元素只读取一次文本）
+        const allClickable = document.querySelectorAll('button, a, [role="button"], div[onclick], span[onclick]');
+        const texts = new Array(allClickable.length);
+        const textPattern = /linux\s*do|通过.*linux|使用.*linux|continue.*linux|login.*linux|第三方.*登录|其他.*登录|更多.*方式/i;
+        for (let i = 0; i < allClickable.length; i++) {
+            const el = allClickable[i];
+            texts[i] = el.innerText || '';
+            const text = (texts[i] || el.textContent || '').trim();
+            if (textPattern.test(text)) {
+                const r = getRect(el, 'text: ' + text.substring(0,30));
+                if (r) return r;
+            }
+        }
+
+        // 策略3: linuxdo 图标
+        const icons = document.querySelectorAll('img[src*="linuxdo"], svg[class*="linuxdo"]');
+        for (const icon of icons) {
+            const parent = icon.closest('button, a, [role="button"]') || icon.parentElement;
+            if (parent) {
+                const r = getRect(parent, 'icon-parent');
+                if (r) return r;
+            }
+        }
+
+        // 策略4: "使用...继续" 图标按钮（Wong 等），复用策略2读取的文本
+        const continuePattern = /使用.*继续|continue/i;
+        for (let i = 0; i < allClickable.length; i++) {
+            const el = allClickable[i];
+            const text = texts[i].replace(/\s+/g, '');
+            if (continuePattern.test(text)) {
+                if (el.querySelector('img, svg') || String(el.className).includes('tertiary')) {
+                    const r = getRect(el, 'icon-btn: ' + texts[i].trim().substring(0,20));
+                    if (r) return r;
+                }
+            }
+        }
+
+        // 策略5: 按钮内图片 alt/src 含 linux
+        const allBtns = document.querySelectorAll('button, a, [role="button"]');
+        for (const btn of allBtns) {
+            for (const img of btn.querySelectorAll('img')) {
+                const s = ((img.alt||'') + (img.src||'')).toLowerCase();
+                if (s.includes('linux') || s.includes('oauth') || s.includes('connect')) {
+                    const r = getRect(btn, 'img-btn: ' + (img.src||'').substring(0,30));
+                    if (r) return r;
+                }
+            }
+        }
+
+        return null;
+    })()
+"""
+
+
+# 点击 LinuxDO 授权页的"允许"按钮，返回 [动作, 按钮文字, 详情]
+_CLICK_OAUTH_ALLOW_JS = r"""
+    (function() {
+        const elements = document.querySelectorAll('a, button, input[type="submit"], [role="button"]');
+
+        // 查找"允许"按钮
+        let target = null;
+        for (const el of elements) {
+            const text = (el.innerText || el.value || el.textContent || '').trim();
+            if (/允许/.test(text) || /authorize/i.test(text) ||
+                /allow/i.test(text) || /accept/i.test(text)) {
+                target = el;
+                break;
+            }
+        }
+
+        // 兜底：红色按钮（LinuxDO 授权页的允许按钮是红色）
+        if (!target) {
+            for (const el of elements) {
+                const cls = el.className || '';
+                if (cls.includes('btn-danger') || cls.includes('bg-red')) {
+                    target = el;
+                    break;
+                }
+            }
+        }
+
+        if (!target) return null;
+
+        const text = (target.innerText || '').trim().substring(0, 10);
+
+        // 尝试1: 如果是 <a> 标签且有 href，直接导航（最可靠）
+        if (target.tagName === 'A' && target.href && !target.href.startsWith('javascript:')) {
+            const href = target.href;
+            window.location.href = href;
+            return ['navigated', text, href.substring(0, 80)];
+        }
+
+        // 尝试2: JS click
+        target.click();
+
+        // 尝试3: 如果是 form 内的按钮，提交表单
+        const form = target.closest('form');
+        if (form) {
+            form.submit();
+            return ['form-submitted', text, ''];
+        }
+
+        return ['clicked', text, ''];
+    })()
+"""
+
+
+# 读取 document.cookie 与 api_user：localStorage 优先，缺失时请求 /api/user/self（返回 JSON 字符串）
+_SESSION_STATE_JS = r"""
+    (async function() {
+        const result = { cookie: document.cookie || '', apiUser: null, source: null };
+
+        // NewAPI 将用户信息存储在 localStorage 的 'user' 键中
+        try {
+            const userStr = localStorage.getItem('user');
+            if (userStr) {
+                const user = JSON.parse(userStr);
+                if (user && user.id) {
+                    result.apiUser = String(user.id);
+                    result.source = 'localStorage';
+                }
+            }
+        } catch (e) {}
+
+        // 尝试其他可能的键名
+        if (!result.apiUser) {
+            for (const key of ['user_id', 'userId', 'new-api-user', 'api_user']) {
+                const val = localStorage.getItem(key);
+                if (val) {
+                    result.apiUser = val;
+                    result.source = 'localStorage';
+                    break;
+                }
+            }
+        }
+
+        // 仍然没有则调用 API 获取用户信息
+        if (!result.apiUser) {
+            try {
+                const resp = await fetch('/api/user/self', { credentials: 'include' });
+                const data = await resp.json();
+                if (data.success && data.data && data.data.id) {
+                    result.apiUser = String(data.data.id);
+                    result.source = 'api';
+                }
+            } catch (e) {}
+        }
+
+        return JSON.stringify(result);
+    })()
+"""
+
+
+def get_browser_concurrency() -> int:
+    """同时运行的 OAuth 浏览器数量上限（NEWAPI_BROWSER_CONCURRENCY，默认 3，每个 Chromium 约占 300MB 内存）"""
+    try:
+        return max(int(os.environ.get("NEWAPI_BROWSER_CONCURRENCY", "3")), 1)
+    except ValueError:
+        return 3
 
 
 def is_debug_mode() -> bool:
@@ -53,14 +463,26 @@ class NewAPIBrowserCheckin:
         cookies: dict | str | None = None,
         api_user: str | None = None,
         account_name: str | None = None,
+        browser_slots: asyncio.Semaphore | None = None,
+        browser_timeout: float | None = None,
+        linuxdo_login_lock: asyncio.Lock | None = None,
     ):
-        """初始化"""
+        """初始化
+
+        browser_slots 由调用方按每次运行创建并在并发签到间共享，用于限制同时运行的
+        OAuth 浏览器数量；为 None 时不限制。browser_timeout 从拿到名额后开始计时，
+        超时以 asyncio.TimeoutError 抛给调用方。linuxdo_login_lock 在同一 LinuxDO
+        账号的并发签到间共享，使密码登录只发生一次，其余签到复用缓存的 LinuxDO Cookie。
+        """
         self.provider_name = provider_name
         self.linuxdo_username = linuxdo_username
         self.linuxdo_password = linuxdo_password
         self._preset_cookies = self._parse_cookies(cookies)
         self._preset_api_user = api_user
         self._account_name = account_name or f"{provider_name}_{linuxdo_username or 'unknown'}"
+        self._browser_slots = browser_slots
+        self._browser_timeout = browser_timeout
+        self._linuxdo_login_lock = linuxdo_login_lock
 
         # 获取 provider 配置
         if provider_name in DEFAULT_PROVIDERS:
@@ -74,6 +496,7 @@ class NewAPIBrowserCheckin:
         self._api_user: str | None = None
         self._runtime_cookies: dict[str, str] = {}
         self._login_method: str = "unknown"
+        self._api_user_from_cache = False
 
         # Debug 模式
         self._debug = is_debug_mode()
@@ -102,6 +525,26 @@ class NewAPIBrowserCheckin:
     def account_name(self) -> str:
         return self._account_name
 
+    def _profile_dir(self) -> str | None:
+        """按站点 + LinuxDO 账号复用的 nodriver 配置目录
+
+        持久化 LinuxDO 登录态和 Cloudflare 验证结果，下次运行时 _login_linuxdo
+        直接命中“已登录”分支。设置 NEWAPI_NODRIVER_PERSIST_PROFILE=false 关闭。
+        配置目录含登录 Cookie，默认放在用户缓存目录（~/.cache/sign-in/newapi_profiles），
+        可用 NEWAPI_NODRIVER_PROFILE_DIR 覆盖。
+        """
+        persist_profile = os.environ.get("NEWAPI_NODRIVER_PERSIST_PROFILE", "true").lower() == "true"
+        if not persist_profile:
+            return None
+        profile_root = Path(os.environ.get("NEWAPI_NODRIVER_PROFILE_DIR") or user_cache_dir("newapi_profiles"))
+        account_key = hashlib.sha1(
+            f"{self.provider_name}:{self.linuxdo_username or ''}".encode("utf-8")
+        ).hexdigest()[:16]
+        profile_dir = profile_root / f"{self.provider_name}_{account_key}"
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        logger.info(f"[{self.account_name}] nodriver 复用配置目录: {profile_dir}")
+        return str(profile_dir)
+
     async def _save_debug_screenshot(self, tab, name: str) -> None:
         """保存调试截图（仅在 debug 模式下）"""
         if not self._debug or not self._debug_dir:
@@ -126,15 +569,27 @@ class NewAPIBrowserCheckin:
         except Exception as e:
             logger.debug(f"[{self._account_name}] [{context}] 获取页面信息失败: {e}")
 
-    async def _safe_evaluate(self, tab, script: str, *, timeout: int = 10, label: str = "evaluate", default=None):
-        """带超时保护的 evaluate，避免单次 evaluate 卡死整个 OAuth 流程。"""
+    async def _safe_evaluate(
+        self,
+        tab,
+        script: str,
+        *,
+        timeout: int = 10,
+        label: str = "evaluate",
+        default=None,
+        await_promise: bool = False,
+    ):
+        """带超时保护的 evaluate，避免单次 evaluate 卡死整个 OAuth 流程。
+
+        脚本返回 Promise（async 函数）时需传 await_promise=True 取回结果。
+        """
         try:
-            return await asyncio.wait_for(tab.evaluate(script), timeout=timeout)
+            return await asyncio.wait_for(tab.evaluate(script, await_promise=await_promise), timeout=timeout)
         except asyncio.TimeoutError:
             logger.warning(f"[{self.account_name}] {label} 超时({timeout}s)，已跳过")
             return default
         except Exception as e:
-            logger.debug(f"[{self.account_name}] {label} 失败: {e}")
+            logger.debug("[{}] {} 失败: {}", self.account_name, label, e)
             return default
 
     async def _safe_get(self, tab, url: str, *, timeout: int = 45, label: str = "navigate") -> bool:
@@ -247,8 +702,10 @@ class NewAPIBrowserCheckin:
                     logger.info(f"[{self.account_name}] 从 cookie 键 {key} 推断 api_user: {resolved_api_user}")
                     break
 
+        # 预探测命中 user_info 接口时复用其响应，避免同一接口请求两次
+        user_info_response: httpx.Response | None = None
         if not resolved_api_user:
-            resolved_api_user = await self._resolve_api_user_via_http(cookies)
+            resolved_api_user, user_info_response = await self._resolve_api_user_via_http(cookies)
             if resolved_api_user:
                 logger.info(f"[{self.account_name}] 通过 HTTP 预探测补全 api_user: {resolved_api_user}")
 
@@ -264,11 +721,14 @@ class NewAPIBrowserCheckin:
                 user_info_url = f"{self.provider.domain}{self.provider.user_info_path}"
                 logger.info(f"[{self.account_name}] 获取用户信息: {user_info_url}")
 
-                response = await client.get(user_info_url, headers=headers)
+                if user_info_response is not None:
+                    response = user_info_response
+                else:
+                    response = await client.get(user_info_url, headers=headers)
 
                 if response.status_code == 200:
                     try:
-                        data = response.json()
+                        data = _json.loads(response.content)
                     except Exception:
                         data = {}
                     if isinstance(data, dict) and data.get("success") is False:
@@ -311,13 +771,11 @@ class NewAPIBrowserCheckin:
                     response = await client.post(checkin_url, headers=headers)
 
                     if response.status_code == 200:
-                        data = response.json()
+                        data = _json.loads(response.content)
                         msg = data.get("message") or data.get("msg") or ""
                         if data.get("success") or "已签到" in msg or "签到成功" in msg:
                             logger.success(f"[{self.account_name}] {msg or '签到成功'}")
                             return True, msg or "签到成功", details
-                        elif "已签到" in msg:
-                            return True, msg, details
                         details["failure_kind"] = "checkin_rejected"
                         return False, msg or "签到失败", details
                     elif response.status_code == 401:
@@ -359,8 +817,15 @@ class NewAPIBrowserCheckin:
                     return str(value).strip()
         return None
 
-    async def _resolve_api_user_via_http(self, cookies: dict[str, str]) -> str | None:
-        """通过若干常见接口补全 api_user（用于 session 已拿到但 id 缺失场景）。"""
+    async def _resolve_api_user_via_http(
+        self, cookies: dict[str, str]
+    ) -> tuple[str | None, httpx.Response | None]:
+        """通过若干常见接口补全 api_user（用于 session 已拿到但 id 缺失场景）。
+
+        Returns:
+            (api_user, 响应)：api_user 来自 provider 的 user_info 接口时同时返回该响应，
+            供调用方直接复用，否则响应为 None
+        """
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
             "Accept": "application/json",
@@ -394,15 +859,15 @@ class NewAPIBrowserCheckin:
                     if response.status_code != 200:
                         continue
                     try:
-                        payload = response.json()
+                        payload = _json.loads(response.content)
                     except Exception:
                         continue
                     api_user = self._extract_api_user_from_payload(payload)
                     if api_user:
-                        return api_user
+                        return api_user, response if path == self.provider.user_info_path else None
         except Exception as e:
             logger.debug(f"[{self.account_name}] HTTP 补全 api_user 失败: {e}")
-        return None
+        return None, None
 
     @staticmethod
     def _to_float(val) -> float:
@@ -449,214 +914,187 @@ class NewAPIBrowserCheckin:
         1. 先等 3 秒让非交互式挑战（5 秒盾）自动完成
         2. 如果还在 CF 页面，多种方式定位 Turnstile checkbox 并点击
         3. 最多点击 5 次，每次间隔 5 秒等待验证结果
+
+        轮询间隔按 _CF_POLL_SCHEDULE 前密后疏（挑战大多在前几秒完成），
+        页面加载完成事件（Page.frameStoppedLoading）会提前结束等待；
+        主文档仍在加载时不做判定，直接等待加载完成事件。
         """
         logger.info(f"[{self.account_name}] 检测 Cloudflare 挑战...")
-        start_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         turnstile_click_count = 0
         max_turnstile_clicks = 5
         # 先等一小段时间让非交互式挑战自动完成
         initial_wait_done = False
         # 某些页面会残留隐藏的 cf DOM（并非真实挑战），避免因此误判卡死
-        stable_non_cf_rounds = 0
+        stable_non_cf_since: float | None = None
+        poll_index = 0
+        first_probe = True
 
-        while asyncio.get_event_loop().time() - start_time < timeout:
+        load_event = asyncio.Event()
+        load_handler = self._add_load_listener(tab, load_event)
+
+        async def pause(seconds: float) -> None:
+            """等待指定秒数，主框架加载完成时提前返回"""
             try:
-                title = await tab.evaluate("document.title")
-                title_lower = title.lower() if title else ""
-                current_url = await tab.evaluate("window.location.href")
-                current_url_lower = current_url.lower() if current_url else ""
-
-                # 检测是否仍在 Cloudflare 挑战页面（标题匹配）
-                cf_indicators = [
-                    "just a moment", "checking your browser", "please wait",
-                    "verifying", "checking", "challenge", "attention required",
-                    "请稍候", "验证", "确认",
-                ]
-                is_cf_title = any(ind in title_lower for ind in cf_indicators)
-                is_cf_url = "/cdn-cgi/challenge" in current_url_lower or "challenges.cloudflare.com" in current_url_lower
+                await asyncio.wait_for(load_event.wait(), timeout=seconds)
+            except asyncio.TimeoutError:
+                pass
+            load_event.clear()
 
-                # 检测 Turnstile iframe 或容器是否存在（DOM 匹配）
-                has_cf_element = await tab.evaluate(r"""
-                    (function() {
-                        // 方法1: 查找 cloudflare challenge iframe
-                        const iframes = document.querySelectorAll('iframe');
-                        for (const iframe of iframes) {
-                            const src = (iframe.src || '').toLowerCase();
-                            if (!(src.includes('cloudflare') || src.includes('challenges.cloudflare.com'))) {
-                                continue;
-                            }
-                            const rect = iframe.getBoundingClientRect();
-                            const visible = rect.width > 0 && rect.height > 0;
-                            if (visible) return true;
-                        }
-                        // 方法2: 查找可见的 Cloudflare 挑战容器
-                        const selectors = [
-                            '.cf-turnstile',
-                            '#cf-turnstile',
-                            '#challenge-running',
-                            '#challenge-stage',
-                            '#cf-wrapper'
-                        ];
-                        for (const sel of selectors) {
-                            const el = document.querySelector(sel);
-                            if (!el) continue;
-                            const rect = el.getBoundingClientRect();
-                            const style = window.getComputedStyle(el);
-                            const visible = (
-                                rect.width > 0 &&
-                                rect.height > 0 &&
-                                style.display !== 'none' &&
-                                style.visibility !== 'hidden' &&
-                                Number(style.opacity || '1') > 0
-                            );
-                            if (visible) return true;
-                        }
-                        return false;
-                    })()
-                """)
+        def next_interval() -> float:
+            nonlocal poll_index
+            interval = _CF_POLL_SCHEDULE[min(poll_index, len(_CF_POLL_SCHEDULE) - 1)]
+            poll_index += 1
+            return interval
 
-                # 若标题/URL 已不是挑战态，即便有残留 cf DOM，也允许稳定后通过
-                if not is_cf_title and not is_cf_url and title:
-                    stable_non_cf_rounds += 1
-                else:
-                    stable_non_cf_rounds = 0
+        try:
+            while loop.time() - start_time < timeout:
+                try:
+                    # 标题、URL 和挑战元素一次 evaluate 取回
+                    raw_state = await tab.evaluate(_CF_STATE_JS)
+                    if isinstance(raw_state, dict):
+                        raw_state = raw_state.get("value")
+                    state = _json.loads(raw_state) if isinstance(raw_state, str) else {}
+
+                    # 主文档未解析完：此时的标题多为过渡态，等加载完成事件后再判定
+                    if state.get("loading"):
+                        await pause(_CF_LOADING_WAIT_SEC if load_handler is not None else next_interval())
+                        continue
 
-                is_cf_page = is_cf_title or is_cf_url or has_cf_element
+                    title = state.get("title") or ""
+                    title_lower = title.lower()
+                    current_url_lower = (state.get("url") or "").lower()
+                    has_cf_element = bool(state.get("hasElement"))
 
-                # 常见成功态：完全没有挑战信号
-                if not is_cf_page and title:
-                    logger.success(f"[{self.account_name}] Cloudflare 验证通过！")
-                    await self._save_debug_screenshot(tab, "cf_passed")
-                    return True
+                    # 检测是否仍在 Cloudflare 挑战页面（标题匹配）
+                    is_cf_title = any(ind in title_lower for ind in _CF_TITLE_INDICATORS)
+                    is_cf_url = "/cdn-cgi/challenge" in current_url_lower or "challenges.cloudflare.com" in current_url_lower
 
-                # 兜底成功态：仅残留 cf DOM，但标题/URL 连续稳定为非挑战态
-                if has_cf_element and stable_non_cf_rounds >= 4:
-                    logger.info(
-                        f"[{self.account_name}] 检测到残留 Cloudflare DOM，"
-                        "标题/URL 连续稳定，按验证通过处理"
-                    )
-                    await self._save_debug_screenshot(tab, "cf_passed_residual_dom")
-                    return True
+                    # 若标题/URL 已不是挑战态，即便有残留 cf DOM，也允许稳定后通过
+                    if not is_cf_title and not is_cf_url and title:
+                        if stable_non_cf_since is None:
+                            stable_non_cf_since = loop.time()
+                    else:
+                        stable_non_cf_since = None
+
+                    is_cf_page = is_cf_title or is_cf_url or has_cf_element
+
+                    # 常见成功态：完全没有挑战信号
+                    if not is_cf_page and title:
+                        logger.success(f"[{self.account_name}] Cloudflare 验证通过！")
+                        await self._save_debug_screenshot(tab, "cf_passed")
+                        return True
+
+                    # 首次探测即为非挑战标题/URL 且已持有 cf_clearance（会话/缓存复用），
+                    # 残留 cf DOM 不必再等 _CF_RESIDUAL_STABLE_SEC
+                    if (
+                        first_probe
+                        and stable_non_cf_since is not None
+                        and self._browser_manager is not None
+                        and await self._browser_manager.has_cf_clearance(state.get("url") or "", tab=tab)
+                    ):
+                        logger.success(f"[{self.account_name}] 已持有 cf_clearance，跳过 Cloudflare 等待")
+                        return True
+                    first_probe = False
+
+                    # 兜底成功态：仅残留 cf DOM，但标题/URL 连续稳定为非挑战态
+                    if (
+                        has_cf_element
+                        and stable_non_cf_since is not None
+                        and loop.time() - stable_non_cf_since >= _CF_RESIDUAL_STABLE_SEC
+                    ):
+                        logger.info(
+                            f"[{self.account_name}] 检测到残留 Cloudflare DOM，"
+                            "标题/URL 连续稳定，按验证通过处理"
+                        )
+                        await self._save_debug_screenshot(tab, "cf_passed_residual_dom")
+                        return True
+
+                    # 前 3 秒只等待，不点击（让非交互式挑战自动完成）
+                    elapsed = loop.time() - start_time
+                    if not initial_wait_done and elapsed < 3:
+                        logger.debug("[{}] 等待非交互式挑战自动完成... ({:.0f}s)", self.account_name, elapsed)
+                        await pause(next_interval())
+                        continue
+                    initial_wait_done = True
+
+                    if is_cf_page and turnstile_click_count < max_turnstile_clicks:
+                        # 多种方式定位 Turnstile checkbox
+                        iframe_rect = await tab.evaluate(_TURNSTILE_RECT_JS)
+
+                        if iframe_rect and isinstance(iframe_rect, (list, tuple)) and len(iframe_rect) >= 4:
+                            try:
+                                x = self._to_float(iframe_rect[0])
+                                y = self._to_float(iframe_rect[1])
+                                w = self._to_float(iframe_rect[2])
+                                h = self._to_float(iframe_rect[3])
+                                method = iframe_rect[4] if len(iframe_rect) > 4 else 'N/A'
+
+                                # checkbox 在元素内左侧偏移约 30px, 垂直居中
+                                # 对于 managed-page-guess 和 checkbox-label，点击元素左侧
+                                if method in ('checkbox-label', 'managed-page-guess'):
+                                    click_x = x + 15
+                                    click_y = y + h / 2
+                                else:
+                                    click_x = x + 30
+                                    click_y = y + h / 2
+
+                                logger.info(
+                                    f"[{self.account_name}] 发现 Turnstile "
+                                    f"({method}, pos: {x:.0f},{y:.0f}, size: {w:.0f}x{h:.0f}), "
+                                    f"点击 ({click_x:.0f}, {click_y:.0f})"
+                                )
 
-                # 前 3 秒只等待，不点击（让非交互式挑战自动完成）
-                elapsed = asyncio.get_event_loop().time() - start_time
-                if not initial_wait_done and elapsed < 3:
-                    logger.debug(f"[{self.account_name}] 等待非交互式挑战自动完成... ({elapsed:.0f}s)")
-                    await asyncio.sleep(1)
-                    continue
-                initial_wait_done = True
-
-                if is_cf_page and turnstile_click_count < max_turnstile_clicks:
-                    # 多种方式定位 Turnstile checkbox
-                    iframe_rect = await tab.evaluate(r"""
-                        (function() {
-                            const iframes = document.querySelectorAll('iframe');
-
-                            // 策略1: 查找 src 包含 cloudflare 的 iframe（最可靠）
-                            for (const iframe of iframes) {
-                                const src = (iframe.src || '').toLowerCase();
-                                if (src.includes('cloudflare')) {
-                                    const rect = iframe.getBoundingClientRect();
-                                    if (rect.width > 0 && rect.height > 0) {
-                                        return [rect.x, rect.y, rect.width, rect.height, 'cf-iframe'];
-                                    }
-                                }
-                            }
+                                await tab.mouse_click(click_x, click_y)
+                                turnstile_click_count += 1
+                                logger.info(f"[{self.account_name}] 已点击 Turnstile (第 {turnstile_click_count} 次)")
+                                await pause(5)  # 等待验证结果（主框架加载完成时提前返回）
+                            except Exception as e:
+                                logger.debug("[{}] 点击 Turnstile 失败: {}", self.account_name, e)
+                        else:
+                            logger.debug("[{}] 未找到 Turnstile iframe/容器，等待...", self.account_name)
 
-                            // 策略2: .cf-turnstile / div[data-sitekey] 容器
-                            const container = document.querySelector('.cf-turnstile') ||
-                                              document.querySelector('div[data-sitekey]') ||
-                                              document.querySelector('#cf-turnstile') ||
-                                              document.querySelector('#challenge-stage');
-                            if (container) {
-                                const rect = container.getBoundingClientRect();
-                                if (rect.width > 0 && rect.height > 0) {
-                                    return [rect.x, rect.y, rect.width, rect.height, 'cf-container'];
-                                }
-                            }
+                        # 注意：CF 冻结页面上截图会挂起 60 秒+，不在循环中截图
+                except Exception as e:
+                    logger.debug("[{}] 检查页面状态出错: {}", self.account_name, e)
+                await pause(next_interval())
 
-                            // 策略3: 查找 Turnstile 尺寸的 iframe（宽 280-350, 高 50-80）
-                            for (const iframe of iframes) {
-                                const rect = iframe.getBoundingClientRect();
-                                if (rect.width >= 280 && rect.width <= 350 &&
-                                    rect.height >= 50 && rect.height <= 80) {
-                                    return [rect.x, rect.y, rect.width, rect.height, 'size-match-iframe'];
-                                }
-                            }
+            logger.warning(f"[{self.account_name}] Cloudflare 验证超时")
+            return False
+        finally:
+            self._remove_load_listener(tab, load_handler)
 
-                            // 策略4: 放宽尺寸匹配 — 任何可见的小 iframe
-                            for (const iframe of iframes) {
-                                const rect = iframe.getBoundingClientRect();
-                                if (rect.width >= 200 && rect.width <= 500 &&
-                                    rect.height >= 40 && rect.height <= 120 &&
-                                    rect.y > 0) {
-                                    return [rect.x, rect.y, rect.width, rect.height, 'any-small-iframe'];
-                                }
-                            }
+    @staticmethod
+    def _add_load_listener(tab, event: asyncio.Event):
+        """订阅 Page.frameStoppedLoading，主框架加载完成时置位 event；不支持时返回 None
 
-                            // 策略5: 在托管挑战页面上，查找 checkbox 容器
-                            // 托管页面整页都是 CF 挑战，checkbox 在页面中部偏上
-                            const bodyText = document.body?.innerText || '';
-                            if (bodyText.includes('确认您是真人') || bodyText.includes('verify you are human')) {
-                                // 查找包含复选框的 label 或 span
-                                const labels = document.querySelectorAll('label, span, div');
-                                for (const el of labels) {
-                                    const text = (el.innerText || '').trim();
-                                    if (text === '确认您是真人' || text === 'Verify you are human') {
-                                        const rect = el.getBoundingClientRect();
-                                        if (rect.width > 0 && rect.height > 0) {
-                                            return [rect.x, rect.y, rect.width, rect.height, 'checkbox-label'];
-                                        }
-                                    }
-                                }
-                                // 最后兜底：返回页面上 checkbox 区域的大致位置
-                                // 托管挑战页面的 checkbox 通常在 (215, 175) 附近，宽 170, 高 25
-                                return [215, 170, 170, 30, 'managed-page-guess'];
-                            }
+        Turnstile 等子 iframe 的加载事件会被忽略，否则点击 checkbox 后 widget 重新加载
+        就会提前结束等待。CDP 中主框架的 frame_id 与标签页的 target_id 相同。
+        """
+        try:
+            main_frame_id = getattr(tab.target, "target_id", None)
 
-                            return null;
-                        })()
-                    """)
-
-                    if iframe_rect and isinstance(iframe_rect, (list, tuple)) and len(iframe_rect) >= 4:
-                        try:
-                            x = self._to_float(iframe_rect[0])
-                            y = self._to_float(iframe_rect[1])
-                            w = self._to_float(iframe_rect[2])
-                            h = self._to_float(iframe_rect[3])
-                            method = iframe_rect[4] if len(iframe_rect) > 4 else 'N/A'
-
-                            # checkbox 在元素内左侧偏移约 30px, 垂直居中
-                            # 对于 managed-page-guess 和 checkbox-label，点击元素左侧
-                            if method in ('checkbox-label', 'managed-page-guess'):
-                                click_x = x + 15
-                                click_y = y + h / 2
-                            else:
-                                click_x = x + 30
-                                click_y = y + h / 2
-
-                            logger.info(
-                                f"[{self.account_name}] 发现 Turnstile "
-                                f"({method}, pos: {x:.0f},{y:.0f}, size: {w:.0f}x{h:.0f}), "
-                                f"点击 ({click_x:.0f}, {click_y:.0f})"
-                            )
-
-                            await tab.mouse_click(click_x, click_y)
-                            turnstile_click_count += 1
-                            logger.info(f"[{self.account_name}] 已点击 Turnstile (第 {turnstile_click_count} 次)")
-                            await asyncio.sleep(5)  # 等待验证结果
-                        except Exception as e:
-                            logger.debug(f"[{self.account_name}] 点击 Turnstile 失败: {e}")
-                    else:
-                        logger.debug(f"[{self.account_name}] 未找到 Turnstile iframe/容器，等待...")
+            def handler(evt) -> None:
+                if main_frame_id is not None and getattr(evt, "frame_id", None) != main_frame_id:
+                    return
+                event.set()
 
-                    # 注意：CF 冻结页面上截图会挂起 60 秒+，不在循环中截图
-            except Exception as e:
-                logger.debug(f"[{self.account_name}] 检查页面状态出错: {e}")
-            await asyncio.sleep(2)
+            tab.add_handler(cdp_page.FrameStoppedLoading, handler)
+            return handler
+        except Exception as e:
+            logger.debug(f"订阅页面加载事件失败，退回纯轮询: {e}")
+            return None
 
-        logger.warning(f"[{self.account_name}] Cloudflare 验证超时")
-        return False
+    @staticmethod
+    def _remove_load_listener(tab, handler) -> None:
+        """取消 _add_load_listener 注册的事件处理器"""
+        if handler is None:
+            return
+        try:
+            tab.remove_handler(cdp_page.FrameStoppedLoading, handler)
+        except Exception as e:
+            logger.debug(f"取消页面加载事件订阅失败: {e}")
 
     async def _wait_for_cloudflare_with_retry(self, tab, max_retries: int = 5) -> bool:
         """带重试的 Cloudflare 验证（核心策略：多刷新多尝试，nodriver 有概率绕过）
@@ -721,6 +1159,9 @@ class NewAPIBrowserCheckin:
         Discourse 论坛的登录表单是模态框形式，访问 /login 会自动触发模态框。
         如果模态框没有自动弹出，需要手动点击登录按钮。
         """
+        # 0. 注入缓存的 LinuxDO Cookie，有效时首页即为已登录状态
+        cookies_restored = await self._restore_linuxdo_cookies(tab)
+
         # 1. 先访问首页，让 Cloudflare 验证
         logger.info(f"[{self.account_name}] 访问 LinuxDO 首页...")
         await tab.get(self.LINUXDO_URL)
@@ -735,37 +1176,31 @@ class NewAPIBrowserCheckin:
 
         # 检查是否已经登录
         try:
-            is_logged_in = await tab.evaluate("""
-                (function() {
-                    const userMenu = document.querySelector('.current-user');
-                    return !!userMenu;
-                })()
-            """)
+            is_logged_in = await tab.evaluate(_LINUXDO_LOGGED_IN_JS)
             if is_logged_in:
                 logger.success(f"[{self.account_name}] LinuxDO 已登录")
                 await self._save_debug_screenshot(tab, "linuxdo_already_logged")
+                await self._save_linuxdo_cookies(tab)
                 return True
         except Exception:
             pass
 
+        if cookies_restored:
+            logger.info(f"[{self.account_name}] 缓存的 LinuxDO Cookie 已失效，重新登录")
+            LinuxDOSessionCache().invalidate(self.linuxdo_username)
+
         # 3. 访问登录页面（Discourse 会自动弹出登录模态框）
         logger.info(f"[{self.account_name}] 访问登录页面...")
         await tab.get(self.LINUXDO_LOGIN_URL)
-
-        # 等待页面加载完成
-        await asyncio.sleep(3)
         await self._log_page_info(tab, "linuxdo_login_page")
         await self._save_debug_screenshot(tab, "linuxdo_login_page")
 
-        # 4. 等待登录表单加载（模态框形式）
+        # 4. 等待登录表单加载（模态框形式）。表单一出现即继续，不再先固定等待 3 秒，
+        #    总等待时间与原先（3 秒 + 15 次轮询）相同
         login_form_found = False
-        for attempt in range(15):  # 增加到 15 次尝试
+        for attempt in range(18):
             try:
-                has_input = await tab.evaluate("""
-                    (function() {
-                        return !!document.querySelector('#login-account-name');
-                    })()
-                """)
+                has_input = await tab.evaluate(_LINUXDO_LOGIN_FORM_JS)
                 if has_input:
                     logger.info(f"[{self.account_name}] 登录表单已加载")
                     login_form_found = True
@@ -774,43 +1209,10 @@ class NewAPIBrowserCheckin:
                 pass
 
             # 如果表单没出现，尝试点击登录按钮触发模态框
-            if attempt == 5:
+            if attempt == 8:
                 logger.info(f"[{self.account_name}] 尝试点击登录按钮触发模态框...")
                 try:
-                    clicked = await tab.evaluate("""
-                        (function() {
-                            // 查找登录按钮（多种可能的选择器）
-                            const selectors = [
-                                '.login-button',
-                                'button.login-button',
-                                '.header-buttons .login-button',
-                                'a.login-button',
-                                '[class*="login"]',
-                                'button:contains("登录")',
-                                'a:contains("登录")'
-                            ];
-                            for (const sel of selectors) {
-                                try {
-                                    const btn = document.querySelector(sel);
-                                    if (btn && btn.offsetParent !== null) {
-                                        btn.click();
-                                        return 'clicked: ' + sel;
-                                    }
-                                } catch (e) {}
-                            }
-                            
-                            // 备用：查找包含"登录"文字的按钮
-                            const allButtons = document.querySelectorAll('button, a');
-                            for (const btn of allButtons) {
-                                const text = (btn.innerText || '').trim();
-                                if (text === '登录' || text === 'Log In' || text === 'Login') {
-                                    btn.click();
-                                    return 'clicked text: ' + text;
-                                }
-                            }
-                            return null;
-                        })()
-                    """)
+                    clicked = await tab.evaluate(_LINUXDO_OPEN_LOGIN_MODAL_JS)
                     if clicked:
                         logger.info(f"[{self.account_name}] {clicked}")
                         await asyncio.sleep(2)
@@ -824,100 +1226,235 @@ class NewAPIBrowserCheckin:
             await self._save_debug_screenshot(tab, "login_form_not_found")
             return False
 
-        # 5. 使用 JS 直接赋值填写表单（参考 linuxdo.py，比 send_keys 更可靠）
+        # 5. 使用 JS 直接赋值填写表单（参考 linuxdo.py，一次 evaluate 填完两个输入框，
+        #    比 send_keys 逐字符输入少 N 次 CDP 往返）；失败时退回 Input.insertText
+        fill_result = await self._fill_login_form_js(tab)
+        if fill_result != "success":
+            logger.warning(f"[{self.account_name}] JS 填写表单失败({fill_result})，改用 Input.insertText")
+            if not await self._fill_login_form_insert_text(tab):
+                logger.error(f"[{self.account_name}] 填写表单失败")
+                return False
+        logger.info(f"[{self.account_name}] 已填写用户名和密码")
+
+        # 6-7. 点击登录按钮并等待跳转
+        if not await self._submit_linuxdo_login(tab):
+            return False
+
+        logger.success(f"[{self.account_name}] LinuxDO 登录成功！")
+        await self._save_debug_screenshot(tab, "linuxdo_login_success")
+        await self._save_linuxdo_cookies(tab)
+        return True
+
+    async def _submit_linuxdo_login(self, tab, timeout: float = 60) -> bool:
+        """点击登录按钮并等待离开登录页
+
+        订阅 Page.frameNavigated，主框架跳出 /login 时立即返回 True，
+        调用方可马上开始 OAuth 导航；登录错误提示仍每 5 秒检查一次。
+        返回 False 表示点击失败、出现登录错误或超时后仍停留在登录页。
+        """
+        logger.info(f"[{self.account_name}] 点击登录按钮...")
+        await self._save_debug_screenshot(tab, "before_login_click")
+        navigated = asyncio.Event()
+        nav_handler = self._add_navigation_listener(tab, navigated)
+        try:
+            try:
+                clicked = await tab.evaluate("""
+                    (function() {
+                        const btn = document.querySelector('#login-button');
+                        if (btn) { btn.click(); return true; }
+                        return false;
+                    })()
+                """)
+                if not clicked:
+                    logger.error(f"[{self.account_name}] 未找到登录按钮")
+                    await self._save_debug_screenshot(tab, "login_button_not_found")
+                    return False
+            except Exception as e:
+                logger.error(f"[{self.account_name}] 点击登录失败: {e}")
+                return False
+
+            # 7. 等待登录完成（跳转事件触发即返回，最长 timeout 秒）
+            logger.info(f"[{self.account_name}] 等待登录完成...")
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            next_error_check = 1.0
+            next_report = 10.0
+            while (elapsed := loop.time() - started) < timeout:
+                current_url = tab.target.url if hasattr(tab, "target") else ""
+                if navigated.is_set() or self._is_linuxdo_home_url(current_url):
+                    # 已离开登录页即视为成功，不再额外等待页面稳定，OAuth 导航可以立即开始
+                    logger.info(f"[{self.account_name}] 页面已跳转: {current_url}")
+                    return True
+
+                if elapsed >= next_error_check:
+                    next_error_check = elapsed + 5
+                    try:
+                        error_msg = await tab.evaluate(_LINUXDO_LOGIN_ERROR_JS)
+                        if error_msg:
+                            logger.error(f"[{self.account_name}] 登录错误: {error_msg}")
+                            await self._save_debug_screenshot(tab, "login_error")
+                            return False
+                    except Exception:
+                        pass
+
+                if elapsed >= next_report:
+                    next_report = elapsed + 10
+                    logger.debug(f"[{self.account_name}] 等待登录... ({elapsed:.0f}s)")
+                    if self._debug:
+                        await self._save_debug_screenshot(tab, f"login_waiting_{elapsed:.0f}s")
+
+                try:
+                    await asyncio.wait_for(navigated.wait(), timeout=1)
+                except asyncio.TimeoutError:
+                    pass
+
+            # 超时未观察到跳转：再给页面一点时间后做最终检查
+            await asyncio.sleep(2)
+            current_url = tab.target.url if hasattr(tab, "target") else ""
+            if "login" in current_url.lower():
+                logger.error(f"[{self.account_name}] 登录失败，仍在登录页面")
+                await self._save_debug_screenshot(tab, "login_failed_still_on_page")
+                return False
+            return True
+        finally:
+            self._remove_navigation_listener(tab, nav_handler)
+
+    @staticmethod
+    def _is_linuxdo_home_url(url: str) -> bool:
+        """URL 是否已离开 LinuxDO 登录页"""
+        return bool(url) and "linux.do" in url and "login" not in url.lower()
+
+    def _add_navigation_listener(self, tab, event: asyncio.Event):
+        """订阅 Page.frameNavigated，主框架跳出 LinuxDO 登录页时置位 event；不支持时返回 None"""
         try:
-            escaped_username = self.linuxdo_username.replace("\\", "\\\\").replace("'", "\\'")
-            escaped_password = self.linuxdo_password.replace("\\", "\\\\").replace("'", "\\'")
+            def handler(evt) -> None:
+                frame = getattr(evt, "frame", None)
+                if frame is None or getattr(frame, "parent_id", None):
+                    return
+                if self._is_linuxdo_home_url(getattr(frame, "url", "") or ""):
+                    event.set()
+
+            tab.add_handler(cdp_page.FrameNavigated, handler)
+            return handler
+        except Exception as e:
+            logger.debug(f"[{self.account_name}] 订阅页面跳转事件失败，退回纯轮询: {e}")
+            return None
 
-            fill_result = await tab.evaluate(f"""
+    @staticmethod
+    def _remove_navigation_listener(tab, handler) -> None:
+        """取消 _add_navigation_listener 注册的事件处理器"""
+        if handler is None:
+            return
+        try:
+            tab.remove_handler(cdp_page.FrameNavigated, handler)
+        except Exception as e:
+            logger.debug(f"取消页面跳转事件订阅失败: {e}")
+
+    async def _fill_login_form_js(self, tab) -> str:
+        """一次 evaluate 填写用户名和密码，返回 'success' 或错误描述"""
+        # json.dumps 生成合法的 JS 字符串字面量，密码中的引号/换行无需手工转义
+        username = json.dumps(self.linuxdo_username)
+        password = json.dumps(self.linuxdo_password)
+        try:
+            return await tab.evaluate(f"""
                 (function() {{
                     const usernameInput = document.querySelector('#login-account-name');
                     const passwordInput = document.querySelector('#login-account-password');
                     if (!usernameInput || !passwordInput) return 'error: inputs not found';
 
                     usernameInput.focus();
-                    usernameInput.value = '{escaped_username}';
+                    usernameInput.value = {username};
                     usernameInput.dispatchEvent(new Event('input', {{ bubbles: true }}));
                     usernameInput.dispatchEvent(new Event('change', {{ bubbles: true }}));
 
                     passwordInput.focus();
-                    passwordInput.value = '{escaped_password}';
+                    passwordInput.value = {password};
                     passwordInput.dispatchEvent(new Event('input', {{ bubbles: true }}));
                     passwordInput.dispatchEvent(new Event('change', {{ bubbles: true }}));
 
                     return 'success';
                 }})()
             """)
-
-            if fill_result != "success":
-                logger.error(f"[{self.account_name}] 填写表单失败: {fill_result}")
-                return False
-            logger.info(f"[{self.account_name}] 已填写用户名和密码")
         except Exception as e:
-            logger.error(f"[{self.account_name}] 填写表单失败: {e}")
-            return False
+            return f"error: {e}"
 
-        # 6. 点击登录按钮
-        logger.info(f"[{self.account_name}] 点击登录按钮...")
-        await self._save_debug_screenshot(tab, "before_login_click")
-        await asyncio.sleep(1)
+    async def _fill_login_form_insert_text(self, tab) -> bool:
+        """聚焦输入框后用 Input.insertText 一次性写入整段文本（每个字段一次 CDP 调用）"""
         try:
-            clicked = await tab.evaluate("""
-                (function() {
-                    const btn = document.querySelector('#login-button');
-                    if (btn) { btn.click(); return true; }
-                    return false;
-                })()
-            """)
-            if not clicked:
-                logger.error(f"[{self.account_name}] 未找到登录按钮")
-                await self._save_debug_screenshot(tab, "login_button_not_found")
-                return False
+            for selector, text in (
+                ("#login-account-name", self.linuxdo_username),
+                ("#login-account-password", self.linuxdo_password),
+            ):
+                focused = await tab.evaluate(f"""
+                    (function() {{
+                        const el = document.querySelector('{selector}');
+                        if (!el) return false;
+                        el.focus();
+                        el.select();
+                        return true;
+                    }})()
+                """)
+                if not focused:
+                    return False
+                await tab.send(cdp_input.insert_text(text=text))
+            return True
         except Exception as e:
-            logger.error(f"[{self.account_name}] 点击登录失败: {e}")
+            logger.debug(f"[{self.account_name}] Input.insertText 填写失败: {e}")
             return False
 
-        # 7. 等待登录完成
-        logger.info(f"[{self.account_name}] 等待登录完成...")
-        for i in range(60):
-            await asyncio.sleep(1)
-            current_url = tab.target.url if hasattr(tab, "target") else ""
-
-            if current_url and "login" not in current_url.lower() and "linux.do" in current_url:
-                logger.info(f"[{self.account_name}] 页面已跳转: {current_url}")
-                break
-
-            if i % 5 == 0:
-                try:
-                    error_msg = await tab.evaluate("""
-                        (function() {
-                            const el = document.querySelector('.alert-error, .login-error');
-                            return el ? el.innerText.trim() : '';
-                        })()
-                    """)
-                    if error_msg:
-                        logger.error(f"[{self.account_name}] 登录错误: {error_msg}")
-                        await self._save_debug_screenshot(tab, "login_error")
-                        return False
-                except Exception:
-                    pass
-
-            if i % 10 == 0:
-                logger.debug(f"[{self.account_name}] 等待登录... ({i}s)")
-                if self._debug and i > 0:
-                    await self._save_debug_screenshot(tab, f"login_waiting_{i}s")
+    async def _restore_linuxdo_cookies(self, tab) -> bool:
+        """将磁盘缓存的 LinuxDO Cookie 注入浏览器，返回是否注入成功"""
+        if not self.linuxdo_username:
+            return False
 
-        await asyncio.sleep(2)
-        current_url = tab.target.url if hasattr(tab, "target") else ""
+        cookies = LinuxDOSessionCache().get(self.linuxdo_username)
+        if not cookies:
+            return False
 
-        if "login" in current_url.lower():
-            logger.error(f"[{self.account_name}] 登录失败，仍在登录页面")
-            await self._save_debug_screenshot(tab, "login_failed_still_on_page")
+        try:
+            params = [
+                cdp_network.CookieParam(
+                    name=c["name"],
+                    value=c["value"],
+                    domain=c.get("domain"),
+                    path=c.get("path") or "/",
+                    secure=c.get("secure"),
+                    http_only=c.get("http_only"),
+                    expires=cdp_network.TimeSinceEpoch(c["expires"]) if (c.get("expires") or -1) > 0 else None,
+                )
+                for c in cookies
+            ]
+            await tab.send(cdp_network.set_cookies(cookies=params))
+            logger.info(f"[{self.account_name}] 已注入 {len(params)} 个缓存的 LinuxDO Cookie")
+            return True
+        except Exception as e:
+            logger.debug(f"[{self.account_name}] 注入 LinuxDO Cookie 失败: {e}")
             return False
 
-        logger.success(f"[{self.account_name}] LinuxDO 登录成功！")
-        await self._save_debug_screenshot(tab, "linuxdo_login_success")
-        return True
+    async def _save_linuxdo_cookies(self, tab) -> None:
+        """登录成功后缓存 linux.do 域下的 Cookie"""
+        if not self.linuxdo_username:
+            return
+
+        try:
+            cookies = await tab.send(cdp_network.get_cookies(urls=[self.LINUXDO_URL]))
+            records = [
+                {
+                    "name": c.name,
+                    "value": c.value,
+                    "domain": c.domain,
+                    "path": c.path,
+                    "secure": c.secure,
+                    "http_only": c.http_only,
+                    "expires": c.expires,
+                }
+                for c in cookies or []
+                if c.name and c.value
+            ]
+            if records:
+                LinuxDOSessionCache().save(self.linuxdo_username, records)
+        except Exception as e:
+            logger.debug(f"[{self.account_name}] 缓存 LinuxDO Cookie 失败: {e}")
 
     async def _oauth_login_and_get_session(self, tab) -> tuple[str | None, str | None]:
         """通过 LinuxDO OAuth 登录并获取 session 和 api_user"""
@@ -929,11 +1466,25 @@ class NewAPIBrowserCheckin:
             logger.info(f"[{self.account_name}] 直接 OAuth 导航: {oauth_url}")
             if not await self._safe_get(tab, oauth_url, timeout=45, label="direct_oauth_navigate"):
                 return None, None
-            await asyncio.sleep(5)
+
+            provider_host = self.provider.domain.replace("https://", "").replace("http://", "")
+
+            def tab_url() -> str:
+                return tab.target.url if hasattr(tab, "target") else ""
+
+            def landed() -> bool:
+                url = tab_url()
+                return provider_host in url and "oauth" not in url.lower()
+
+            def on_authorize_page() -> bool:
+                url = tab_url()
+                return "linux.do" in url and "authorize" in url.lower()
+
+            # 跳到授权页或已自动回到站点即继续，不再固定等待 5 秒
+            await wait_until(lambda: on_authorize_page() or landed(), timeout=5)
 
             # 检查是否到了授权页或已自动回来
-            current_url = tab.target.url if hasattr(tab, "target") else ""
-            if "linux.do" in current_url and "authorize" in current_url.lower():
+            if on_authorize_page():
                 logger.info(f"[{self.account_name}] 到达授权页，点击允许...")
                 await tab.evaluate(r"""
                     (function() {
@@ -947,26 +1498,20 @@ class NewAPIBrowserCheckin:
                         return false;
                     })()
                 """)
-                await asyncio.sleep(5)
 
-            # 等待所有重定向完成（OAuth callback → set cookie → /console）
-            provider_host = self.provider.domain.replace("https://", "").replace("http://", "")
-            for _redir_wait in range(15):
-                await asyncio.sleep(1)
-                current_url = tab.target.url if hasattr(tab, "target") else ""
-                if provider_host in current_url and "oauth" not in current_url.lower():
-                    logger.success(f"[{self.account_name}] 直接 OAuth 成功！URL: {current_url}")
-                    # 多等 2 秒确保 cookie 设置完成
-                    await asyncio.sleep(2)
-                    extracted_session, extracted_api_user = await self._extract_session_from_browser(tab)
-                    if extracted_session:
-                        return extracted_session, extracted_api_user
-                    logger.warning(
-                        f"[{self.account_name}] 直接 OAuth 已返回站点但未提取到 session，转入标准 OAuth 流程"
-                    )
-                    break
+            # 等待所有重定向完成（OAuth callback → set cookie → /console），到达即返回
+            if await wait_until(landed, timeout=20):
+                logger.success(f"[{self.account_name}] 直接 OAuth 成功！URL: {tab_url()}")
+                # 多等 2 秒确保 cookie 设置完成
+                await asyncio.sleep(2)
+                extracted_session, extracted_api_user = await self._extract_session_from_browser(tab)
+                if extracted_session:
+                    return extracted_session, extracted_api_user
+                logger.warning(
+                    f"[{self.account_name}] 直接 OAuth 已返回站点但未提取到 session，转入标准 OAuth 流程"
+                )
 
-            current_url = tab.target.url if hasattr(tab, "target") else ""
+            current_url = tab_url()
             if provider_host in current_url:
                 logger.success(f"[{self.account_name}] 直接 OAuth 成功（仍在 OAuth 路径）: {current_url}")
                 await asyncio.sleep(2)
@@ -1123,76 +1668,13 @@ class NewAPIBrowserCheckin:
         for attempt in range(10):
             try:
                 # 返回按钮位置 [x, y, w, h, description]，用于 mouse_click
-                btn_rect = await self._safe_evaluate(tab, r"""
-                    (function() {
-                        function getRect(el, desc) {
-                            const rect = el.getBoundingClientRect();
-                            if (rect.width > 0 && rect.height > 0) {
-                                return [rect.x, rect.y, rect.width, rect.height, desc];
-                            }
-                            return null;
-                        }
-
-                        // 策略1: 查找 href 包含 linuxdo 或 oauth 的链接
-                        const links = document.querySelectorAll('a[href*="linuxdo"], a[href*="oauth/linuxdo"]');
-                        for (const link of links) {
-                            const r = getRect(link, 'link: ' + (link.href||'').substring(0,50));
-                            if (r) return r;
-                        }
-
-                        // 策略2: 文本匹配 LINUX DO
-                        const allClickable = document.querySelectorAll('button, a, [role="button"], div[onclick], span[onclick]');
-                        const patterns = [
-                            /linux\s*do/i, /通过.*linux/i, /使用.*linux/i,
-                            /continue.*linux/i, /login.*linux/i,
-                            /第三方.*登录/i, /其他.*登录/i, /更多.*方式/i
-                        ];
-                        for (const el of allClickable) {
-                            const text = (el.innerText || el.textContent || '').trim();
-                            for (const pattern of patterns) {
-                                if (pattern.test(text)) {
-                                    const r = getRect(el, 'text: ' + text.substring(0,30));
-                                    if (r) return r;
-                                }
-                            }
-                        }
-
-                        // 策略3: linuxdo 图标
-                        const icons = document.querySelectorAll('img[src*="linuxdo"], svg[class*="linuxdo"]');
-                        for (const icon of icons) {
-                            const parent = icon.closest('button, a, [role="button"]') || icon.parentElement;
-                            if (parent) {
-                                const r = getRect(parent, 'icon-parent');
-                                if (r) return r;
-                            }
-                        }
-
-                        // 策略4: "使用...继续" 图标按钮（Wong 等）
-                        for (const el of allClickable) {
-                            const text = (el.innerText || '').replace(/\s+/g, '').trim();
-                            if (/使用.*继续/.test(text) || /continue/i.test(text)) {
-                                if (el.querySelector('img, svg') || el.className.includes('tertiary')) {
-                                    const r = getRect(el, 'icon-btn: ' + (el.innerText||'').trim().substring(0,20));
-                                    if (r) return r;
-                                }
-                            }
-                        }
-
-                        // 策略5: 按钮内图片 alt/src 含 linux
-                        const allBtns = document.querySelectorAll('button, a, [role="button"]');
-                        for (const btn of allBtns) {
-                            for (const img of btn.querySelectorAll('img')) {
-                                const s = ((img.alt||'') + (img.src||'')).toLowerCase();
-                                if (s.includes('linux') || s.includes('oauth') || s.includes('connect')) {
-                                    const r = getRect(btn, 'img-btn: ' + (img.src||'').substring(0,30));
-                                    if (r) return r;
-                                }
-                            }
-                        }
-
-                        return null;
-                    })()
-                """, timeout=8, label=f"find_oauth_button_attempt_{attempt+1}", default=None)
+                btn_rect = await self._safe_evaluate(
+                    tab,
+                    _FIND_OAUTH_BUTTON_JS,
+                    timeout=8,
+                    label=f"find_oauth_button_attempt_{attempt+1}",
+                    default=None,
+                )
 
                 if btn_rect and isinstance(btn_rect, (list, tuple)) and len(btn_rect) >= 4:
                     x = self._to_float(btn_rect[0])
@@ -1213,9 +1695,9 @@ class NewAPIBrowserCheckin:
                     clicked = True
                     break
 
-                logger.debug(f"[{self.account_name}] 第 {attempt + 1} 次尝试未找到 OAuth 按钮")
+                logger.debug("[{}] 第 {} 次尝试未找到 OAuth 按钮", self.account_name, attempt + 1)
             except Exception as e:
-                logger.debug(f"[{self.account_name}] 查找 OAuth 按钮出错: {e}")
+                logger.debug("[{}] 查找 OAuth 按钮出错: {}", self.account_name, e)
             await asyncio.sleep(1)
 
         if not clicked and not oauth_path:
@@ -1287,7 +1769,7 @@ class NewAPIBrowserCheckin:
                         clicked = True
                         break
                 except Exception as e:
-                    logger.debug(f"[{self.account_name}] 注册页查找 OAuth 按钮出错: {e}")
+                    logger.debug("[{}] 注册页查找 OAuth 按钮出错: {}", self.account_name, e)
                 await asyncio.sleep(1)
 
             if not clicked:
@@ -1296,21 +1778,106 @@ class NewAPIBrowserCheckin:
 
         # 等待 OAuth 授权
         logger.info(f"[{self.account_name}] 等待 OAuth 授权...")
-        await asyncio.sleep(3)
         browser = self._browser_manager.browser
 
-        # 处理授权页面（可能在新标签页）
-        for i in range(30):
-            # 检查新标签页
-            if len(browser.tabs) > 1:
-                for t in browser.tabs:
-                    t_url = t.target.url if hasattr(t, "target") else ""
-                    if "connect.linux.do" in t_url or "authorize" in t_url.lower():
-                        logger.info(f"[{self.account_name}] 找到授权标签页: {t_url}")
-                        await t.bring_to_front()
-                        tab = t
-                        await asyncio.sleep(1)
-                        break
+        # 订阅标签页创建/跳转事件：授权页或回调页出现时立即唤醒，而不是固定 sleep
+        target_landed = asyncio.Event()
+        target_handlers = self._add_target_listener(browser, target_landed)
+        try:
+            return await self._handle_oauth_authorize(
+                tab, browser, target_landed, event_driven=bool(target_handlers)
+            )
+        finally:
+            self._remove_target_listener(browser, target_handlers)
+
+    def _is_oauth_progress_url(self, url: str) -> bool:
+        """URL 是否为 OAuth 流程的下一站（LinuxDO 授权页或已登录的目标站点）"""
+        lowered = url.lower()
+        if "connect.linux.do" in url or ("linux.do" in url and "authorize" in lowered):
+            return True
+        return self.provider.domain in url and "login" not in lowered
+
+    def _add_target_listener(self, browser, event: asyncio.Event) -> list:
+        """订阅 Target.targetCreated/targetInfoChanged，出现 OAuth 相关 URL 时置位 event"""
+        try:
+            def handler(evt) -> None:
+                url = getattr(getattr(evt, "target_info", None), "url", "") or ""
+                if self._is_oauth_progress_url(url):
+                    event.set()
+
+            handlers = [(cdp_target.TargetCreated, handler), (cdp_target.TargetInfoChanged, handler)]
+            for event_type, h in handlers:
+                browser.connection.add_handler(event_type, h)
+            return handlers
+        except Exception as e:
+            logger.debug(f"[{self.account_name}] 订阅标签页事件失败，退回纯轮询: {e}")
+            return []
+
+    @staticmethod
+    def _remove_target_listener(browser, handlers: list) -> None:
+        """取消 _add_target_listener 注册的事件处理器"""
+        for event_type, handler in handlers:
+            try:
+                browser.connection.remove_handler(event_type, handler)
+            except Exception as e:
+                logger.debug(f"取消标签页事件订阅失败: {e}")
+
+    @staticmethod
+    async def _wait_for_event(event: asyncio.Event, timeout: float) -> bool:
+        """最多等待 timeout 秒，事件置位时提前返回；返回后清除事件以便下次等待"""
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            event.clear()
+
+    def _scan_oauth_tabs(self, browser, current_tab) -> tuple:
+        """单次遍历标签页，返回 (授权页标签, 已回到目标站点的标签)，未找到为 None"""
+        authorize_tab = None
+        landed_tab = None
+        for t in browser.tabs:
+            if t is current_tab:
+                continue
+            t_url = t.target.url if hasattr(t, "target") else ""
+            lowered = t_url.lower()
+            if authorize_tab is None and ("connect.linux.do" in t_url or "authorize" in lowered):
+                authorize_tab = t
+            elif landed_tab is None and self.provider.domain in t_url and "login" not in lowered:
+                landed_tab = t
+        return authorize_tab, landed_tab
+
+    async def _handle_oauth_authorize(
+        self, tab, browser, target_landed: asyncio.Event, timeout: float = 30, event_driven: bool = False
+    ) -> tuple[str | None, str | None]:
+        """处理 LinuxDO 授权页（可能在新标签页）直到回到目标站点
+
+        event_driven 为 True 时（已订阅 Target 事件），只在事件触发或每 5 秒兜底时扫描其他标签页。
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + timeout
+        await self._wait_for_event(target_landed, min(3, timeout))
+        next_report = 5
+        scan_tabs = True
+        while loop.time() < deadline:
+            # 检查其他标签页（授权页可能在新标签页打开，回调也可能落在其他标签页）
+            authorize_tab = landed_tab = None
+            if scan_tabs and len(browser.tabs) > 1:
+                authorize_tab, landed_tab = self._scan_oauth_tabs(browser, tab)
+
+            if landed_tab is not None:
+                await landed_tab.bring_to_front()
+                await self._save_debug_screenshot(landed_tab, "oauth_success")
+                return await self._extract_session_from_browser(landed_tab)
+
+            if authorize_tab is not None:
+                t_url = authorize_tab.target.url if hasattr(authorize_tab, "target") else ""
+                logger.info(f"[{self.account_name}] 找到授权标签页: {t_url}")
+                await authorize_tab.bring_to_front()
+                tab = authorize_tab
+                await asyncio.sleep(0.1)
 
             current_url = tab.target.url if hasattr(tab, "target") else ""
 
@@ -1350,56 +1917,9 @@ class NewAPIBrowserCheckin:
                     # 三种方式尝试点击"允许"按钮
                     # 策略1: JS click + 直接导航 href（最可靠）
                     # 策略2: mouse_click 物理点击（备选）
-                    click_result = await self._safe_evaluate(tab, r"""
-                        (function() {
-                            const elements = document.querySelectorAll('a, button, input[type="submit"], [role="button"]');
-
-                            // 查找"允许"按钮
-                            let target = null;
-                            for (const el of elements) {
-                                const text = (el.innerText || el.value || el.textContent || '').trim();
-                                if (/允许/.test(text) || /authorize/i.test(text) ||
-                                    /allow/i.test(text) || /accept/i.test(text)) {
-                                    target = el;
-                                    break;
-                                }
-                            }
-
-                            // 兜底：红色按钮（LinuxDO 授权页的允许按钮是红色）
-                            if (!target) {
-                                for (const el of elements) {
-                                    const cls = el.className || '';
-                                    if (cls.includes('btn-danger') || cls.includes('bg-red')) {
-                                        target = el;
-                                        break;
-                                    }
-                                }
-                            }
-
-                            if (!target) return null;
-
-                            const text = (target.innerText || '').trim().substring(0, 10);
-
-                            // 尝试1: 如果是 <a> 标签且有 href，直接导航（最可靠）
-                            if (target.tagName === 'A' && target.href && !target.href.startsWith('javascript:')) {
-                                const href = target.href;
-                                window.location.href = href;
-                                return ['navigated', text, href.substring(0, 80)];
-                            }
-
-                            // 尝试2: JS click
-                            target.click();
-
-                            // 尝试3: 如果是 form 内的按钮，提交表单
-                            const form = target.closest('form');
-                            if (form) {
-                                form.submit();
-                                return ['form-submitted', text, ''];
-                            }
-
-                            return ['clicked', text, ''];
-                        })()
-                    """, timeout=8, label="click_oauth_authorize", default=None)
+                    click_result = await self._safe_evaluate(
+                        tab, _CLICK_OAUTH_ALLOW_JS, timeout=8, label="click_oauth_authorize", default=None
+                    )
                     if click_result and isinstance(click_result, (list, tuple)):
                         action = click_result[0] if len(click_result) > 0 else '?'
                         text = click_result[1] if len(click_result) > 1 else '?'
@@ -1415,31 +1935,61 @@ class NewAPIBrowserCheckin:
                             f"[{self.account_name}] 授权按钮操作: {action} "
                             f"(按钮: {text}) {detail}"
                         )
-                        await asyncio.sleep(3)
+                        await self._wait_for_event(target_landed, 3)
                     else:
                         logger.warning(f"[{self.account_name}] 未找到允许按钮")
                 except Exception as e:
                     logger.warning(f"[{self.account_name}] 点击允许按钮失败: {e}")
 
-            # 检查所有标签页是否有已登录的
-            for t in browser.tabs:
-                t_url = t.target.url if hasattr(t, "target") else ""
-                if self.provider.domain in t_url and "login" not in t_url.lower():
-                    await t.bring_to_front()
-                    await self._save_debug_screenshot(t, "oauth_success")
-                    return await self._extract_session_from_browser(t)
-
-            await asyncio.sleep(1)
-            if i % 5 == 0 and i > 0:
+            fired = await self._wait_for_event(target_landed, min(1.0, max(0.0, deadline - loop.time())))
+            elapsed = int(loop.time() - started)
+            scan_tabs = fired or not event_driven
+            if elapsed >= next_report:
+                next_report = elapsed + 5
+                scan_tabs = True
                 current_url = tab.target.url if hasattr(tab, "target") else ""
-                logger.debug(f"[{self.account_name}] 等待 OAuth 完成... ({i}s, url={current_url})")
+                logger.debug(f"[{self.account_name}] 等待 OAuth 完成... ({elapsed}s, url={current_url})")
                 if self._debug:
-                    await self._save_debug_screenshot(tab, f"oauth_waiting_{i}s")
+                    await self._save_debug_screenshot(tab, f"oauth_waiting_{elapsed}s")
 
         logger.error(f"[{self.account_name}] OAuth 登录超时")
         await self._save_debug_screenshot(tab, "oauth_timeout")
         return None, None
 
+    async def _read_page_session_state(self, tab) -> dict:
+        """一次 evaluate 读取 document.cookie 和 api_user（localStorage 优先，其次 /api/user/self）"""
+        raw = await self._safe_evaluate(
+            tab,
+            _SESSION_STATE_JS,
+            timeout=12,
+            label="read_page_session_state",
+            default=None,
+            await_promise=True,
+        )
+        if isinstance(raw, dict):
+            raw = raw.get("value")
+        if not isinstance(raw, str):
+            return {}
+        try:
+            state = _json.loads(raw)
+        except ValueError:
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def _api_user_cache_key(self) -> str:
+        """api_user 缓存键中的账号部分（ID 归属于 LinuxDO 账号）"""
+        return self.linuxdo_username or self.account_name
+
+    def _api_user_cache_get(self) -> str | None:
+        return ApiUserCache().get(self.provider_name, self._api_user_cache_key())
+
+    def _remember_api_user(self, success: bool, api_user: str | None) -> None:
+        """签到成功时缓存 api_user；使用缓存值签到失败时清除缓存"""
+        if success and api_user:
+            ApiUserCache().save(self.provider_name, self._api_user_cache_key(), str(api_user))
+        elif not success and self._api_user_from_cache:
+            ApiUserCache().invalidate(self.provider_name, self._api_user_cache_key())
+
     async def _extract_session_from_browser(self, tab) -> tuple[str | None, str | None]:
         """从浏览器提取 session 和 api_user"""
         session_cookie = None
@@ -1450,8 +2000,6 @@ class NewAPIBrowserCheckin:
         provider_domain = self.provider.domain.replace("https://", "").replace("http://", "")
 
         try:
-            import nodriver.cdp.network as cdp_network
-
             # 先确保在 provider 域名上（触发 session cookie 设置）
             current_url = tab.target.url if hasattr(tab, "target") else ""
             logger.info(f"[{self.account_name}] 当前 URL: {current_url}")
@@ -1470,26 +2018,6 @@ class NewAPIBrowserCheckin:
                     )
                     await asyncio.sleep(2)
 
-            # 先尝试从 JS document.cookie 获取（最直接）
-            try:
-                js_cookies = await tab.evaluate("document.cookie")
-                if js_cookies and isinstance(js_cookies, dict):
-                    js_cookies = js_cookies.get('value', '')
-                if js_cookies:
-                    logger.info(f"[{self.account_name}] JS document.cookie: {str(js_cookies)[:200]}")
-                    # 解析 document.cookie 字符串
-                    for pair in str(js_cookies).split(";"):
-                        pair = pair.strip()
-                        if "=" in pair:
-                            name, value = pair.split("=", 1)
-                            if name.strip() == "session" and value.strip():
-                                session_cookie = value.strip()
-                                logger.info(f"[{self.account_name}] 从 JS 获取到 session: {session_cookie[:30]}...")
-                else:
-                    logger.info(f"[{self.account_name}] JS document.cookie 为空")
-            except Exception as e:
-                logger.debug(f"[{self.account_name}] JS document.cookie 读取失败: {e}")
-
             # 重试获取 session（有些站点 cookie 设置有延迟）
             for attempt in range(3):
                 all_cookies = await tab.send(cdp_network.get_all_cookies())
@@ -1588,62 +2116,29 @@ class NewAPIBrowserCheckin:
                     except Exception as e:
                         logger.debug(f"[{self.account_name}] 尝试 {oauth_path} 失败: {e}")
 
-            # 如果没有从 cookie 获取到 api_user，尝试从 localStorage 获取
-            if not api_user:
-                # NewAPI 将用户信息存储在 localStorage 的 'user' 键中
-                api_user = await self._safe_evaluate(tab, """
-                    (function() {
-                        // 尝试从 localStorage 的 user 对象获取 id
-                        try {
-                            const userStr = localStorage.getItem('user');
-                            if (userStr) {
-                                const user = JSON.parse(userStr);
-                                if (user && user.id) {
-                                    return String(user.id);
-                                }
-                            }
-                        } catch (e) {}
-
-                        // 尝试其他可能的键名
-                        const keys = ['user_id', 'userId', 'new-api-user', 'api_user'];
-                        for (const key of keys) {
-                            const val = localStorage.getItem(key);
-                            if (val) return val;
-                        }
-
-                        return null;
-                    })()
-                """, timeout=8, label="read_api_user_local_storage", default=None)
-                if isinstance(api_user, dict):
-                    api_user = api_user.get("value")
+            # 已拿到 session 且有缓存的 api_user 时，跳过页面探测
+            if session_cookie and not api_user:
+                api_user = self._api_user_cache_get()
                 if api_user:
-                    logger.info(f"[{self.account_name}] 从 localStorage 获取到 api_user: {api_user}")
+                    self._api_user_from_cache = True
+                    logger.info(f"[{self.account_name}] 使用缓存的 api_user: {api_user}")
 
-            # 如果还是没有，尝试调用 API 获取用户信息
-            if not api_user and session_cookie:
-                logger.info(f"[{self.account_name}] 尝试通过 API 获取用户信息...")
-                try:
-                    user_info = await self._safe_evaluate(tab, f"""
-                        (async function() {{
-                            try {{
-                                const resp = await fetch('{self.provider.domain}/api/user/self', {{
-                                    credentials: 'include'
-                                }});
-                                const data = await resp.json();
-                                if (data.success && data.data && data.data.id) {{
-                                    return String(data.data.id);
-                                }}
-                            }} catch (e) {{}}
-                            return null;
-                        }})()
-                    """, timeout=12, label="fetch_api_user_from_self_api", default=None)
-                    if isinstance(user_info, dict):
-                        user_info = user_info.get("value")
-                    if user_info:
-                        api_user = user_info
-                        logger.info(f"[{self.account_name}] 从 API 获取到 api_user: {api_user}")
-                except Exception as e:
-                    logger.debug(f"[{self.account_name}] API 获取用户信息失败: {e}")
+            # document.cookie、localStorage 和 /api/user/self 合并为一次 evaluate
+            page_state = {} if self._api_user_from_cache else await self._read_page_session_state(tab)
+
+            # CDP 未取到 session 时（极少数站点），回退到 JS 可读的 document.cookie
+            if not session_cookie:
+                for pair in page_state.get("cookie", "").split(";"):
+                    name, sep, value = pair.strip().partition("=")
+                    if sep and name.strip() == "session" and value.strip():
+                        session_cookie = value.strip()
+                        logger.info(f"[{self.account_name}] 从 JS 获取到 session: {session_cookie[:30]}...")
+
+            # 如果没有从 cookie 获取到 api_user，使用 localStorage / API 的结果
+            if not api_user and page_state.get("apiUser"):
+                api_user = str(page_state["apiUser"])
+                source = "API" if page_state.get("source") == "api" else "localStorage"
+                logger.info(f"[{self.account_name}] 从 {source} 获取到 api_user: {api_user}")
 
         except Exception as e:
             logger.error(f"[{self.account_name}] 提取 session 失败: {e}")
@@ -1702,6 +2197,25 @@ class NewAPIBrowserCheckin:
                     message="Cookie 无效且未提供 LinuxDO 账号密码",
                 )
 
+            # 限制同时运行的浏览器数量，浏览器关闭后才释放名额；排队时间不计入超时
+            async with self._browser_slots or contextlib.nullcontext():
+                return await asyncio.wait_for(self._oauth_checkin_with_browser(), timeout=self._browser_timeout)
+
+        except Exception as e:
+            if isinstance(e, asyncio.TimeoutError) and self._browser_timeout is not None:
+                raise
+            logger.error(f"[{self.account_name}] 签到异常: {e}")
+            return CheckinResult(
+                platform=f"NewAPI ({self.provider_name})",
+                account=self.account_name,
+                status=CheckinStatus.FAILED,
+                message=f"签到异常: {str(e)}",
+            )
+
+    async def _oauth_checkin_with_browser(self) -> CheckinResult:
+        """启动（或从浏览器池取出）浏览器完成 LinuxDO OAuth 登录并签到，结束后归还浏览器"""
+        reusable = True
+        try:
             # 启动浏览器（参考 linuxdo.py 使用 BrowserManager）
             logger.info(f"[{self.account_name}] 启动浏览器进行 OAuth 登录...")
 
@@ -1718,13 +2232,21 @@ class NewAPIBrowserCheckin:
 
             engine = get_browser_engine()
             max_retries = 5 if is_ci else 3
-            self._browser_manager = BrowserManager(engine=engine, headless=headless)
-            await self._browser_manager.start(max_retries=max_retries)
+            # 同一 LinuxDO 账号、同一启动配置的浏览器在运行范围内复用，省去反复启动和 CF 预热
+            self._browser_manager = await BrowserManager.acquire_pooled(
+                (self.linuxdo_username or "",),
+                engine=engine,
+                headless=headless,
+                user_data_dir=self._profile_dir() if engine == "nodriver" else None,
+                max_retries=max_retries,
+            )
 
             tab = self._browser_manager.page
 
-            # 登录 LinuxDO
-            if not await self._login_linuxdo(tab):
+            # 登录 LinuxDO（同账号并发签到时排队，后来者直接复用先登录者缓存的 Cookie）
+            async with self._linuxdo_login_lock or contextlib.nullcontext():
+                linuxdo_ok = await self._login_linuxdo(tab)
+            if not linuxdo_ok:
                 return CheckinResult(
                     platform=f"NewAPI ({self.provider_name})",
                     account=self.account_name,
@@ -1760,6 +2282,8 @@ class NewAPIBrowserCheckin:
                 extra_cookies=runtime_cookies,
             )
 
+            self._remember_api_user(success, api_user or details.get("resolved_api_user"))
+
             self._login_method = "oauth"
             details["login_method"] = "oauth"
             details["new_session"] = session_cookie[:20] + "..."
@@ -1777,19 +2301,13 @@ class NewAPIBrowserCheckin:
                 details=details,
             )
 
-        except Exception as e:
-            logger.error(f"[{self.account_name}] 签到异常: {e}")
-            return CheckinResult(
-                platform=f"NewAPI ({self.provider_name})",
-                account=self.account_name,
-                status=CheckinStatus.FAILED,
-                message=f"签到异常: {str(e)}",
-            )
-
+        except BaseException:
+            # 异常/超时取消后浏览器状态不可信，不放回池中
+            reusable = False
+            raise
         finally:
             if self._browser_manager:
-                logger.info(f"[{self.account_name}] 关闭浏览器...")
-                await self._browser_manager.close()
+                await BrowserManager.release_pooled(self._browser_manager, reusable=reusable)
 
 
 async def browser_checkin_newapi(
@@ -1799,6 +2317,9 @@ async def browser_checkin_newapi(
     cookies: dict | str | None = None,
     api_user: str | None = None,
     account_name: str | None = None,
+    browser_slots: asyncio.Semaphore | None = None,
+    browser_timeout: float | None = None,
+    linuxdo_login_lock: asyncio.Lock | None = None,
 ) -> CheckinResult:
     """便捷函数：使用浏览器签到 NewAPI 站点"""
     checker = NewAPIBrowserCheckin(
@@ -1808,6 +2329,9 @@ async def browser_checkin_newapi(
         cookies=cookies,
         api_user=api_user,
         account_name=account_name,
+        browser_slots=browser_slots,
+        browser_timeout=browser_timeout,
+        linuxdo_login_lock=linuxdo_login_lock,
     )
     return await checker.run()
 
@@ -2,16 +2,12 @@
 """
 随时跑路公益站签到适配器
 
-基于 NewAPIAdapter 基类，适配随时跑路 (runanytime.hxi.me) 站点。
+适配器类由 NEWAPI_SITES 中的 "runanytime" 配置生成，保留本模块以兼容
+`from platforms.runanytime import RunAnytimeAdapter` 的旧导入路径。
 """
 
 from platforms.newapi_base import NewAPIAdapter
 
+RunAnytimeAdapter = NewAPIAdapter.site_class("runanytime")
 
-class RunAnytimeAdapter(NewAPIAdapter):
-    """随时跑路公益站签到适配器"""
-    
-    PLATFORM_NAME = "随时跑路"
-    BASE_URL = "https://runanytime.hxi.me"
-    COOKIE_DOMAIN = "runanytime.hxi.me"
-    CURRENCY_UNIT = "$"
+__all__ = ["RunAnytimeAdapter"]
@@ -2,22 +2,12 @@
 """
 WONG 公益站签到适配器
 
-基于 NewAPIAdapter 基类，支持 LinuxDO OAuth 登录。
+适配器类由 NEWAPI_SITES 中的 "wong" 配置生成，保留本模块以兼容
+`from platforms.wong import WongAdapter` 的旧导入路径。
 """
 
 from platforms.newapi_base import NewAPIAdapter
 
+WongAdapter = NewAPIAdapter.site_class("wong")
 
-class WongAdapter(NewAPIAdapter):
-    """WONG 公益站签到适配器
-    
-    继承自 NewAPIAdapter，自动支持：
-    - LinuxDO OAuth 登录（优先）
-    - Cookie 回退登录
-    - 签到和余额查询
-    """
-    
-    PLATFORM_NAME = "WONG公益站"
-    BASE_URL = "https://wzw.pp.ua"
-    COOKIE_DOMAIN = "wzw.pp.ua"
-    CURRENCY_UNIT = "$"
+__all__ = ["WongAdapter"]
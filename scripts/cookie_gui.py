@@ -77,6 +77,8 @@ except ImportError:
 
 try:
     import browser_cookie3
+    # 与命令行脚本共用同一套 session cookie 匹配逻辑（按域名标签匹配，取最精确的 cookie）
+    from extract_cookies import build_domain_trie, load_site_sessions
     HAS_BROWSER_COOKIE3 = True
 except ImportError:
     HAS_BROWSER_COOKIE3 = False
@@ -426,14 +428,18 @@ class CookieExtractorApp(ctk.CTk):
         if not browser_func:
             return results, success_count, sites
 
+        # 每次调用都会重新打开并解密 Cookie 数据库，只读取一次，各站点在内存中筛选
+        trie = build_domain_trie({site_id: SITES_CONFIG[site_id] for site_id in sites})
+        sessions = load_site_sessions(browser_func, trie)
+        if sessions is None:
+            log(f"browser_cookie3 读取 {browser} Cookie 失败（浏览器可能正在运行）")
+            return results, success_count, [SITES_CONFIG[site_id]["name"] for site_id in sites]
+
         for site_id in sites:
             config = SITES_CONFIG[site_id]
-            domain = config["domain"]
 
             try:
-                cj = browser_func(domain_name=domain)
-                cookie_dict = {c.name: c.value for c in cj}
-                session = cookie_dict.get("session")
+                session = sessions.get(site_id)
 
                 if session:
                     success_count += 1
@@ -53,22 +53,80 @@ SITES = {
 }
 
 
-def extract_site_cookies(domain: str, browser_func) -> dict | None:
-    """从指定浏览器提取某站点的 cookies"""
+def build_domain_trie(sites: dict) -> dict:
+    """按域名标签倒序（com -> wongapi -> api）构建站点后缀树，节点的 "_sites" 记录站点名"""
+    trie: dict = {}
+    for site_name, site_config in sites.items():
+        node = trie
+        for label in reversed(site_config["domain"].lower().split(".")):
+            node = node.setdefault(label, {})
+        node.setdefault("_sites", []).append(site_name)
+    return trie
+
+
+def _sites_under(node: dict):
+    """遍历后缀树节点及其所有子节点上的站点名"""
+    for key, child in node.items():
+        if key == "_sites":
+            yield from child
+        else:
+            yield from _sites_under(child)
+
+
+# session cookie 与站点域名的匹配精确度，数值越大越优先
+_MATCH_PARENT = 0
+_MATCH_SUBDOMAIN = 1
+_MATCH_EXACT_DOMAIN = 2
+_MATCH_EXACT_HOST = 3
+
+
+def load_site_sessions(browser_func, trie: dict) -> dict[str, str] | None:
+    """一次读取浏览器的全部 cookies，返回 {站点名: session 值}
+
+    每次调用 browser_cookie3 都会重新打开并解密 Cookie 数据库（含系统钥匙串解锁），
+    因此每个浏览器只读取一次。每个 session cookie 沿后缀树走一遍即可匹配到站点：
+    cookie 域名是站点域名本身或其子域名时命中途经的站点，是其上级域名
+    （如 .wongapi.com）时命中该节点下的所有站点。
+
+    同一站点命中多个 cookie 时按匹配精确度取值，与 cookie 出现顺序无关：
+    站点自身的 host-only cookie > 站点域名的 domain cookie（前导点）
+    > 子域名 cookie > 上级域名 cookie。
+    """
     try:
-        cj = browser_func(domain_name=domain)
-        cookies = {c.name: c.value for c in cj}
-        
-        # 查找 session cookie (通常名为 session)
-        session = cookies.get("session")
-        if session:
-            return {"session": session}
+        cj = browser_func()
     except PermissionError:
         # 浏览器正在运行，数据库被锁定
         return None
     except Exception:
         return None
-    return None
+
+    best: dict[str, tuple[int, str]] = {}
+
+    def offer(site_name: str, rank: int, value: str) -> None:
+        # 只允许更精确的匹配覆盖已有结果
+        if site_name not in best or rank > best[site_name][0]:
+            best[site_name] = (rank, value)
+
+    for c in cj:
+        if c.name != "session" or not c.value:
+            continue
+        host_only = not c.domain.startswith(".")
+        labels = list(reversed(c.domain.lower().lstrip(".").split(".")))
+        node = trie
+        for depth, label in enumerate(labels, 1):
+            node = node.get(label)
+            if node is None:
+                break
+            if depth == len(labels):
+                rank = _MATCH_EXACT_HOST if host_only else _MATCH_EXACT_DOMAIN
+            else:
+                rank = _MATCH_SUBDOMAIN
+            for site_name in node.get("_sites", ()):
+                offer(site_name, rank, c.value)
+        else:
+            for site_name in _sites_under(node):
+                offer(site_name, _MATCH_PARENT, c.value)
+    return {site_name: value for site_name, (_, value) in best.items()}
 
 
 def extract_all_cookies():
@@ -79,7 +137,10 @@ def extract_all_cookies():
         ("Edge", browser_cookie3.edge),
         ("Firefox", browser_cookie3.firefox),
     ]
-    
+    # 各浏览器中各站点的 session cookie，首次用到时才读取
+    trie = build_domain_trie(SITES)
+    loaded: dict[str, dict[str, str]] = {}
+
     results = []
     
     for site_name, site_config in SITES.items():
@@ -92,8 +153,11 @@ def extract_all_cookies():
         used_browser = None
         
         for browser_name, browser_func in browsers:
-            cookies = extract_site_cookies(domain, browser_func)
-            if cookies:
+            if browser_name not in loaded:
+                loaded[browser_name] = load_site_sessions(browser_func, trie) or {}
+            session = loaded[browser_name].get(site_name)
+            if session:
+                cookies = {"session": session}
                 used_browser = browser_name
                 break
         
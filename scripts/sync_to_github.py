@@ -7,31 +7,57 @@
 2. 登录: gh auth login
 3. 运行: python scripts/sync_to_github.py
 
+若设置了 GH_TOKEN/GITHUB_TOKEN 且安装了 pynacl（pip install pynacl），
+则直接调用 GitHub REST API 更新 Secret，无需 GitHub CLI。
+
 此脚本会:
 1. 提取本地浏览器的公益站 Cookie
 2. 自动更新到 GitHub 仓库的 ANYROUTER_ACCOUNTS secret
 """
 
+import base64
+import configparser
+import contextlib
 import json
+import os
 import subprocess
 import sys
 from pathlib import Path
 
+import httpx
+
+try:
+    from nacl import public as nacl_public
+except ImportError:  # pynacl 为可选依赖，未安装时使用 gh 命令
+    nacl_public = None
+
 # 导入提取脚本
 sys.path.insert(0, str(Path(__file__).parent))
 from extract_cookies import extract_all_cookies
 
 
+def _read_origin_url() -> str | None:
+    """读取 origin 的远程地址：优先直接解析 .git/config，读不到时再调用 git 命令"""
+    cfg = configparser.ConfigParser(interpolation=None, strict=False)
+    with contextlib.suppress(configparser.Error, OSError, UnicodeDecodeError):
+        cfg.read(Path(".git") / "config", encoding="utf-8")
+        url = cfg.get('remote "origin"', "url", fallback=None)
+        if url:
+            return url.strip()
+
+    result = subprocess.run(
+        ["git", "remote", "get-url", "origin"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
 def get_repo_name() -> str | None:
     """获取当前 Git 仓库名"""
     try:
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        url = result.stdout.strip()
+        url = _read_origin_url() or ""
         # 解析 git@github.com:user/repo.git 或 https://github.com/user/repo.git
         if "github.com" in url:
             if url.startswith("git@"):
@@ -73,13 +99,56 @@ def update_github_secret(repo: str, secret_name: str, value: str) -> bool:
         return False
 
 
+def get_github_token() -> str | None:
+    """读取 GitHub Token（GH_TOKEN 优先，与 gh 命令一致）"""
+    return os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN") or None
+
+
+def create_github_client(token: str) -> httpx.Client:
+    """创建 GitHub REST API 客户端（多个 Secret 共用同一连接）"""
+    return httpx.Client(
+        base_url="https://api.github.com",
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        },
+        http2=True,
+        timeout=30.0,
+    )
+
+
+def update_github_secret_via_api(client: httpx.Client, repo: str, secret_name: str, value: str) -> bool:
+    """通过 GitHub REST API 更新 Secret（使用仓库公钥进行 sealed box 加密）"""
+    try:
+        resp = client.get(f"/repos/{repo}/actions/secrets/public-key")
+        resp.raise_for_status()
+        key = resp.json()
+
+        sealed_box = nacl_public.SealedBox(nacl_public.PublicKey(base64.b64decode(key["key"])))
+        encrypted = base64.b64encode(sealed_box.encrypt(value.encode("utf-8"))).decode("ascii")
+
+        resp = client.put(
+            f"/repos/{repo}/actions/secrets/{secret_name}",
+            json={"encrypted_value": encrypted, "key_id": key["key_id"]},
+        )
+        if resp.status_code not in (201, 204):
+            print(f"   响应: HTTP {resp.status_code} {resp.text}")
+            return False
+        return True
+    except Exception as e:
+        print(f"❌ 更新失败: {e}")
+        return False
+
+
 def main():
     print("=" * 50)
     print("🚀 Cookie 一键同步到 GitHub Secrets")
     print("=" * 50)
     
-    # 检查 gh cli
-    if not check_gh_cli():
+    # 有 Token 且安装了 pynacl 时直接调用 REST API，否则需要 gh cli
+    token = get_github_token() if nacl_public is not None else None
+    if not token and not check_gh_cli():
         print("\n❌ 未安装 GitHub CLI")
         print("   请访问 https://cli.github.com/ 安装")
         print("   安装后运行: gh auth login")
@@ -115,11 +184,16 @@ def main():
     value = json.dumps(accounts, ensure_ascii=False)
     
     print("\n⏳ 正在同步...")
-    if update_github_secret(repo, "ANYROUTER_ACCOUNTS", value):
+    if token:
+        with create_github_client(token) as client:
+            ok = update_github_secret_via_api(client, repo, "ANYROUTER_ACCOUNTS", value)
+    else:
+        ok = update_github_secret(repo, "ANYROUTER_ACCOUNTS", value)
+    if ok:
         print("✅ 同步成功!")
         print(f"   已更新 {repo} 的 ANYROUTER_ACCOUNTS secret")
     else:
-        print("❌ 同步失败，请检查 GitHub CLI 权限")
+        print("❌ 同步失败，请检查 GitHub Token / GitHub CLI 权限")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,22 @@
+"""
+Shared pytest configuration.
+
+Registers a "ci" Hypothesis profile that is loaded automatically when the CI
+environment variable is set. It keeps the example database in .hypothesis-ci/
+so a CI cache can carry previously failing examples between runs, and the
+reuse phase replays them before generating new ones.
+"""
+
+import os
+
+from hypothesis import Phase, settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+settings.register_profile(
+    "ci",
+    database=DirectoryBasedExampleDatabase(".hypothesis-ci"),
+    phases=[Phase.explicit, Phase.reuse, Phase.generate],
+)
+
+if os.environ.get("CI"):
+    settings.load_profile("ci")
@@ -8,12 +8,34 @@
 """
 
 import asyncio
+import functools
 import os
+import string
 from dataclasses import dataclass
+from types import SimpleNamespace
 from typing import Any, Optional
 
 import pytest
-from hypothesis import given, strategies as st, settings, assume, HealthCheck
+import pytest_asyncio
+from hypothesis import given, strategies as st, settings, HealthCheck, Phase
+
+from utils.browser import (
+    BrowserManager,
+    CookieRetriever,
+    TabManager,
+    URLMonitor,
+    first_found,
+    wait_until,
+)
+
+# The async browser mocks are cheap to generate but slow to shrink; skip the
+# shrink/explain/target phases so a failing property reports quickly.
+FAST_PHASES = (Phase.explicit, Phase.reuse, Phase.generate)
+FAST = settings(phases=FAST_PHASES, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+# For tests that also take function-scoped pytest fixtures (e.g. monkeypatch)
+FAST_WITH_FIXTURES = settings(
+    FAST, suppress_health_check=[HealthCheck.too_slow, HealthCheck.function_scoped_fixture]
+)
 
 
 # ============================================================================
@@ -26,6 +48,7 @@ class MockTarget:
     target_id: str
     url: str = ""
     title: str = ""
+    opener_id: Optional[str] = None
 
 
 class MockTab:
@@ -64,25 +87,62 @@ class MockBrowser:
 
 
 # ============================================================================
-# Import TabManager after mocks are defined
+# Helper Functions for Tab Creation (Faster than @st.composite)
 # ============================================================================
 
-from utils.browser import TabManager
+def _fast_mock_tab(target_id: str, url: str) -> MockTab:
+    """Build a MockTab without running MockTab/MockTarget __init__."""
+    target = MockTarget.__new__(MockTarget)
+    target.target_id = target_id
+    target.url = url
+    target.title = ""
+    tab = MockTab.__new__(MockTab)
+    tab.target = target
+    tab._brought_to_front = False
+    return tab
 
 
-# ============================================================================
-# Helper Functions for Tab Creation (Faster than @st.composite)
-# ============================================================================
+@functools.lru_cache(maxsize=256)
+def _cached_mock_tabs(count: int, prefix: str, url_prefix: str) -> tuple[MockTab, ...]:
+    """Build the mock tabs for one (count, prefix, url_prefix) once per session."""
+    return tuple(_fast_mock_tab(f"{prefix}_{i}", f"{url_prefix}{i}.com") for i in range(count))
+
 
 def create_mock_tabs(count: int, prefix: str = "tab", url_prefix: str = "https://site") -> list[MockTab]:
     """Create a list of mock tabs with unique IDs.
     
     This is faster than using @st.composite strategies for simple cases.
+    Tabs are cached per argument tuple: the returned list is a fresh copy and
+    each tab's bring_to_front flag is reset, but the tabs themselves are shared.
+    """
+    tabs = list(_cached_mock_tabs(count, prefix, url_prefix))
+    for tab in tabs:
+        tab._brought_to_front = False
+    return tabs
+
+
+@pytest.fixture
+def browser_pool():
+    """Return make(tabs) that resets one shared MockBrowser per Hypothesis example.
+    
+    Hypothesis runs every example inside a single fixture invocation, so the
+    browser is built once per test and only its tab list is swapped.
     """
-    return [
-        MockTab(target_id=f"{prefix}_{i}", url=f"{url_prefix}{i}.com")
-        for i in range(count)
-    ]
+    browser = MockBrowser()
+
+    def make(tabs: list[MockTab]) -> MockBrowser:
+        browser.tabs = list(tabs)
+        return browser
+
+    return make
+
+
+@st.composite
+def _tab_scenario(draw) -> tuple[int, int]:
+    """Draw (initial_count, new_count) for a record-then-open-tabs scenario."""
+    initial_count = draw(st.integers(min_value=1, max_value=10))
+    new_count = draw(st.integers(min_value=0, max_value=5))
+    return initial_count, new_count
 
 
 # ============================================================================
@@ -100,196 +160,58 @@ class TestNewTabDetectionProperty:
     **Validates: Requirements 1.3, 3.1**
     """
 
-    @given(
-        initial_count=st.integers(min_value=1, max_value=5),
-        new_count=st.integers(min_value=0, max_value=3)
-    )
-    @settings(max_examples=100)
-    @pytest.mark.asyncio
-    async def test_new_tab_count_detection(self, initial_count: int, new_count: int):
+    @given(scenario=_tab_scenario())
+    @settings(FAST_WITH_FIXTURES, max_examples=60, derandomize=True)
+    def test_tab_lifecycle_invariants(self, browser_pool, scenario: tuple[int, int]):
         """
-        Property: TabManager correctly counts the number of new tabs.
+        Property: TabManager records the initial tabs and new tabs are
+        identified by count difference and by ID.
         
         **Validates: Requirements 1.3, 3.1**
         
-        For any initial tab count N and new tab count M, after recording
-        the initial count and adding M new tabs, the TabManager should
-        detect that new tabs were added when M > 0.
+        For any N initial tabs and M new tabs added (M may be 0),
+        record_tab_count() returns N and stores the N initial IDs, recording
+        again is stable, and exactly the M added tabs are absent from the
+        recorded IDs.
         """
-        # Create initial and new tabs
+        initial_count, new_count = scenario
         initial_tabs = create_mock_tabs(initial_count, "initial", "https://initial")
         new_tabs = create_mock_tabs(new_count, "new", "https://new")
         
-        # Create browser with initial tabs
-        browser = MockBrowser(tabs=list(initial_tabs))
+        browser = browser_pool(initial_tabs)
         tab_manager = TabManager(browser)
         
-        # Record initial tab count
+        # Record initial state (twice: recording must be stable)
         recorded_count = tab_manager.record_tab_count()
-        
-        # Verify initial count is correct
+        assert tab_manager.record_tab_count() == recorded_count
         assert recorded_count == initial_count, (
-            f"Initial count {recorded_count} doesn't match actual {initial_count}"
-        )
-        
-        # Add new tabs to browser
-        for tab in new_tabs:
-            browser.add_tab(tab)
-        
-        # Verify new tab count detection
-        current_count = len(browser.tabs)
-        expected_new_count = current_count - recorded_count
-        
-        assert expected_new_count == new_count, (
-            f"Expected {new_count} new tabs, but count difference is {expected_new_count}"
-        )
-
-    @given(
-        initial_count=st.integers(min_value=1, max_value=5)
-    )
-    @settings(max_examples=100)
-    def test_initial_tab_recording(self, initial_count: int):
-        """
-        Property: TabManager correctly records initial tab state.
-        
-        **Validates: Requirements 3.1**
-        
-        For any browser state with N tabs, record_tab_count() should
-        return exactly N and store the tab IDs for later comparison.
-        """
-        initial_tabs = create_mock_tabs(initial_count)
-        
-        browser = MockBrowser(tabs=list(initial_tabs))
-        tab_manager = TabManager(browser)
-        
-        # Record initial state
-        count = tab_manager.record_tab_count()
-        
-        # Verify count matches
-        assert count == initial_count, (
-            f"Recorded count {count} doesn't match actual {initial_count}"
+            f"Recorded count {recorded_count} doesn't match actual {initial_count}"
         )
-        
-        # Verify internal state is correctly stored
-        assert tab_manager._initial_tab_count == initial_count, (
-            f"Internal count {tab_manager._initial_tab_count} doesn't match"
-        )
-        
-        # Verify tab IDs are stored
+        assert tab_manager._initial_tab_count == initial_count
         assert len(tab_manager._initial_tabs) == initial_count, (
             f"Stored {len(tab_manager._initial_tabs)} tab IDs, expected {initial_count}"
         )
-
-    @given(
-        initial_count=st.integers(min_value=1, max_value=5),
-        new_count=st.integers(min_value=1, max_value=3)
-    )
-    @settings(max_examples=100)
-    def test_new_tab_identification_by_id(self, initial_count: int, new_count: int):
-        """
-        Property: TabManager identifies new tabs by comparing tab IDs.
-        
-        **Validates: Requirements 3.1**
-        
-        For any set of initial tabs and new tabs, the TabManager should
-        correctly identify which tabs are new by comparing their IDs
-        against the recorded initial tab IDs.
-        """
-        initial_tabs = create_mock_tabs(initial_count, "initial")
-        new_tabs = create_mock_tabs(new_count, "new")
-        
-        browser = MockBrowser(tabs=list(initial_tabs))
-        tab_manager = TabManager(browser)
-        
-        # Record initial state
-        tab_manager.record_tab_count()
-        
-        # Get initial tab IDs
-        initial_ids = set(tab_manager._initial_tabs)
+        initial_ids = tab_manager._initial_tab_ids
+        assert initial_ids == frozenset(tab_manager._initial_tabs)
         
         # Add new tabs
-        for tab in new_tabs:
-            browser.add_tab(tab)
+        browser.tabs.extend(new_tabs)
         
-        # Verify new tabs are not in initial IDs
-        for tab in new_tabs:
-            tab_id = tab.target.target_id
-            assert tab_id not in initial_ids, (
-                f"New tab ID {tab_id} should not be in initial IDs"
-            )
+        # New tab count equals (current_count - initial_count)
+        detected_new_count = len(browser.tabs) - recorded_count
+        assert detected_new_count == new_count, (
+            f"Expected {new_count} new tabs, detected {detected_new_count}"
+        )
         
-        # Verify initial tabs are still in initial IDs
+        # New tabs are identified by ID
         for tab in initial_tabs:
-            tab_id = tab.target.target_id
-            assert tab_id in initial_ids, (
-                f"Initial tab ID {tab_id} should be in initial IDs"
+            assert tab.target.target_id in initial_ids, (
+                f"Initial tab ID {tab.target.target_id} should be in initial IDs"
             )
-
-    @given(initial_count=st.integers(min_value=1, max_value=5))
-    @settings(max_examples=50)
-    def test_no_new_tabs_detected_when_none_added(self, initial_count: int):
-        """
-        Property: No new tabs detected when tab count doesn't change.
-        
-        **Validates: Requirements 3.1**
-        
-        If no new tabs are added after recording, the difference between
-        current and initial count should be zero.
-        """
-        initial_tabs = create_mock_tabs(initial_count)
-        
-        browser = MockBrowser(tabs=list(initial_tabs))
-        tab_manager = TabManager(browser)
-        
-        # Record initial state
-        recorded_count = tab_manager.record_tab_count()
-        
-        # Don't add any new tabs
-        
-        # Current count should equal initial count
-        current_count = len(browser.tabs)
-        assert current_count == recorded_count, (
-            f"Tab count changed from {recorded_count} to {current_count} without adding tabs"
-        )
-
-    @given(
-        initial_count=st.integers(min_value=1, max_value=10),
-        new_count=st.integers(min_value=1, max_value=5)
-    )
-    @settings(max_examples=100)
-    def test_exact_new_tab_count_calculation(self, initial_count: int, new_count: int):
-        """
-        Property: New tab count equals (current_count - initial_count).
-        
-        **Validates: Requirements 1.3, 3.1**
-        
-        For any N initial tabs and M new tabs added, the number of new
-        tabs detected should be exactly M.
-        """
-        # Create initial tabs
-        initial_tabs = create_mock_tabs(initial_count, "initial")
-        
-        # Create new tabs
-        new_tabs = create_mock_tabs(new_count, "new")
-        
-        browser = MockBrowser(tabs=list(initial_tabs))
-        tab_manager = TabManager(browser)
-        
-        # Record initial state
-        recorded_initial = tab_manager.record_tab_count()
-        assert recorded_initial == initial_count
-        
-        # Add new tabs
         for tab in new_tabs:
-            browser.add_tab(tab)
-        
-        # Calculate new tab count
-        current_count = len(browser.tabs)
-        detected_new_count = current_count - recorded_initial
-        
-        assert detected_new_count == new_count, (
-            f"Expected {new_count} new tabs, detected {detected_new_count}"
-        )
+            assert tab.target.target_id not in initial_ids, (
+                f"New tab ID {tab.target.target_id} should not be in initial IDs"
+            )
 
     def test_empty_browser_handling(self):
         """
@@ -309,10 +231,10 @@ class TestNewTabDetectionProperty:
         # Internal state should be empty
         assert tab_manager._initial_tab_count == 0
         assert tab_manager._initial_tabs == []
+        assert tab_manager._initial_tab_ids == frozenset()
 
-    @given(initial_count=st.integers(min_value=1, max_value=5))
-    @settings(max_examples=50)
-    def test_tab_detection_is_deterministic(self, initial_count: int):
+    @pytest.mark.parametrize("initial_count", [1, 2, 3, 4, 5])
+    def test_tab_detection_is_deterministic(self, browser_pool, initial_count: int):
         """
         Property: Tab detection produces consistent results.
         
@@ -323,7 +245,7 @@ class TestNewTabDetectionProperty:
         """
         initial_tabs = create_mock_tabs(initial_count)
         
-        browser = MockBrowser(tabs=list(initial_tabs))
+        browser = browser_pool(initial_tabs)
         tab_manager = TabManager(browser)
         
         # Record multiple times
@@ -337,11 +259,12 @@ class TestNewTabDetectionProperty:
         )
 
     @given(
-        initial_count=st.integers(min_value=1, max_value=5),
-        tabs_to_remove=st.integers(min_value=0, max_value=3)
+        params=st.integers(min_value=1, max_value=5).flatmap(
+            lambda n: st.tuples(st.just(n), st.integers(min_value=0, max_value=min(n, 3)))
+        )
     )
-    @settings(max_examples=50)
-    def test_tab_removal_detection(self, initial_count: int, tabs_to_remove: int):
+    @settings(FAST_WITH_FIXTURES, max_examples=20, derandomize=True)
+    def test_tab_removal_detection(self, browser_pool, params: tuple[int, int]):
         """
         Property: TabManager detects when tabs are removed (negative difference).
         
@@ -350,13 +273,13 @@ class TestNewTabDetectionProperty:
         If tabs are removed after recording, the difference should be negative,
         indicating no new tabs were added.
         """
-        # Ensure we don't try to remove more tabs than exist
-        assume(tabs_to_remove <= initial_count)
+        # The strategy never removes more tabs than exist
+        initial_count, tabs_to_remove = params
         
         # Create initial tabs
         initial_tabs = create_mock_tabs(initial_count)
         
-        browser = MockBrowser(tabs=list(initial_tabs))
+        browser = browser_pool(initial_tabs)
         tab_manager = TabManager(browser)
         
         # Record initial state
@@ -388,9 +311,9 @@ class TestTabManagerSwitching:
     """
 
     @given(initial_count=st.integers(min_value=1, max_value=5))
-    @settings(max_examples=50)
+    @settings(FAST_WITH_FIXTURES, max_examples=5, derandomize=True)
     @pytest.mark.asyncio
-    async def test_switch_to_tab_calls_bring_to_front(self, initial_count: int):
+    async def test_switch_to_tab_calls_bring_to_front(self, browser_pool, initial_count: int):
         """
         Property: switch_to_tab calls bring_to_front on the target tab.
         
@@ -401,7 +324,7 @@ class TestTabManagerSwitching:
         """
         initial_tabs = create_mock_tabs(initial_count)
         
-        browser = MockBrowser(tabs=list(initial_tabs))
+        browser = browser_pool(initial_tabs)
         tab_manager = TabManager(browser)
         
         # Pick the first tab to switch to
@@ -435,6 +358,11 @@ class TestTabManagerSwitching:
         await tab_manager.switch_to_tab(None)
 
 
+# find_oauth_tab() only reads tabs, so one set of non-OAuth tabs
+# (non_oauth_{i} -> https://regular{i}.com) is shared by every example.
+_NON_OAUTH_TABS = _cached_mock_tabs(16, "non_oauth", "https://regular")
+
+
 class TestFindOAuthTab:
     """
     Tests for TabManager's OAuth tab finding functionality.
@@ -442,16 +370,13 @@ class TestFindOAuthTab:
     **Validates: Requirements 3.2**
     """
 
-    @given(
-        non_oauth_count=st.integers(min_value=0, max_value=3),
-        oauth_url=st.sampled_from([
-            "https://linux.do/login",
-            "https://connect.linux.do/oauth/authorize",
-            "https://example.com/oauth/callback",
-            "https://example.com/authorize",
-        ])
-    )
-    @settings(max_examples=50)
+    @pytest.mark.parametrize("non_oauth_count", [0, 1, 2, 3])
+    @pytest.mark.parametrize("oauth_url", [
+        "https://linux.do/login",
+        "https://connect.linux.do/oauth/authorize",
+        "https://example.com/oauth/callback",
+        "https://example.com/authorize",
+    ])
     @pytest.mark.asyncio
     async def test_find_oauth_tab_returns_oauth_related_tab(
         self, non_oauth_count: int, oauth_url: str
@@ -465,10 +390,7 @@ class TestFindOAuthTab:
         oauth, authorize, or callback), find_oauth_tab should return it.
         """
         # Create non-OAuth tabs
-        non_oauth_tabs = [
-            MockTab(target_id=f"non_oauth_{i}", url=f"https://regular{i}.com")
-            for i in range(non_oauth_count)
-        ]
+        non_oauth_tabs = list(_NON_OAUTH_TABS[:non_oauth_count])
         
         # Create OAuth tab
         oauth_tab = MockTab(target_id="oauth_tab", url=oauth_url)
@@ -491,7 +413,7 @@ class TestFindOAuthTab:
         )
 
     @given(non_oauth_count=st.integers(min_value=0, max_value=5))
-    @settings(max_examples=50)
+    @settings(FAST, max_examples=6, derandomize=True)
     @pytest.mark.asyncio
     async def test_find_oauth_tab_returns_none_when_no_oauth_tabs(
         self, non_oauth_count: int
@@ -505,10 +427,7 @@ class TestFindOAuthTab:
         should return None.
         """
         # Create non-OAuth tabs with regular URLs
-        non_oauth_tabs = [
-            MockTab(target_id=f"non_oauth_{i}", url=f"https://regular-site-{i}.com")
-            for i in range(non_oauth_count)
-        ]
+        non_oauth_tabs = list(_NON_OAUTH_TABS[:non_oauth_count])
         
         browser = MockBrowser(tabs=list(non_oauth_tabs))
         tab_manager = TabManager(browser)
@@ -521,6 +440,31 @@ class TestFindOAuthTab:
             f"Found unexpected OAuth tab: {found_tab.target.url if found_tab else 'N/A'}"
         )
 
+    @pytest.mark.asyncio
+    async def test_opener_scope_ignores_other_flows_tabs(self):
+        """
+        With an opener, tabs opened by another login flow in the same browser are ignored.
+
+        **Validates: Requirements 3.1, 3.2**
+        """
+        ours = MockTab(target_id="ours", url="https://site.com/login")
+        theirs = MockTab(target_id="theirs", url="https://other.com/login")
+        browser = MockBrowser(tabs=[ours, theirs])
+        tab_manager = TabManager(browser, opener=ours)
+        tab_manager.record_tab_count()
+
+        foreign_oauth = MockTab(target_id="foreign", url="https://connect.linux.do/oauth/authorize")
+        foreign_oauth.target.opener_id = "theirs"
+        browser.add_tab(foreign_oauth)
+        assert await tab_manager.detect_new_tab(timeout=0.01) is None
+        assert await tab_manager.find_oauth_tab() is None
+
+        own_oauth = MockTab(target_id="own", url="https://connect.linux.do/oauth/authorize")
+        own_oauth.target.opener_id = "ours"
+        browser.add_tab(own_oauth)
+        assert await tab_manager.detect_new_tab(timeout=1) is own_oauth
+        assert await tab_manager.find_oauth_tab() is own_oauth
+
     @pytest.mark.asyncio
     async def test_find_oauth_tab_with_none_browser(self):
         """
@@ -542,47 +486,35 @@ class TestFindOAuthTab:
 # URLMonitor Tests
 # ============================================================================
 
-from utils.browser import URLMonitor
-
-
-class MockFrameTreeResult:
-    """Mock CDP get_frame_tree() result."""
+def make_url_tab(url: str = "", cdp_fails: bool = False) -> SimpleNamespace:
+    """Build a mock nodriver tab for URLMonitor testing.
     
-    def __init__(self, url: str):
-        self.frame = MockFrame(url)
+    Simulates a nodriver Tab with CDP support: send() returns a
+    get_frame_tree()-shaped result carrying tab._cdp_url, or raises when
+    tab._cdp_fails is set. Plain SimpleNamespace objects keep per-example
+    construction cheap.
+    """
+    tab = SimpleNamespace(
+        target=SimpleNamespace(target_id="test_tab", url=url),
+        _cdp_fails=cdp_fails,
+        _cdp_url=url,  # URL returned by CDP
+    )
 
+    async def send(command):
+        """Mock CDP send method."""
+        if tab._cdp_fails:
+            raise Exception("CDP command failed")
+        return SimpleNamespace(frame=SimpleNamespace(url=tab._cdp_url))
 
-class MockFrame:
-    """Mock CDP Frame object."""
-    
-    def __init__(self, url: str):
-        self.url = url
+    tab.send = send
+    return tab
 
 
-class MockTabForURLMonitor:
-    """Mock nodriver tab object for URLMonitor testing.
-    
-    Simulates the behavior of a nodriver Tab object with CDP support.
-    """
-    
-    def __init__(self, url: str = "", cdp_fails: bool = False):
-        self.target = MockTarget(target_id="test_tab", url=url)
-        self._cdp_fails = cdp_fails
-        self._cdp_url = url  # URL returned by CDP
-    
-    async def send(self, command):
-        """Mock CDP send method."""
-        if self._cdp_fails:
-            raise Exception("CDP command failed")
-        return MockFrameTreeResult(self._cdp_url)
-    
-    def set_cdp_url(self, url: str):
-        """Set the URL that CDP will return."""
-        self._cdp_url = url
-    
-    def set_target_url(self, url: str):
-        """Set the URL that tab.target.url will return."""
-        self.target.url = url
+def reset_url_tab(tab: SimpleNamespace, url: str = "", cdp_fails: bool = False) -> None:
+    """Reuse a make_url_tab() mock for a new example with the given URL."""
+    tab.target.url = url
+    tab._cdp_url = url
+    tab._cdp_fails = cdp_fails
 
 
 class TestURLMonitorGetCurrentUrl:
@@ -600,7 +532,7 @@ class TestURLMonitorGetCurrentUrl:
         **Validates: Requirements 1.5, 2.2**
         """
         expected_url = "https://linux.do/login"
-        tab = MockTabForURLMonitor(url=expected_url)
+        tab = make_url_tab(url=expected_url)
         
         monitor = URLMonitor(tab)
         url = await monitor.get_current_url()
@@ -615,7 +547,7 @@ class TestURLMonitorGetCurrentUrl:
         **Validates: Requirements 1.5, 2.2**
         """
         expected_url = "https://linux.do/login"
-        tab = MockTabForURLMonitor(url=expected_url, cdp_fails=True)
+        tab = make_url_tab(url=expected_url, cdp_fails=True)
         
         monitor = URLMonitor(tab)
         url = await monitor.get_current_url()
@@ -647,8 +579,8 @@ class TestURLMonitorGetCurrentUrl:
         cdp_url = "https://linux.do/session/sso_login"
         target_url = "https://example.com/login"  # Stale URL
         
-        tab = MockTabForURLMonitor(url=target_url)
-        tab.set_cdp_url(cdp_url)
+        tab = make_url_tab(url=target_url)
+        tab._cdp_url = cdp_url
         
         monitor = URLMonitor(tab)
         url = await monitor.get_current_url()
@@ -657,6 +589,32 @@ class TestURLMonitorGetCurrentUrl:
         assert url == cdp_url, f"Expected CDP URL {cdp_url}, got {url}"
 
 
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def fast_sleep():
+    """Advance a virtual clock on asyncio.sleep so polling and retries never really wait.
+
+    Only the running loop's own ``time`` is shifted, and the fixture shares the
+    class-scoped loop's lifetime, so the clock is restored when that loop is done
+    rather than jumping back under a loop that is still in use.
+    """
+    loop = asyncio.get_running_loop()
+    real_sleep = asyncio.sleep
+    real_time = loop.time
+    elapsed = 0.0
+
+    async def fake_sleep(delay, result=None):
+        nonlocal elapsed
+        elapsed += delay
+        await real_sleep(0)
+        return result
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(asyncio, "sleep", fake_sleep)
+        mp.setattr(loop, "time", lambda: real_time() + elapsed)
+        yield
+
+
+@pytest.mark.usefixtures("fast_sleep")
 class TestURLMonitorWaitForUrlContains:
     """
     Tests for URLMonitor.wait_for_url_contains() method.
@@ -672,7 +630,7 @@ class TestURLMonitorWaitForUrlContains:
         **Validates: Requirements 2.1**
         """
         expected_url = "https://linux.do/login"
-        tab = MockTabForURLMonitor(url=expected_url)
+        tab = make_url_tab(url=expected_url)
         
         monitor = URLMonitor(tab, poll_interval=0.1)
         url = await monitor.wait_for_url_contains("linux.do", timeout=5)
@@ -687,7 +645,7 @@ class TestURLMonitorWaitForUrlContains:
         **Validates: Requirements 2.1**
         """
         expected_url = "https://LINUX.DO/login"
-        tab = MockTabForURLMonitor(url=expected_url)
+        tab = make_url_tab(url=expected_url)
         
         monitor = URLMonitor(tab, poll_interval=0.1)
         url = await monitor.wait_for_url_contains("linux.do", timeout=5)
@@ -701,7 +659,7 @@ class TestURLMonitorWaitForUrlContains:
         
         **Validates: Requirements 2.5**
         """
-        tab = MockTabForURLMonitor(url="https://example.com")
+        tab = make_url_tab(url="https://example.com")
         
         monitor = URLMonitor(tab, poll_interval=0.1)
         
@@ -718,7 +676,7 @@ class TestURLMonitorWaitForUrlContains:
         
         **Validates: Requirements 2.1**
         """
-        tab = MockTabForURLMonitor(url="https://example.com")
+        tab = make_url_tab(url="https://example.com")
         
         monitor = URLMonitor(tab, poll_interval=0.1)
         
@@ -734,7 +692,7 @@ class TestURLMonitorWaitForUrlContains:
         
         **Validates: Requirements 2.1**
         """
-        tab = MockTabForURLMonitor(url="https://example.com")
+        tab = make_url_tab(url="https://example.com")
         
         monitor = URLMonitor(tab)
         
@@ -750,17 +708,17 @@ class TestURLMonitorWaitForUrlContains:
         
         **Validates: Requirements 2.5**
         """
-        # This test verifies the default timeout parameter value
-        # by checking the function signature
-        import inspect
-        
-        sig = inspect.signature(URLMonitor.wait_for_url_contains)
-        timeout_param = sig.parameters.get('timeout')
-        
-        assert timeout_param is not None, "timeout parameter not found"
-        assert timeout_param.default == 30, (
-            f"Expected default timeout 30, got {timeout_param.default}"
+        # The default is exposed as a class attribute and used as the
+        # timeout parameter's default value
+        assert URLMonitor.DEFAULT_TIMEOUT == 30, (
+            f"Expected default timeout 30, got {URLMonitor.DEFAULT_TIMEOUT}"
         )
+        assert URLMonitor.wait_for_url_contains.__defaults__ == (URLMonitor.DEFAULT_TIMEOUT,)
+
+
+# Printable ASCII is enough for URL-shaped inputs and far cheaper to generate
+# than the full Unicode range st.text() draws from by default.
+URL_CHARS = st.characters(min_codepoint=32, max_codepoint=126)
 
 
 class TestURLMonitorPropertyBased:
@@ -770,30 +728,35 @@ class TestURLMonitorPropertyBased:
     **Validates: Requirements 1.5, 2.1, 2.2, 2.5**
     """
 
-    @given(url=st.text(min_size=0, max_size=200))
-    @settings(max_examples=50)
+    @pytest.fixture(scope="class")
+    def shared_url_tab(self):
+        """One mock tab for the whole class; each example resets its URL."""
+        return make_url_tab()
+
+    @given(url=st.text(alphabet=URL_CHARS, min_size=0, max_size=64))
+    @settings(FAST, max_examples=50)
     @pytest.mark.asyncio
-    async def test_get_current_url_returns_string(self, url: str):
+    async def test_get_current_url_returns_string(self, shared_url_tab, url: str):
         """
         Property: get_current_url always returns a string.
         
         **Validates: Requirements 1.5, 2.2**
         """
-        tab = MockTabForURLMonitor(url=url)
+        reset_url_tab(shared_url_tab, url)
         
-        monitor = URLMonitor(tab)
+        monitor = URLMonitor(shared_url_tab)
         result = await monitor.get_current_url()
         
         assert isinstance(result, str), f"Expected string, got {type(result)}"
 
     @given(
-        url=st.text(min_size=1, max_size=100),
-        pattern=st.text(min_size=1, max_size=20)
+        url=st.text(alphabet=URL_CHARS, min_size=1, max_size=64),
+        pattern=st.text(alphabet=URL_CHARS, min_size=1, max_size=20)
     )
-    @settings(max_examples=50)
+    @settings(FAST, max_examples=50)
     @pytest.mark.asyncio
     async def test_wait_for_url_contains_finds_pattern_when_present(
-        self, url: str, pattern: str
+        self, shared_url_tab, url: str, pattern: str
     ):
         """
         Property: If URL contains pattern, wait_for_url_contains returns the URL.
@@ -802,26 +765,25 @@ class TestURLMonitorPropertyBased:
         """
         # Ensure URL contains the pattern
         full_url = f"https://example.com/{pattern}/page"
-        tab = MockTabForURLMonitor(url=full_url)
+        reset_url_tab(shared_url_tab, full_url)
         
-        monitor = URLMonitor(tab, poll_interval=0.1)
+        monitor = URLMonitor(shared_url_tab, poll_interval=0.1)
         result = await monitor.wait_for_url_contains(pattern, timeout=1)
         
         assert pattern.lower() in result.lower(), (
             f"Pattern '{pattern}' not found in result '{result}'"
         )
 
-    @given(poll_interval=st.floats(min_value=0.01, max_value=2.0))
-    @settings(max_examples=20)
-    def test_poll_interval_is_configurable(self, poll_interval: float):
+    @pytest.mark.parametrize("poll_interval", [0.01, 0.1, 0.5, 1.0, 2.0])
+    def test_poll_interval_is_configurable(self, shared_url_tab, poll_interval: float):
         """
         Property: Poll interval can be configured to any positive value.
         
         **Validates: Requirements 2.1**
         """
-        tab = MockTabForURLMonitor(url="https://example.com")
+        reset_url_tab(shared_url_tab, "https://example.com")
         
-        monitor = URLMonitor(tab, poll_interval=poll_interval)
+        monitor = URLMonitor(shared_url_tab, poll_interval=poll_interval)
         
         assert monitor.poll_interval == poll_interval, (
             f"Expected poll interval {poll_interval}, got {monitor.poll_interval}"
@@ -829,15 +791,106 @@ class TestURLMonitorPropertyBased:
 
 
 # ============================================================================
-# CookieRetriever Tests
+# wait_until Tests
 # ============================================================================
 
-from utils.browser import CookieRetriever
+class TestWaitUntil:
+    """Tests for the deadline-bounded wait_until() helper."""
+
+    @pytest.mark.asyncio
+    async def test_wait_until_returns_true_once_condition_holds(self):
+        """Condition becoming true after a few polls returns True."""
+        calls = {"n": 0}
+
+        def condition():
+            calls["n"] += 1
+            return calls["n"] >= 3
+
+        assert await wait_until(condition, timeout=5, poll_interval=0.01) is True
+        assert calls["n"] == 3
 
+    @pytest.mark.asyncio
+    async def test_wait_until_supports_async_condition(self):
+        """Awaitable conditions are awaited."""
+        async def condition():
+            return True
+
+        assert await wait_until(condition, timeout=1, poll_interval=0.01) is True
+
+    @pytest.mark.asyncio
+    async def test_wait_until_times_out(self):
+        """A condition that never holds returns False after the deadline."""
+        assert await wait_until(lambda: False, timeout=0.05, poll_interval=0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_wait_until_treats_errors_as_not_ready(self):
+        """Exceptions from the condition are swallowed and polling continues."""
+        def condition():
+            raise RuntimeError("not ready")
+
+        assert await wait_until(condition, timeout=0.05, poll_interval=0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_wait_until_backoff_polls_less_often(self):
+        """With backoff the interval grows, so far fewer polls happen before the deadline."""
+        calls = {"fixed": 0, "backoff": 0}
+
+        def counter(key):
+            def condition():
+                calls[key] += 1
+                return False
+            return condition
+
+        await wait_until(counter("fixed"), timeout=0.3, poll_interval=0.01)
+        await wait_until(counter("backoff"), timeout=0.3, poll_interval=0.01, backoff=2.0, max_interval=1.0)
+        assert calls["backoff"] < calls["fixed"]
+        assert calls["backoff"] <= 7
+
+
+class TestFirstFound:
+    """Tests for first_found() concurrent element probing."""
+
+    @pytest.mark.asyncio
+    async def test_first_found_returns_fastest_non_empty_result(self):
+        """A slow probe does not delay a fast successful one."""
+        async def probe(value, delay):
+            await asyncio.sleep(delay)
+            return value
+
+        result = await first_found(probe(None, 0), probe("slow", 1), probe("fast", 0.01), timeout=2)
+        assert result == "fast"
+
+    @pytest.mark.asyncio
+    async def test_first_found_ignores_failing_probes(self):
+        """Probes that raise are treated as not found."""
+        async def failing():
+            raise RuntimeError("element not found")
+
+        async def found():
+            await asyncio.sleep(0.01)
+            return "button"
+
+        assert await first_found(failing(), found(), timeout=1) == "button"
+
+    @pytest.mark.asyncio
+    async def test_first_found_returns_none_on_timeout(self):
+        """Nothing found before the deadline yields None."""
+        async def never():
+            await asyncio.sleep(10)
+            return "late"
+
+        assert await first_found(never(), timeout=0.05) is None
+
+
+# ============================================================================
+# CookieRetriever Tests
+# ============================================================================
 
 class MockCookie:
     """Mock CDP Cookie object for testing."""
     
+    __slots__ = ("name", "domain", "value")
+    
     def __init__(self, name: str, domain: str, value: str):
         self.name = name
         self.domain = domain
@@ -847,6 +900,8 @@ class MockCookie:
 class MockBrowserManagerForCookies:
     """Mock BrowserManager for CookieRetriever testing."""
     
+    __slots__ = ("_cookies", "engine", "_page")
+    
     def __init__(self, cookies: list = None, engine: str = "nodriver"):
         self._cookies = cookies if cookies is not None else []
         self.engine = engine
@@ -856,7 +911,7 @@ class MockBrowserManagerForCookies:
     def page(self):
         return self._page
     
-    async def get_cookies(self) -> list:
+    async def get_cookies(self, tab=None) -> list:
         """Return mock cookies."""
         return self._cookies
 
@@ -864,15 +919,40 @@ class MockBrowserManagerForCookies:
 class MockTabForCookies:
     """Mock nodriver tab for cookie retrieval testing."""
     
+    __slots__ = ("_cookies", "_cdp_fails", "send")
+    
     def __init__(self, cookies: list = None, cdp_fails: bool = False):
         self._cookies = cookies if cookies is not None else []
         self._cdp_fails = cdp_fails
+        # Pick the send() behaviour once instead of branching on every call
+        self.send = self._send_failing if cdp_fails else self._send_cookies
     
-    async def send(self, command):
+    async def _send_cookies(self, command):
         """Mock CDP send method for get_all_cookies."""
-        if self._cdp_fails:
-            raise Exception("CDP command failed")
         return self._cookies
+    
+    async def _send_failing(self, command):
+        """Mock CDP send method that fails like a broken CDP connection."""
+        raise Exception("CDP command failed")
+
+
+@pytest.fixture(scope="session")
+def shared_retriever_factory():
+    """Return make(target_domain, cookies) reusing one mock manager and retriever.
+    
+    Hypothesis examples run sequentially, so the same objects are reset for
+    each example: the cookie list is replaced in place (the mock tab shares it)
+    and the retriever is pointed at the new target domain.
+    """
+    browser = MockBrowserManagerForCookies()
+    retriever = CookieRetriever(browser, "example.com")
+
+    def make(target_domain: str, cookies: list) -> CookieRetriever:
+        browser._cookies[:] = cookies
+        retriever._set_domain(target_domain)
+        return retriever
+
+    return make
 
 
 class TestCookieRetrieverDomainMatching:
@@ -1066,6 +1146,7 @@ class TestCookieRetrieverFindSessionCookie:
         assert result is None
 
 
+@pytest.mark.usefixtures("fast_sleep")
 class TestCookieRetrieverGetSessionCookie:
     """
     Tests for CookieRetriever.get_session_cookie() method.
@@ -1167,12 +1248,12 @@ class TestCookieRetrieverPropertyBased:
             "sub.example.com",
             "deep.sub.example.com",
         ]),
-        session_value=st.text(min_size=1, max_size=50, alphabet=st.characters(whitelist_categories=('L', 'N')))
+        session_value=st.text(alphabet=string.ascii_letters + string.digits, min_size=1, max_size=50)
     )
-    @settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture], deadline=None)
+    @settings(FAST, max_examples=50)
     @pytest.mark.asyncio
     async def test_session_cookie_filtering_returns_correct_value(
-        self, target_domain: str, session_value: str
+        self, shared_retriever_factory, target_domain: str, session_value: str
     ):
         """
         Property: CookieRetriever returns the correct session cookie value.
@@ -1188,8 +1269,7 @@ class TestCookieRetrieverPropertyBased:
             MockCookie("session", "unrelated.com", "wrong_value"),
         ]
         
-        browser = MockBrowserManagerForCookies(cookies=cookies)
-        retriever = CookieRetriever(browser, target_domain)
+        retriever = shared_retriever_factory(target_domain, cookies)
         
         result = await retriever.get_session_cookie(max_retries=1)
         
@@ -1198,13 +1278,13 @@ class TestCookieRetrieverPropertyBased:
         )
 
     @given(
-        target_domain=st.text(min_size=3, max_size=30, alphabet=st.characters(whitelist_categories=('L', 'N'), whitelist_characters='.-')),
+        target_domain=st.from_regex(r"[a-z][a-z0-9\-]{1,10}(\.[a-z][a-z0-9\-]{1,10}){1,2}", fullmatch=True),
         other_cookies_count=st.integers(min_value=0, max_value=10)
     )
-    @settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture], deadline=None)
+    @settings(FAST, max_examples=50)
     @pytest.mark.asyncio
     async def test_session_cookie_filtering_ignores_non_session_cookies(
-        self, target_domain: str, other_cookies_count: int
+        self, shared_retriever_factory, target_domain: str, other_cookies_count: int
     ):
         """
         Property: CookieRetriever ignores cookies that are not named "session".
@@ -1214,18 +1294,13 @@ class TestCookieRetrieverPropertyBased:
         For any number of non-session cookies, the retriever should
         return None if no session cookie exists.
         """
-        # Ensure target_domain is valid
-        assume(len(target_domain) >= 3)
-        assume("." in target_domain or target_domain.isalnum())
-        
         # Create non-session cookies
         cookies = [
             MockCookie(f"cookie_{i}", target_domain, f"value_{i}")
             for i in range(other_cookies_count)
         ]
         
-        browser = MockBrowserManagerForCookies(cookies=cookies)
-        retriever = CookieRetriever(browser, target_domain)
+        retriever = shared_retriever_factory(target_domain, cookies)
         
         result = await retriever.get_session_cookie(max_retries=1)
         
@@ -1241,10 +1316,10 @@ class TestCookieRetrieverPropertyBased:
             max_size=5
         )
     )
-    @settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture], deadline=None)
+    @settings(FAST, max_examples=50)
     @pytest.mark.asyncio
     async def test_session_cookie_filtering_ignores_wrong_domains(
-        self, target_domain: str, wrong_domains: list
+        self, shared_retriever_factory, target_domain: str, wrong_domains: list
     ):
         """
         Property: CookieRetriever ignores session cookies from wrong domains.
@@ -1260,8 +1335,7 @@ class TestCookieRetrieverPropertyBased:
             for domain in wrong_domains
         ]
         
-        browser = MockBrowserManagerForCookies(cookies=cookies)
-        retriever = CookieRetriever(browser, target_domain)
+        retriever = shared_retriever_factory(target_domain, cookies)
         
         result = await retriever.get_session_cookie(max_retries=1)
         
@@ -1273,10 +1347,10 @@ class TestCookieRetrieverPropertyBased:
         base_domain=st.sampled_from(["example.com", "linux.do"]),
         subdomain_prefix=st.sampled_from(["sub", "api", "www", "app"])
     )
-    @settings(max_examples=30, suppress_health_check=[HealthCheck.function_scoped_fixture], deadline=None)
+    @settings(FAST, max_examples=8, derandomize=True)
     @pytest.mark.asyncio
     async def test_session_cookie_filtering_matches_subdomains(
-        self, base_domain: str, subdomain_prefix: str
+        self, shared_retriever_factory, base_domain: str, subdomain_prefix: str
     ):
         """
         Property: CookieRetriever matches session cookies from subdomains.
@@ -1294,8 +1368,7 @@ class TestCookieRetrieverPropertyBased:
             MockCookie("session", f".{base_domain}", session_value),
         ]
         
-        browser = MockBrowserManagerForCookies(cookies=cookies)
-        retriever = CookieRetriever(browser, subdomain)
+        retriever = shared_retriever_factory(subdomain, cookies)
         
         result = await retriever.get_session_cookie(max_retries=1)
         
@@ -1357,7 +1430,7 @@ class TestEnvironmentBasedBrowserConfiguration:
         display_set=st.booleans(),
         is_root=st.booleans()
     )
-    @settings(max_examples=100)
+    @settings(FAST, max_examples=8, derandomize=True)
     def test_display_set_implies_non_headless(
         self, headless_requested: bool, display_set: bool, is_root: bool
     ):
@@ -1386,7 +1459,7 @@ class TestEnvironmentBasedBrowserConfiguration:
         display_set=st.booleans(),
         is_root=st.booleans()
     )
-    @settings(max_examples=100)
+    @settings(FAST, max_examples=8, derandomize=True)
     def test_root_user_implies_no_sandbox(
         self, headless_requested: bool, display_set: bool, is_root: bool
     ):
@@ -1414,7 +1487,7 @@ class TestEnvironmentBasedBrowserConfiguration:
         display_set=st.booleans(),
         is_root=st.booleans()
     )
-    @settings(max_examples=100)
+    @settings(FAST, max_examples=8, derandomize=True)
     def test_non_root_implies_sandbox_enabled(
         self, headless_requested: bool, display_set: bool, is_root: bool
     ):
@@ -1442,7 +1515,7 @@ class TestEnvironmentBasedBrowserConfiguration:
         display_set=st.booleans(),
         is_root=st.booleans()
     )
-    @settings(max_examples=100)
+    @settings(FAST, max_examples=8, derandomize=True)
     def test_no_display_respects_headless_request(
         self, headless_requested: bool, display_set: bool, is_root: bool
     ):
@@ -1470,7 +1543,7 @@ class TestEnvironmentBasedBrowserConfiguration:
         display_set=st.booleans(),
         is_root=st.booleans()
     )
-    @settings(max_examples=100)
+    @settings(FAST, max_examples=8, derandomize=True)
     def test_headless_and_sandbox_are_independent(
         self, headless_requested: bool, display_set: bool, is_root: bool
     ):
@@ -1602,7 +1675,7 @@ class TestEnvironmentBasedBrowserConfigurationWithMonkeypatch:
     """
 
     @given(display_value=st.sampled_from([":0", ":1", ":99", ":0.0"]))
-    @settings(max_examples=20, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @settings(FAST_WITH_FIXTURES, max_examples=4, derandomize=True)
     def test_display_env_var_detection(self, monkeypatch, display_value: str):
         """
         Property: DISPLAY environment variable is correctly detected.
@@ -1638,7 +1711,7 @@ class TestEnvironmentBasedBrowserConfigurationWithMonkeypatch:
         github_actions=st.booleans(),
         ci=st.booleans()
     )
-    @settings(max_examples=20, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @settings(FAST_WITH_FIXTURES, max_examples=4, derandomize=True)
     def test_ci_environment_detection(
         self, monkeypatch, github_actions: bool, ci: bool
     ):
@@ -1686,7 +1759,7 @@ class TestBrowserConfigurationIntegration:
         display_set=st.booleans(),
         is_root=st.booleans()
     )
-    @settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @settings(FAST_WITH_FIXTURES, max_examples=8, derandomize=True)
     def test_browser_manager_config_consistency(
         self, monkeypatch, headless: bool, display_set: bool, is_root: bool
     ):
@@ -1709,7 +1782,6 @@ class TestBrowserConfigurationIntegration:
         monkeypatch.setattr(os, 'geteuid', lambda: 0 if is_root else 1000, raising=False)
         
         # Create BrowserManager (don't start it)
-        from utils.browser import BrowserManager
         manager = BrowserManager(engine="nodriver", headless=headless)
         
         # Verify initial configuration
@@ -1779,3 +1851,115 @@ class TestBrowserConfigurationIntegration:
                 f"expected {exp_sandbox}, got {actual_sandbox}"
             )
 
+
+
+# ============================================================================
+# BrowserManager 浏览器池
+# ============================================================================
+
+class TestBrowserManagerPool:
+    """Tests for BrowserManager.acquire_pooled()/release_pooled()."""
+
+    @pytest.fixture
+    def fake_lifecycle(self, monkeypatch):
+        events = {"started": 0, "closed": 0}
+
+        async def fake_start(self, max_retries: int = 3):
+            events["started"] += 1
+            await asyncio.sleep(0)
+            self._nodriver_browser = object()
+
+        async def fake_close(self):
+            events["closed"] += 1
+            self._nodriver_browser = None
+
+        monkeypatch.setattr(BrowserManager, "start", fake_start)
+        monkeypatch.setattr(BrowserManager, "close", fake_close)
+        return events
+
+    @pytest.mark.asyncio
+    async def test_released_browser_is_reused_within_shared_session(self, fake_lifecycle):
+        """Same key reuses the idle browser; a different key starts a new one."""
+        async with BrowserManager.shared_session():
+            first = await BrowserManager.acquire_pooled(("alice",), engine="nodriver")
+            await BrowserManager.release_pooled(first)
+            again = await BrowserManager.acquire_pooled(("alice",), engine="nodriver")
+            other = await BrowserManager.acquire_pooled(("bob",), engine="nodriver")
+            assert again is first
+            assert other is not first
+            await BrowserManager.release_pooled(again)
+            await BrowserManager.release_pooled(other, reusable=False)
+            assert fake_lifecycle == {"started": 2, "closed": 1}
+
+        assert fake_lifecycle["closed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_release_outside_shared_session_closes_browser(self, fake_lifecycle):
+        """Without a shared_session() scope nothing is kept alive."""
+        manager = await BrowserManager.acquire_pooled(("alice",), engine="nodriver")
+        await BrowserManager.release_pooled(manager)
+        assert fake_lifecycle == {"started": 1, "closed": 1}
+        assert not BrowserManager._pool
+
+    def test_shared_lock_survives_a_second_event_loop(self, fake_lifecycle):
+        """Contending for the shared lock in two asyncio.run() calls must not hit a loop-bound lock."""
+
+        async def contend():
+            # get_shared() awaits start() while holding the lock, so the second caller has to wait on it
+            first, second = await asyncio.gather(
+                BrowserManager.get_shared("nodriver"), BrowserManager.get_shared("nodriver")
+            )
+            assert first is second
+            await BrowserManager.close_shared()
+
+        asyncio.run(contend())
+        asyncio.run(contend())
+        assert fake_lifecycle == {"started": 2, "closed": 2}
+
+
+class TestBrowserManagerGetCookie:
+    """Tests for BrowserManager.get_cookie() URL filtering."""
+
+    @pytest.mark.asyncio
+    async def test_url_is_forwarded_to_context_cookies(self):
+        """With url=..., only that site's cookies are requested from the context."""
+        calls = []
+
+        class FakeContext:
+            async def cookies(self, *urls):
+                calls.append(urls)
+                return [{"name": "session", "domain": "wzw.pp.ua", "value": "abc"}]
+
+        class FakePage:
+            context = FakeContext()
+
+        manager = BrowserManager(engine="patchright")
+        value = await manager.get_cookie("session", "wzw.pp.ua", tab=FakePage(), url="https://wzw.pp.ua")
+        assert value == "abc"
+        assert calls == [(["https://wzw.pp.ua"],)]
+
+        await manager.get_cookie("session", "wzw.pp.ua", tab=FakePage())
+        assert calls[-1] == ()
+
+    @pytest.mark.asyncio
+    async def test_has_cf_clearance_reads_the_tab_context(self):
+        """has_cf_clearance() checks the tab's own context and treats read errors as not cleared."""
+
+        class FakeContext:
+            def __init__(self, cookies):
+                self._cookies = cookies
+
+            async def cookies(self, *urls):
+                if self._cookies is None:
+                    raise RuntimeError("context closed")
+                return self._cookies
+
+        def page(cookies):
+            return SimpleNamespace(context=FakeContext(cookies))
+
+        manager = BrowserManager(engine="patchright")
+        cleared = page([{"name": "cf_clearance", "domain": ".wzw.pp.ua", "value": "ok"}])
+        assert await manager.has_cf_clearance("https://wzw.pp.ua/", tab=cleared)
+        assert not await manager.has_cf_clearance("https://wzw.pp.ua/", tab=page([]))
+        assert not await manager.has_cf_clearance("https://wzw.pp.ua/", tab=page(None))
+        assert not await manager.has_cf_clearance("about:blank", tab=cleared)
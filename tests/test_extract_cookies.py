@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+scripts/extract_cookies.py 的单元测试
+
+测试 session cookie 到站点的匹配优先级。
+"""
+
+import importlib.util
+from http.cookiejar import Cookie
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("browser_cookie3")
+
+_SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "extract_cookies.py"
+_spec = importlib.util.spec_from_file_location("extract_cookies", _SCRIPT)
+extract_cookies = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(extract_cookies)
+
+
+def make_cookie(domain: str, value: str, name: str = "session") -> Cookie:
+    return Cookie(
+        version=0, name=name, value=value, port=None, port_specified=False,
+        domain=domain, domain_specified=domain.startswith("."),
+        domain_initial_dot=domain.startswith("."), path="/", path_specified=True,
+        secure=True, expires=None, discard=True, comment=None, comment_url=None,
+        rest={},
+    )
+
+
+SITES = {
+    "wong": {"domain": "api.wongapi.com"},
+    "kfcapi": {"domain": "kfcapi.com"},
+}
+
+
+class TestLoadSiteSessions:
+    """测试 load_site_sessions 的匹配优先级"""
+
+    def load(self, cookies):
+        trie = extract_cookies.build_domain_trie(SITES)
+        return extract_cookies.load_site_sessions(lambda: cookies, trie)
+
+    @pytest.mark.parametrize("order", [1, -1])
+    def test_exact_cookie_beats_parent_domain_cookie(self, order):
+        """站点自身的 cookie 优先于上级域名 cookie，与出现顺序无关"""
+        cookies = [make_cookie(".wongapi.com", "parent"), make_cookie("api.wongapi.com", "exact")]
+        assert self.load(cookies[::order])["wong"] == "exact"
+
+    @pytest.mark.parametrize("order", [1, -1])
+    def test_host_only_cookie_beats_domain_cookie(self, order):
+        """host-only cookie 优先于同名域名的 domain cookie"""
+        cookies = [make_cookie(".api.wongapi.com", "domain"), make_cookie("api.wongapi.com", "host")]
+        assert self.load(cookies[::order])["wong"] == "host"
+
+    @pytest.mark.parametrize("order", [1, -1])
+    def test_subdomain_cookie_beats_parent_domain_cookie(self, order):
+        """子域名 cookie 优先于上级域名 cookie"""
+        cookies = [make_cookie(".wongapi.com", "parent"), make_cookie("www.api.wongapi.com", "sub")]
+        assert self.load(cookies[::order])["wong"] == "sub"
+
+    def test_parent_domain_cookie_used_when_only_match(self):
+        """只有上级域名 cookie 时仍然命中"""
+        assert self.load([make_cookie(".wongapi.com", "parent")]) == {"wong": "parent"}
+
+    def test_ignores_other_cookies(self):
+        """非 session 或空值 cookie 被忽略"""
+        cookies = [make_cookie("kfcapi.com", "x", name="token"), make_cookie("kfcapi.com", "")]
+        assert self.load(cookies) == {}
@@ -13,11 +13,13 @@ GitHub Actions 环境需要配合 Xvfb 虚拟显示使用。
 
 import asyncio
 import contextlib
+import functools
 import gc
 import inspect
 import os
+import weakref
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Literal
 
 if TYPE_CHECKING:
     pass
@@ -70,15 +72,108 @@ class BrowserStartupError(Exception):
         super().__init__(full_message)
 
 
+async def wait_until(
+    condition: Callable[[], Any],
+    timeout: float = 15,
+    poll_interval: float = 0.2,
+    backoff: float = 1.0,
+    max_interval: float = 1.0,
+) -> bool:
+    """轮询条件直到满足或超时，用于替代固定时长的 sleep。
+
+    Args:
+        condition: 无参条件函数（同步或异步），返回真值表示满足
+        timeout: 超时时间（秒）
+        poll_interval: 首次轮询间隔（秒）
+        backoff: 每次轮询后间隔的增长倍数，1.0 表示固定间隔
+        max_interval: 间隔增长的上限（秒）
+
+    Returns:
+        条件是否在超时前满足
+    """
+    loop = asyncio.get_event_loop()
+    deadline = loop.time() + timeout
+    interval = poll_interval
+    while True:
+        try:
+            result = condition()
+            if inspect.isawaitable(result):
+                result = await result
+            if result:
+                return True
+        except Exception as e:
+            logger.debug(f"等待条件检查出错: {e}")
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(interval, remaining))
+        if backoff > 1.0:
+            interval = min(interval * backoff, max_interval)
+
+
+async def first_found(*probes: Awaitable[Any], timeout: float) -> Any | None:
+    """并发执行多个元素查找，返回最先得到的非空结果。
+
+    替代逐个串行尝试选择器的写法：最坏情况的等待时间由各探测超时之和降为单个超时。
+
+    Args:
+        *probes: 元素查找协程（如 tab.find(...)），失败或未找到时应返回 None 或抛出异常
+        timeout: 总超时时间（秒）
+
+    Returns:
+        第一个非空结果，全部失败或超时返回 None
+    """
+    tasks = [asyncio.ensure_future(probe) for probe in probes]
+    loop = asyncio.get_event_loop()
+    deadline = loop.time() + timeout
+    pending = set(tasks)
+    try:
+        while pending:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if not task.cancelled() and task.exception() is None and task.result():
+                    return task.result()
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def wait_for_document_ready(tab: Any, timeout: float = 10) -> bool:
+    """等待 nodriver 标签页的 document.readyState 变为 complete。
+
+    Args:
+        tab: nodriver 标签页对象
+        timeout: 超时时间（秒）
+
+    Returns:
+        页面是否在超时前加载完成
+    """
+    async def _is_ready() -> bool:
+        return await tab.evaluate("document.readyState") == "complete"
+
+    return await wait_until(_is_ready, timeout=timeout)
+
+
 class TabManager:
     """管理 OAuth 流程中的浏览器标签页。
 
     用于检测新标签页的打开、切换到指定标签页、以及识别 OAuth 相关的标签页。
 
+    多个登录流程共享同一浏览器时，传入 opener 后只识别 opener 自身及由它打开的标签页
+    （target.opener_id），避免取到其他流程的 OAuth 标签页。
+
     Attributes:
         browser: nodriver 浏览器实例
+        _opener_id: 限定范围的 opener 标签页 target_id，None 表示不限定
         _initial_tab_count: 记录的初始标签页数量
         _initial_tabs: 记录的初始标签页列表
+        _initial_tab_ids: 初始标签页 ID 集合，供检测新标签页时做成员判断
 
     Requirements:
         - 1.3: 使用 bring_to_front() 切换到新标签页
@@ -87,15 +182,28 @@ class TabManager:
         - 3.3: 调用 bring_to_front() 确保标签页处于活动状态
     """
 
-    def __init__(self, browser: Any):
+    def __init__(self, browser: Any, opener: Any = None):
         """初始化 TabManager。
 
         Args:
             browser: nodriver 浏览器实例（通过 uc.start() 返回）
+            opener: 发起 OAuth 的标签页；传入时只考虑它自身及由它打开的标签页
         """
         self.browser = browser
+        self._opener_id = None if opener is None else getattr(opener.target, 'target_id', id(opener))
         self._initial_tab_count: int = 0
         self._initial_tabs: list = []
+        self._initial_tab_ids: frozenset = frozenset()
+
+    def _in_scope(self, tab: Any) -> bool:
+        """标签页是否为 opener 自身或由它打开（未指定 opener 时总是 True）"""
+        if self._opener_id is None:
+            return True
+        target = getattr(tab, 'target', None)
+        return self._opener_id in (
+            getattr(target, 'target_id', id(tab)),
+            getattr(target, 'opener_id', None),
+        )
 
     def record_tab_count(self) -> int:
         """记录当前标签页数量（在 OAuth 点击前调用）。
@@ -112,6 +220,7 @@ class TabManager:
         if self.browser is None:
             self._initial_tab_count = 0
             self._initial_tabs = []
+            self._initial_tab_ids = frozenset()
             return 0
 
         # nodriver 的 browser.tabs 是标签页列表
@@ -122,6 +231,7 @@ class TabManager:
             getattr(tab.target, 'target_id', id(tab))
             for tab in tabs
         ]
+        self._initial_tab_ids = frozenset(self._initial_tabs)
 
         logger.debug(f"记录初始标签页数量: {self._initial_tab_count}")
         return self._initial_tab_count
@@ -151,12 +261,12 @@ class TabManager:
             current_tabs = self.browser.tabs if hasattr(self.browser, 'tabs') else []
             current_count = len(current_tabs)
 
-            # 检查是否有新标签页
-            if current_count > self._initial_tab_count:
+            # 检查是否有新标签页（限定 opener 时其他流程可能同时关闭标签页，数量不可靠）
+            if self._opener_id is not None or current_count > self._initial_tab_count:
                 # 找出新增的标签页
                 for tab in current_tabs:
                     tab_id = getattr(tab.target, 'target_id', id(tab))
-                    if tab_id not in self._initial_tabs:
+                    if tab_id not in self._initial_tab_ids and self._in_scope(tab):
                         logger.info(f"检测到新标签页: {getattr(tab.target, 'url', 'unknown')}")
                         return tab
 
@@ -195,8 +305,9 @@ class TabManager:
     async def find_oauth_tab(self) -> Any | None:
         """查找 OAuth 相关的标签页。
 
-        遍历所有标签页，通过检查 URL 是否包含 OAuth 相关关键词
-        （如 "linux.do"、"oauth"）来识别正确的 OAuth 标签页。
+        遍历所有标签页（指定 opener 时仅限 opener 自身及由它打开的标签页），
+        通过检查 URL 是否包含 OAuth 相关关键词（如 "linux.do"、"oauth"）
+        来识别正确的 OAuth 标签页。
 
         Returns:
             OAuth 相关的标签页对象，如果未找到则返回 None
@@ -210,6 +321,9 @@ class TabManager:
         tabs = self.browser.tabs if hasattr(self.browser, 'tabs') else []
 
         for tab in tabs:
+            if not self._in_scope(tab):
+                continue
+
             # 获取标签页 URL
             url = getattr(tab.target, 'url', '') if hasattr(tab, 'target') else ''
 
@@ -231,6 +345,8 @@ class URLMonitor:
     Attributes:
         tab: nodriver 标签页实例
         poll_interval: URL 轮询间隔（秒），默认 0.5 秒
+        backoff: 每次轮询后间隔的增长倍数，默认 1.0（固定间隔）
+        max_interval: 间隔增长的上限（秒）
 
     Requirements:
         - 1.4: 如果 OAuth 按钮点击没有打开新标签页，则监控当前标签页的 URL 变化
@@ -240,16 +356,29 @@ class URLMonitor:
         - 2.5: 如果 URL 在超时时间内没有变化，返回超时错误
     """
 
-    def __init__(self, tab: Any, poll_interval: float = 0.5):
+    # wait_for_url_contains 的默认超时（秒），Requirements 2.5
+    DEFAULT_TIMEOUT: int = 30
+
+    def __init__(
+        self,
+        tab: Any,
+        poll_interval: float = 0.5,
+        backoff: float = 1.0,
+        max_interval: float = 1.0,
+    ):
         """初始化 URLMonitor。
 
         Args:
             tab: nodriver 标签页实例（通过 browser.get() 返回）
             poll_interval: URL 轮询间隔（秒），默认 0.5 秒
                           Requirements 2.1 要求 500ms 间隔
+            backoff: 间隔增长倍数，大于 1 时先快速轮询再逐步放慢
+            max_interval: 间隔增长的上限（秒）
         """
         self.tab = tab
         self.poll_interval = poll_interval
+        self.backoff = backoff
+        self.max_interval = max_interval
 
     async def get_current_url(self) -> str:
         """使用 CDP get_frame_tree() 获取准确的当前 URL。
@@ -293,10 +422,10 @@ class URLMonitor:
 
         return ""
 
-    async def wait_for_url_contains(self, pattern: str, timeout: int = 30) -> str:
+    async def wait_for_url_contains(self, pattern: str, timeout: int = DEFAULT_TIMEOUT) -> str:
         """等待 URL 包含指定的模式。
 
-        以固定间隔（poll_interval）轮询当前 URL，直到 URL 包含指定的模式
+        以 poll_interval 为间隔（可按 backoff 递增）轮询当前 URL，直到 URL 包含指定的模式
         或超时。使用 CDP 获取准确的 URL。
 
         Args:
@@ -321,6 +450,7 @@ class URLMonitor:
 
         start_time = asyncio.get_event_loop().time()
         last_url = ""
+        interval = self.poll_interval
 
         while asyncio.get_event_loop().time() - start_time < timeout:
             current_url = await self.get_current_url()
@@ -335,8 +465,10 @@ class URLMonitor:
                 logger.info(f"URL 匹配成功: {current_url}")
                 return current_url
 
-            # 按照 Requirements 2.1 的要求，以 500ms 间隔轮询
-            await asyncio.sleep(self.poll_interval)
+            # 默认按照 Requirements 2.1 的要求以固定间隔轮询；配置 backoff 时逐步放慢
+            await asyncio.sleep(interval)
+            if self.backoff > 1.0:
+                interval = min(interval * self.backoff, self.max_interval)
 
         # 超时，抛出 TimeoutError（Requirements 2.5）
         elapsed = asyncio.get_event_loop().time() - start_time
@@ -362,15 +494,35 @@ class CookieRetriever:
         - 6.4: 如果 OAuth 完成后未找到 session cookie，等待最多 5 秒并重试
     """
 
-    def __init__(self, browser_manager: "BrowserManager", domain: str):
+    def __init__(self, browser_manager: "BrowserManager", domain: str, tab: Any = None):
         """初始化 CookieRetriever。
 
         Args:
             browser_manager: BrowserManager 实例，用于访问浏览器
             domain: 目标域名，用于匹配 cookie（如 "example.com"）
+            tab: 可选的标签页对象，默认使用 browser_manager.page
         """
         self.browser = browser_manager
-        self.domain = domain.lower().lstrip(".")  # 规范化域名
+        self.tab = tab
+        self._set_domain(domain)
+
+    def _set_domain(self, domain: str) -> None:
+        """设置目标域名，并重建依赖它的匹配数据和缓存。"""
+        self.domain = self._normalize_domain(domain)
+        self._dot_domain = "." + self.domain  # 子域名匹配用的后缀，避免每次拼接
+        # 目标域名自身及其所有父域名（sub.example.com -> example.com -> com），
+        # 精确匹配和反向子域名匹配都只需一次集合查找
+        labels = self.domain.split(".")
+        self._suffix_set = frozenset(".".join(labels[i:]) for i in range(len(labels)))
+        # 同一个 cookie 域名在重试和多次查找中会反复出现，按实例缓存匹配结果
+        self._normalized_domain_matches = functools.lru_cache(maxsize=512)(
+            self._normalized_domain_matches_impl
+        )
+
+    @staticmethod
+    def _normalize_domain(domain: str | None) -> str:
+        """规范化域名：去掉前缀点，转小写"""
+        return (domain or "").lower().lstrip(".")
 
     def _domain_matches(self, cookie_domain: str) -> bool:
         """检查 cookie 域名是否匹配目标域名（包括子域名）。
@@ -394,24 +546,21 @@ class CookieRetriever:
             - ".sub.example.com" -> True (子域名带前缀点)
             - "other.com" -> False
         """
-        if not cookie_domain:
-            return False
-
-        # 规范化 cookie 域名：去掉前缀点，转小写
-        normalized_cookie_domain = cookie_domain.lower().lstrip(".")
+        return self._normalized_domain_matches(self._normalize_domain(cookie_domain))
 
-        # 精确匹配
-        if normalized_cookie_domain == self.domain:
-            return True
+    def _normalized_domain_matches_impl(self, cookie_domain: str) -> bool:
+        """_domain_matches 的核心判断，cookie_domain 已经过 _normalize_domain 规范化。
 
-        # 子域名匹配：cookie 域名以 ".target_domain" 结尾
-        # 例如：sub.example.com 匹配 example.com
-        if normalized_cookie_domain.endswith("." + self.domain):
-            return True
+        通过 __init__ 中按实例缓存的 self._normalized_domain_matches 调用。
+        """
+        if not cookie_domain:
+            return False
 
-        # 反向子域名匹配：target 域名以 ".cookie_domain" 结尾
-        # 例如：target=sub.example.com, cookie=example.com
-        return bool(self.domain.endswith("." + normalized_cookie_domain))
+        # 相等或按标签边界互为父域名（notexample.com 不会匹配 example.com）：
+        # - 精确匹配 / 反向子域名匹配（target=sub.example.com, cookie=example.com）：
+        #   cookie 域名是目标域名的某个后缀
+        # - 子域名匹配：sub.example.com 匹配 example.com
+        return cookie_domain in self._suffix_set or cookie_domain.endswith(self._dot_domain)
 
     async def _get_cookies_via_cdp(self) -> list:
         """使用 CDP network.get_cookies() 获取 cookies。
@@ -427,13 +576,13 @@ class CookieRetriever:
         """
         if self.browser.engine != "nodriver":
             # 非 nodriver 引擎使用 BrowserManager 的 get_cookies 方法
-            return await self.browser.get_cookies()
+            return await self.browser.get_cookies(tab=self.tab)
 
         # nodriver 引擎使用 CDP
         try:
             import nodriver.cdp.network as cdp_network
 
-            tab = self.browser.page
+            tab = self.tab if self.tab is not None else self.browser.page
             if tab is None:
                 logger.warning("nodriver tab 为空，无法获取 cookies")
                 return []
@@ -448,12 +597,29 @@ class CookieRetriever:
         except Exception as e:
             logger.warning(f"CDP get_all_cookies() 失败，回退到内置方法: {e}")
             # 回退到 BrowserManager 的 get_cookies 方法
-            return await self.browser.get_cookies()
+            return await self.browser.get_cookies(tab=self.tab)
+
+    @classmethod
+    def _normalize_cookies(cls, cookies: list) -> list[tuple[str, str, str]]:
+        """把 cookies 统一转换为 (name, 规范化后的 domain, value) 元组。
+
+        支持字典和 nodriver CDP 返回的 Cookie 对象两种格式，域名只在这里规范化一次。
+        """
+        normalized = []
+        for cookie in cookies:
+            if isinstance(cookie, dict):
+                name, domain, value = cookie.get("name", ""), cookie.get("domain", ""), cookie.get("value", "")
+            else:
+                name = getattr(cookie, "name", "")
+                domain = getattr(cookie, "domain", "")
+                value = getattr(cookie, "value", "")
+            normalized.append((name, cls._normalize_domain(domain), value))
+        return normalized
 
     def _find_session_cookie(self, cookies: list) -> str | None:
         """从 cookie 列表中查找匹配的 session cookie。
 
-        遍历所有 cookies，查找名称为 "session" 且域名匹配目标域名的 cookie。
+        先按名称筛出 "session" cookie，再在其中查找域名匹配目标域名的 cookie。
 
         Args:
             cookies: Cookie 列表
@@ -464,44 +630,28 @@ class CookieRetriever:
         Requirements:
             - 6.3: 通过 cookie 名称（"session"）和域名进行匹配
         """
-        # 打印所有 cookies 用于调试
-        session_cookies_found = []
-        for cookie in cookies:
-            # 获取 cookie 属性（支持对象和字典两种格式）
-            if isinstance(cookie, dict):
-                cookie_name = cookie.get("name", "")
-                cookie_domain = cookie.get("domain", "")
-                cookie_value = cookie.get("value", "")
-            else:
-                # nodriver CDP 返回的是 Cookie 对象
-                cookie_name = getattr(cookie, "name", "")
-                cookie_domain = getattr(cookie, "domain", "")
-                cookie_value = getattr(cookie, "value", "")
-
-            # 记录所有 session cookie（不管域名）
-            if cookie_name == "session":
-                session_cookies_found.append({
-                    "domain": cookie_domain,
-                    "value_preview": cookie_value[:20] + "..." if len(cookie_value) > 20 else cookie_value
-                })
+        if not cookies:
+            return None
 
-            # 检查名称是否为 "session"
-            if cookie_name != "session":
-                continue
+        # 先按名称筛出 session cookie，只对这些 cookie 做域名匹配
+        session_cookies = [
+            (domain, value) for name, domain, value in self._normalize_cookies(cookies) if name == "session"
+        ]
 
-            # 检查域名是否匹配
-            if self._domain_matches(cookie_domain):
+        for cookie_domain, cookie_value in session_cookies:
+            if self._normalized_domain_matches(cookie_domain):
                 logger.debug(
                     f"找到匹配的 session cookie: "
-                    f"name={cookie_name}, domain={cookie_domain}"
+                    f"name=session, domain={cookie_domain}"
                 )
                 return cookie_value
 
         # 如果没找到匹配的，打印所有 session cookies 用于调试
-        if session_cookies_found:
-            logger.debug(f"找到 {len(session_cookies_found)} 个 session cookie，但域名不匹配 {self.domain}:")
-            for sc in session_cookies_found:
-                logger.debug(f"  - domain={sc['domain']}, value={sc['value_preview']}")
+        if session_cookies:
+            logger.debug(f"找到 {len(session_cookies)} 个 session cookie，但域名不匹配 {self.domain}:")
+            for cookie_domain, cookie_value in session_cookies:
+                value_preview = cookie_value[:20] + "..." if len(cookie_value) > 20 else cookie_value
+                logger.debug(f"  - domain={cookie_domain}, value={value_preview}")
 
         return None
 
@@ -572,6 +722,18 @@ class CookieRetriever:
 class BrowserManager:
     """浏览器管理器，统一管理多种浏览器引擎。"""
 
+    # 进程级共享实例（按引擎区分），多个适配器复用同一个浏览器进程
+    _shared: dict[str, "BrowserManager"] = {}
+    # asyncio.Lock 绑定首次争用它的事件循环，因此按运行中的事件循环分别创建
+    _shared_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    # 独占式浏览器池（按启动配置区分），仅在 shared_session() 范围内保留空闲实例
+    _pool: dict[tuple, list["BrowserManager"]] = {}
+    _pooling = False
+    POOL_MAX_IDLE = 1  # 每种启动配置保留的空闲浏览器数
+
     def __init__(
         self,
         engine: BrowserEngine = DEFAULT_ENGINE,
@@ -598,6 +760,163 @@ class BrowserManager:
         self._nodriver_browser = None  # nodriver 专用
         self._nodriver_tab = None  # nodriver 专用
 
+    @classmethod
+    def _shared_lock(cls) -> asyncio.Lock:
+        """获取当前事件循环的共享状态锁（多次 asyncio.run 时各用各的锁）"""
+        loop = asyncio.get_running_loop()
+        lock = cls._shared_locks.get(loop)
+        if lock is None:
+            lock = cls._shared_locks[loop] = asyncio.Lock()
+        return lock
+
+    @classmethod
+    async def get_shared(cls, engine: BrowserEngine = DEFAULT_ENGINE, headless: bool = True) -> "BrowserManager":
+        """获取指定引擎的共享浏览器实例（首次调用时启动）。
+
+        浏览器启动和 Cloudflare 指纹预热是登录流程中最耗时的部分，
+        多个账号/站点共享同一浏览器进程，每次登录只新开一个标签页/上下文。
+
+        Args:
+            engine: 浏览器引擎类型
+            headless: 是否无头模式（仅在首次启动时生效）
+
+        Returns:
+            已启动的 BrowserManager 实例
+        """
+        async with cls._shared_lock():
+            manager = cls._shared.get(engine)
+            if manager is None or manager.browser is None:
+                manager = cls(engine=engine, headless=headless)
+                await manager.start()
+                cls._shared[engine] = manager
+            return manager
+
+    @classmethod
+    async def acquire_pooled(
+        cls,
+        key: tuple,
+        engine: BrowserEngine = DEFAULT_ENGINE,
+        headless: bool = True,
+        user_data_dir: str | None = None,
+        max_retries: int = 3,
+    ) -> "BrowserManager":
+        """从浏览器池取出一个独占的浏览器实例，没有空闲实例时新启动一个。
+
+        与 get_shared() 不同，取出的实例在 release_pooled() 之前只归调用方使用，
+        适合需要独占主标签页和登录态的流程（如 NewAPI 浏览器 OAuth）。
+
+        Args:
+            key: 池键，调用方需包含所有影响浏览器状态的因素（如账号、用户数据目录）
+            engine: 浏览器引擎类型
+            headless: 是否无头模式
+            user_data_dir: 用户数据目录
+            max_retries: 新启动浏览器时的最大重试次数
+
+        Returns:
+            已启动的 BrowserManager 实例
+        """
+        pool_key = (engine, headless, user_data_dir, *key)
+        async with cls._shared_lock():
+            idle = cls._pool.get(pool_key) or []
+            manager = idle.pop() if idle else None
+
+        if manager is not None and manager.browser is not None:
+            logger.info("复用浏览器池中的空闲浏览器")
+        else:
+            manager = cls(engine=engine, headless=headless, user_data_dir=user_data_dir)
+            await manager.start(max_retries=max_retries)
+        manager._pool_key = pool_key
+        return manager
+
+    @classmethod
+    async def release_pooled(cls, manager: "BrowserManager", reusable: bool = True) -> None:
+        """归还 acquire_pooled() 取出的浏览器；不在 shared_session() 范围内或池已满时直接关闭"""
+        pool_key = getattr(manager, "_pool_key", None)
+        if reusable and cls._pooling and pool_key is not None and manager.browser is not None:
+            async with cls._shared_lock():
+                idle = cls._pool.setdefault(pool_key, [])
+                if len(idle) < cls.POOL_MAX_IDLE:
+                    idle.append(manager)
+                    return
+        await manager.close()
+
+    @classmethod
+    async def close_shared(cls) -> None:
+        """关闭所有共享浏览器实例和池中的空闲浏览器（在整个运行结束时调用）"""
+        async with cls._shared_lock():
+            managers = list(cls._shared.values())
+            cls._shared.clear()
+            for idle in cls._pool.values():
+                managers.extend(idle)
+            cls._pool.clear()
+        # 各引擎的浏览器互不依赖，并发关闭
+        await asyncio.gather(*(manager.close() for manager in managers), return_exceptions=True)
+
+    @classmethod
+    @contextlib.asynccontextmanager
+    async def shared_session(cls):
+        """共享浏览器的生命周期范围。
+
+        范围内各适配器通过 get_shared() 复用已启动的浏览器（保持热备），
+        cleanup() 只关闭各自的标签页；release_pooled() 归还的浏览器保留在池中
+        供同配置的下一次 acquire_pooled() 使用。退出范围时统一关闭所有浏览器。
+
+        用法::
+
+            async with BrowserManager.shared_session():
+                await manager.run_all()
+        """
+        cls._pooling = True
+        try:
+            yield cls
+        finally:
+            cls._pooling = False
+            await cls.close_shared()
+
+    async def new_tab(self, url: str = "about:blank") -> Any:
+        """新开一个隔离的标签页（nodriver/Patchright 使用独立的浏览器上下文）。
+
+        Args:
+            url: 初始 URL
+
+        Returns:
+            对应引擎的标签页/页面对象
+        """
+        if self.engine == "nodriver":
+            try:
+                return await self._nodriver_browser.create_context(url, new_window=False)
+            except Exception as e:
+                logger.debug(f"nodriver create_context 失败，回退到新标签页: {e}")
+                return await self._nodriver_browser.get(url, new_tab=True)
+        if self.engine == "drissionpage":
+            return self._drission_page.new_tab(url)
+        if self.engine == "camoufox":
+            return await self._browser.new_page()
+        context = await self._browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            user_agent=(
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36"
+            ),
+            locale="zh-CN",
+            timezone_id="Asia/Shanghai",
+        )
+        return await context.new_page()
+
+    async def close_tab(self, tab: Any) -> None:
+        """关闭 new_tab() 打开的标签页（不关闭浏览器）"""
+        if tab is None:
+            return
+        with contextlib.suppress(Exception):
+            if self.engine == "drissionpage":
+                tab.close()
+            elif self.engine in ("nodriver", "camoufox"):
+                await tab.close()
+            else:
+                context = tab.context
+                await tab.close()
+                await context.close()
+
     async def start(self, max_retries: int = 3):
         """启动浏览器
 
@@ -1090,8 +1409,25 @@ class BrowserManager:
             return self._browser
         return self._context
 
-    async def get_cookies(self) -> list:
-        """获取所有 Cookie"""
+    async def get_cookies(self, tab: Any = None, urls: list[str] | None = None) -> list:
+        """获取所有 Cookie
+
+        Args:
+            tab: 可选的标签页对象（new_tab() 返回），用于读取其所在上下文的 Cookie
+            urls: 可选的 URL 列表，指定时只返回这些 URL 可见的 Cookie
+                （在浏览器端过滤，仅对 tab 路径的 nodriver/Patchright 生效）
+        """
+        if tab is not None:
+            if self.engine == "nodriver":
+                import nodriver.cdp.network as cdp_network
+                if urls:
+                    return await tab.send(cdp_network.get_cookies(urls=urls))
+                return await tab.send(cdp_network.get_all_cookies())
+            if self.engine == "drissionpage":
+                return tab.cookies()
+            if urls:
+                return await tab.context.cookies(urls)
+            return await tab.context.cookies()
         if self.engine == "nodriver":
             # nodriver 使用 CDP 获取 cookies
             cookies = await self._nodriver_browser.cookies.get_all()
@@ -1102,17 +1438,20 @@ class BrowserManager:
             return await self._browser.cookies()
         return await self._context.cookies()
 
-    async def get_cookie(self, name: str, domain: str) -> str | None:
+    async def get_cookie(self, name: str, domain: str, tab: Any = None, url: str | None = None) -> str | None:
         """获取指定 Cookie 的值。
 
         Args:
             name: Cookie 名称
             domain: Cookie 域名
+            tab: 可选的标签页对象（new_tab() 返回）
+            url: 可选的站点 URL，指定时只从浏览器取该站点的 Cookie，
+                避免把 LinuxDO/Cloudflare 等其他域名的 Cookie 全部传回再筛选
 
         Returns:
             Cookie 值，未找到返回 None
         """
-        cookies = await self.get_cookies()
+        cookies = await self.get_cookies(tab=tab, urls=[url] if url else None)
         for cookie in cookies:
             if self.engine == "nodriver":
                 # nodriver 返回的是 Cookie 对象
@@ -1132,6 +1471,32 @@ class BrowserManager:
                 return cookie_value
         return None
 
+    async def has_cf_clearance(self, url: str, tab: Any = None) -> bool:
+        """url 可见的 Cookie 中是否已有 cf_clearance（Cloudflare 已放行的证据）。
+
+        Args:
+            url: 站点 URL，非 http(s) 地址直接返回 False
+            tab: 可选的标签页对象，指定时只读取其所在上下文的 Cookie
+
+        Returns:
+            是否持有 cf_clearance，读取失败按未持有处理
+        """
+        if not url.startswith("http"):
+            return False
+        try:
+            cookies = await self.get_cookies(tab=tab, urls=[url])
+        except Exception as e:
+            logger.debug(f"读取 cf_clearance 失败: {e}")
+            return False
+        for cookie in cookies or []:
+            if isinstance(cookie, dict):
+                name, value = cookie.get("name"), cookie.get("value")
+            else:
+                name, value = getattr(cookie, "name", None), getattr(cookie, "value", None)
+            if name == "cf_clearance" and value:
+                return True
+        return False
+
     async def wait_for_cloudflare(self, timeout: int = 30, tab: Any = None):
         """等待 Cloudflare 验证完成。
 
@@ -1141,8 +1506,8 @@ class BrowserManager:
         """
         logger.info("等待 Cloudflare 验证...")
 
-        # 如果传入了 tab 参数，使用它；否则使用默认的 _nodriver_tab
-        current_tab = tab if tab is not None else self._nodriver_tab
+        # 如果传入了 tab 参数，使用它；否则使用默认页面
+        current_tab = tab if tab is not None else self.page
 
         start_time = asyncio.get_event_loop().time()
 
@@ -1155,11 +1520,11 @@ class BrowserManager:
                     page_title = current_tab.target.title or ""
                     title = page_title
                 elif self.engine == "drissionpage":
-                    title = self._drission_page.title
-                    content = self._drission_page.html
+                    title = current_tab.title
+                    content = current_tab.html
                 else:
-                    title = await self._page.title()
-                    content = await self._page.content()
+                    title = await current_tab.title()
+                    content = await current_tab.content()
 
                 # Cloudflare 验证页面的指示器（英文和中文）
                 cf_indicators = [
@@ -1203,7 +1568,7 @@ class BrowserManager:
 
                 # DrissionPage: 尝试点击 Turnstile 复选框
                 elif self.engine == "drissionpage":
-                    turnstile = self._drission_page.ele("@id=cf-turnstile", timeout=1)
+                    turnstile = current_tab.ele("@id=cf-turnstile", timeout=1)
                     if turnstile:
                         logger.info("检测到 Turnstile，尝试点击...")
                         turnstile.click()
@@ -1250,19 +1615,12 @@ class BrowserManager:
                 if self._drission_page:
                     self._drission_page.quit()
         elif self.engine == "camoufox":
-            with contextlib.suppress(Exception):
-                if self._page:
-                    await self._page.close()
+            # 退出 Camoufox 会关闭浏览器及其全部页面，无需逐个关闭
             with contextlib.suppress(Exception):
                 if self._camoufox:
                     await self._camoufox.__aexit__(None, None, None)
         else:
-            with contextlib.suppress(Exception):
-                if self._page:
-                    await self._page.close()
-            with contextlib.suppress(Exception):
-                if self._context:
-                    await self._context.close()
+            # browser.close() 会一并关闭所有上下文和页面，逐个关闭只会多出几次 CDP 往返
             with contextlib.suppress(Exception):
                 if self._browser:
                     await self._browser.close()
@@ -193,6 +193,7 @@ NEWAPI_SITES = {
         "domain": "https://wzw.pp.ua",
         "cookie_domain": "wzw.pp.ua",
         "currency": "$",
+        "class_name": "WongAdapter",
     },
     "elysiver": {
         "name": "Elysiver",
@@ -217,6 +218,7 @@ NEWAPI_SITES = {
         "domain": "https://runanytime.hxi.me",
         "cookie_domain": "runanytime.hxi.me",
         "currency": "$",
+        "class_name": "RunAnytimeAdapter",
     },
     "neb": {
         "name": "NEB公益站",
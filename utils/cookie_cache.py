@@ -8,15 +8,29 @@ Cookie 过期时自动回退到 OAuth 重新获取并刷新缓存。
 
 缓存目录: .newapi_cookies/
 缓存格式: JSON 文件，每个 provider+account 一个文件
+
+ApiUserCache 单独保存各账号的 api_user（Cookie 失效后仍可复用）。
+LinuxDOSessionCache 另行缓存 LinuxDO 登录态（~/.cache/sign-in/linuxdo_cookies/），
+用于跳过 OAuth 前的 LinuxDO 表单登录。长期有效的账号凭据放在用户缓存目录，
+不写进仓库工作区，避免被误提交。
 """
 
+import hashlib
 import json
+import os
 import time
 from pathlib import Path
 
 from loguru import logger
 
 DEFAULT_CACHE_DIR = ".newapi_cookies"
+
+
+def user_cache_dir(name: str) -> Path:
+    """用户级缓存目录（$XDG_CACHE_HOME/sign-in/<name>，默认 ~/.cache/sign-in/<name>）"""
+    root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(root) / "sign-in" / name
+
 DEFAULT_EXPIRY_DAYS = 30  # 默认 30 天过期
 
 
@@ -184,3 +198,127 @@ class CookieCache:
                 path.unlink(missing_ok=True)
 
         return records
+
+
+DEFAULT_API_USER_FILE = "api_users.json"
+
+
+class ApiUserCache:
+    """NewAPI 用户 ID（api_user）缓存
+
+    api_user 是账号在站点上的固定 ID，不随 session 过期而变化，
+    因此与 CookieCache 分开保存（Cookie 失效被清除后仍可复用），
+    浏览器 OAuth 登录后可直接使用，省去 localStorage / /api/user/self 探测。
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.path = Path(cache_dir) / DEFAULT_API_USER_FILE
+        self.path.parent.mkdir(exist_ok=True)
+
+    @staticmethod
+    def _key(provider: str, username: str) -> str:
+        return f"{provider}:{username}"
+
+    def _load(self) -> dict[str, str]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.debug(f"[ApiUserCache] 读取缓存失败: {e}")
+            return {}
+
+    def _dump(self, data: dict[str, str]) -> None:
+        try:
+            self.path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        except Exception as e:
+            logger.warning(f"[ApiUserCache] 保存缓存失败: {e}")
+
+    def get(self, provider: str, username: str) -> str | None:
+        """获取缓存的 api_user，不存在返回 None"""
+        value = self._load().get(self._key(provider, username))
+        return str(value) if value else None
+
+    def save(self, provider: str, username: str, api_user: str) -> None:
+        """保存 api_user（值未变化时不写盘）"""
+        data = self._load()
+        key = self._key(provider, username)
+        if data.get(key) == api_user:
+            return
+        data[key] = api_user
+        self._dump(data)
+        logger.debug(f"[ApiUserCache] 已缓存 api_user: {key} -> {api_user}")
+
+    def invalidate(self, provider: str, username: str) -> None:
+        """清除缓存（缓存的 api_user 签到失败时调用）"""
+        data = self._load()
+        if data.pop(self._key(provider, username), None) is not None:
+            self._dump(data)
+            logger.info(f"[ApiUserCache] api_user 缓存已清除: {provider}/{username}")
+
+
+# 可用 LINUXDO_SESSION_CACHE_DIR 覆盖
+DEFAULT_LINUXDO_CACHE_DIR = os.environ.get("LINUXDO_SESSION_CACHE_DIR") or str(user_cache_dir("linuxdo_cookies"))
+DEFAULT_LINUXDO_EXPIRY_DAYS = 14  # LinuxDO 会话通常可保持数周
+
+
+class LinuxDOSessionCache:
+    """LinuxDO 登录态 Cookie 缓存
+
+    登录成功后保存 linux.do 域下的全部 Cookie，下次启动浏览器时先注入，
+    命中已登录状态即可跳过 Cloudflare + 表单登录。文件权限为 0600。
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_LINUXDO_CACHE_DIR,
+        expiry_days: int = DEFAULT_LINUXDO_EXPIRY_DAYS,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.expiry_days = expiry_days
+        self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    def _get_cache_path(self, username: str) -> Path:
+        """获取缓存文件路径（用户名可能是邮箱，取哈希作为文件名）"""
+        key = hashlib.sha1(username.encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / f"linuxdo_{key}.json"
+
+    def get(self, username: str) -> list[dict] | None:
+        """获取缓存的 Cookie 列表，不存在或过期时返回 None"""
+        path = self._get_cache_path(username)
+        if not path.exists():
+            return None
+
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            age_days = (time.time() - float(data.get("cached_at", 0))) / 86400
+            if age_days > self.expiry_days:
+                logger.info(f"[LinuxDOSessionCache] 缓存已过期({age_days:.1f}天)，已清除")
+                path.unlink(missing_ok=True)
+                return None
+
+            cookies = [c for c in data.get("cookies") or [] if c.get("name") and c.get("value")]
+            return cookies or None
+        except Exception as e:
+            logger.debug(f"[LinuxDOSessionCache] 读取缓存失败: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def save(self, username: str, cookies: list[dict]) -> None:
+        """保存 Cookie 列表（每项包含 name/value/domain/path/secure/http_only/expires）"""
+        path = self._get_cache_path(username)
+        data = {"cached_at": time.time(), "cookies": cookies}
+        try:
+            path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.chmod(path, 0o600)
+            logger.debug(f"[LinuxDOSessionCache] 已缓存 {len(cookies)} 个 LinuxDO Cookie")
+        except Exception as e:
+            logger.warning(f"[LinuxDOSessionCache] 保存缓存失败: {e}")
+
+    def invalidate(self, username: str) -> None:
+        """清除缓存（注入后仍未登录时调用）"""
+        path = self._get_cache_path(username)
+        if path.exists():
+            path.unlink(missing_ok=True)
+            logger.info("[LinuxDOSessionCache] LinuxDO Cookie 已失效，缓存已清除")
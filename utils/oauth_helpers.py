@@ -9,6 +9,7 @@ import asyncio
 import functools
 import inspect
 import os
+import re
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -527,6 +528,10 @@ def is_oauth_complete_url(url: str, target_domain: str) -> bool:
     return classify_oauth_url(url, target_domain) == OAuthURLType.OAUTH_COMPLETE
 
 
+# OAuth 相关关键词，一次正则扫描代替逐个关键词查找
+_OAUTH_URL_RE = re.compile(r"linux\.do|oauth|authorize|callback", re.IGNORECASE)
+
+
 def is_oauth_related_url(url: str) -> bool:
     """检查 URL 是否与 OAuth 流程相关。
     
@@ -541,11 +546,8 @@ def is_oauth_related_url(url: str) -> bool:
     if not url or not isinstance(url, str):
         return False
     
-    url_lower = url.lower()
-    
     # 检查是否包含 OAuth 相关关键词
-    oauth_keywords = ["linux.do", "oauth", "authorize", "callback"]
-    return any(keyword in url_lower for keyword in oauth_keywords)
+    return _OAUTH_URL_RE.search(url) is not None
 
 
 # ============================================================================
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+页面驱动抽象
+
+为不同浏览器引擎的页面对象提供统一的最小操作接口，
+使 LinuxDO OAuth 登录流程只需要维护一份实现。
+
+- DrissionPageDriver: 包装 DrissionPage 的 ChromiumPage/ChromiumTab（同步 API，放到工作线程执行）
+- PlaywrightPageDriver: 包装 Patchright/Playwright/Camoufox 的 Page（异步 API）
+"""
+
+import asyncio
+from typing import Any, Callable, Protocol
+
+from loguru import logger
+
+from utils.browser import wait_until
+
+
+class PageDriver(Protocol):
+    """LinuxDO OAuth 登录流程所需的页面操作接口"""
+
+    page: Any
+
+    async def goto(self, url: str) -> None:
+        """导航到指定 URL"""
+        ...
+
+    async def query(self, selector: str, timeout: float = 0) -> Any | None:
+        """按 CSS 选择器查找元素，timeout 秒内未找到返回 None"""
+        ...
+
+    async def find_text(self, text: str, timeout: float = 0) -> Any | None:
+        """查找文本包含 text 的按钮，timeout 秒内未找到返回 None"""
+        ...
+
+    async def click(self, element: Any) -> None:
+        """点击元素"""
+        ...
+
+    async def is_checked(self, element: Any) -> bool:
+        """复选框是否已勾选"""
+        ...
+
+    async def fill(self, selector: str, text: str) -> None:
+        """填写输入框"""
+        ...
+
+    async def url(self) -> str:
+        """当前页面 URL"""
+        ...
+
+    async def wait_loaded(self, timeout: float = 10) -> None:
+        """等待页面 DOM 加载完成"""
+        ...
+
+    async def wait_for_url(self, predicate: Callable[[str], bool], timeout: float = 15) -> bool:
+        """等待 URL 满足条件，返回是否在超时前满足"""
+        ...
+
+
+class DrissionPageDriver:
+    """DrissionPage 页面驱动
+
+    DrissionPage 的调用是同步阻塞的（查找元素时会在内部等待），
+    统一通过 asyncio.to_thread 执行，避免阻塞事件循环中的其他账号。
+    """
+
+    def __init__(self, page: Any):
+        self.page = page
+
+    async def goto(self, url: str) -> None:
+        await asyncio.to_thread(self.page.get, url)
+
+    async def query(self, selector: str, timeout: float = 0) -> Any | None:
+        try:
+            return await asyncio.to_thread(self.page.ele, f"css:{selector}", timeout=timeout) or None
+        except Exception as e:
+            logger.debug(f"DrissionPage 查找元素失败 ({selector}): {e}")
+            return None
+
+    async def find_text(self, text: str, timeout: float = 0) -> Any | None:
+        try:
+            return await asyncio.to_thread(self.page.ele, f"tag:button@@text():{text}", timeout=timeout) or None
+        except Exception as e:
+            logger.debug(f"DrissionPage 查找按钮失败 ({text}): {e}")
+            return None
+
+    async def click(self, element: Any) -> None:
+        await asyncio.to_thread(element.click)
+
+    async def is_checked(self, element: Any) -> bool:
+        return bool(await asyncio.to_thread(lambda: element.states.is_checked))
+
+    async def fill(self, selector: str, text: str) -> None:
+        await asyncio.to_thread(lambda: self.page.ele(f"css:{selector}").input(text))
+
+    async def url(self) -> str:
+        # page.url 是同步的 CDP 调用，同样放到线程中执行
+        return await asyncio.to_thread(lambda: self.page.url or "")
+
+    async def wait_loaded(self, timeout: float = 10) -> None:
+        try:
+            await asyncio.to_thread(self.page.wait.doc_loaded, timeout=timeout)
+        except Exception as e:
+            logger.debug(f"DrissionPage 等待页面加载失败: {e}")
+
+    async def wait_for_url(self, predicate: Callable[[str], bool], timeout: float = 15) -> bool:
+        async def matched() -> bool:
+            return predicate(await self.url())
+
+        return await wait_until(matched, timeout=timeout)
+
+
+class PlaywrightPageDriver:
+    """Patchright/Playwright 页面驱动"""
+
+    def __init__(self, page: Any):
+        self.page = page
+
+    async def goto(self, url: str) -> None:
+        # 不等 networkidle：站点的长轮询/WebSocket 会让它拖到超时，
+        # 后续步骤本身就按需等待具体元素和 URL
+        await self.page.goto(url, wait_until="domcontentloaded", timeout=30000)
+
+    async def query(self, selector: str, timeout: float = 0) -> Any | None:
+        try:
+            if not timeout:
+                return await self.page.query_selector(selector)
+            return await self.page.wait_for_selector(selector, state="attached", timeout=timeout * 1000)
+        except Exception as e:
+            logger.debug(f"Playwright 查找元素失败 ({selector}): {e}")
+            return None
+
+    async def find_text(self, text: str, timeout: float = 0) -> Any | None:
+        return await self.query(f'button:has-text("{text}")', timeout=timeout)
+
+    async def click(self, element: Any) -> None:
+        await element.click()
+
+    async def is_checked(self, element: Any) -> bool:
+        return await element.is_checked()
+
+    async def fill(self, selector: str, text: str) -> None:
+        await self.page.fill(selector, text)
+
+    async def url(self) -> str:
+        return self.page.url or ""
+
+    async def wait_loaded(self, timeout: float = 10) -> None:
+        try:
+            await self.page.wait_for_load_state("domcontentloaded", timeout=timeout * 1000)
+        except Exception as e:
+            logger.debug(f"Playwright 等待页面加载失败: {e}")
+
+    async def wait_for_url(self, predicate: Callable[[str], bool], timeout: float = 15) -> bool:
+        try:
+            await self.page.wait_for_url(predicate, timeout=timeout * 1000)
+            return True
+        except Exception:
+            return False